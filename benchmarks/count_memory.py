@@ -0,0 +1,114 @@
+"""
+Memory benchmark for counting entities.
+
+Compares peak Python memory of counting borrows by materializing rows
+(len of find_all) against SELECT count(*) (count_all) as table grows.
+
+Requires running PostgreSQL configured as for tests, usage:
+
+    python benchmarks/count_memory.py --sizes 1000 10000 100000
+"""
+import argparse
+import asyncio
+import os
+import tracemalloc
+from datetime import date
+from typing import Awaitable, Callable, List
+
+os.environ.setdefault("ROBUST_LIBRARY_API_DB_BASE", "robust_library_api_bench")
+
+from sqlalchemy import insert  # noqa: E402
+
+from robust_library_api.db.database import Database  # noqa: E402
+from robust_library_api.db.meta import meta  # noqa: E402
+from robust_library_api.db.models import load_all_models  # noqa: E402
+from robust_library_api.db.models.author import AuthorModel  # noqa: E402
+from robust_library_api.db.models.book import BookModel  # noqa: E402
+from robust_library_api.db.models.borrow import BorrowModel  # noqa: E402
+from robust_library_api.db.repositories.borrow import BorrowRepository  # noqa: E402
+from robust_library_api.db.utils import create_database, drop_database  # noqa: E402
+from robust_library_api.settings import settings  # noqa: E402
+
+SEED_CHUNK_SIZE = 5000
+
+
+async def _seed_borrows(database: Database, amount: int) -> None:
+    """Grows borrow table up to provided amount of rows."""
+    async with database.get_session() as session:
+        for offset in range(0, amount, SEED_CHUNK_SIZE):
+            chunk_size = min(SEED_CHUNK_SIZE, amount - offset)
+            await session.execute(
+                insert(BorrowModel),
+                [
+                    {
+                        "book_id": 1,
+                        "reader_name": f"reader_{offset + i}",
+                        "date_of_issue": date.today(),
+                    }
+                    for i in range(chunk_size)
+                ],
+            )
+
+
+async def _peak_memory(call: Callable[[], Awaitable[int]]) -> tuple[int, int]:
+    """Runs call under tracemalloc, returns call result and peak memory."""
+    tracemalloc.start()
+    try:
+        result = await call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+async def _materialized_count(repository: BorrowRepository) -> int:
+    return len(await repository.find_all())
+
+
+async def main(sizes: List[int]) -> None:
+    """Runs benchmark for every table size."""
+    load_all_models()
+    await create_database()
+    database = Database(url=str(settings.db_url))
+    try:
+        async with database._async_engine.begin() as connection:
+            await connection.run_sync(meta.create_all)
+        async with database.get_session() as session:
+            await session.execute(
+                insert(AuthorModel).values(
+                    id=1, name="Bench", surname="Author", birth_date=date.today(),
+                ),
+            )
+            await session.execute(
+                insert(BookModel).values(
+                    id=1, title="Bench", description="", author_id=1,
+                    remaining_amount=1,
+                ),
+            )
+
+        repository = BorrowRepository(database)
+        print(f"{'rows':>10} {'count(*) peak':>16} {'len(rows) peak':>16}")  # noqa: T201
+        seeded = 0
+        for size in sorted(sizes):
+            await _seed_borrows(database, size - seeded)
+            seeded = size
+            count, count_peak = await _peak_memory(repository.count_all)
+            rows, rows_peak = await _peak_memory(
+                lambda: _materialized_count(repository),
+            )
+            assert count == rows == size  # noqa: S101
+            print(  # noqa: T201
+                f"{size:>10} {count_peak / 1024:>13.1f}KiB "
+                f"{rows_peak / 1024:>13.1f}KiB",
+            )
+    finally:
+        await database._async_engine.dispose()
+        await drop_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000],
+    )
+    asyncio.run(main(parser.parse_args().sizes))
@@ -0,0 +1,138 @@
+"""
+Read path benchmark for list pages.
+
+Compares rows per second and peak Python memory per row of reading a page
+of borrows as ORM entities against reading it as Core rows (as list and
+detail endpoints do), both including validation and encoding of the response.
+
+Requires running PostgreSQL configured as for tests, usage:
+
+    python benchmarks/read_rows.py --sizes 100 1000 10000
+"""
+import argparse
+import asyncio
+import os
+import time
+import tracemalloc
+from datetime import date
+from typing import List, Optional
+
+os.environ.setdefault("ROBUST_LIBRARY_API_DB_BASE", "robust_library_api_bench")
+
+from sqlalchemy import insert  # noqa: E402
+
+from robust_library_api.db.database import Database  # noqa: E402
+from robust_library_api.db.meta import meta  # noqa: E402
+from robust_library_api.db.models import load_all_models  # noqa: E402
+from robust_library_api.db.models.author import AuthorModel  # noqa: E402
+from robust_library_api.db.models.book import BookModel  # noqa: E402
+from robust_library_api.db.models.borrow import BorrowModel  # noqa: E402
+from robust_library_api.db.repositories.borrow import BorrowRepository  # noqa: E402
+from robust_library_api.db.utils import create_database, drop_database  # noqa: E402
+from robust_library_api.settings import settings  # noqa: E402
+from robust_library_api.web.api.borrows.schema import ResponseBorrowList  # noqa: E402
+from robust_library_api.web.api.utils import encode_response  # noqa: E402
+
+SEED_CHUNK_SIZE = 5000
+MIN_ROWS_PER_RUN = 20_000
+
+
+async def _seed_borrows(database: Database, amount: int) -> None:
+    """Grows borrow table up to provided amount of rows."""
+    async with database.get_session() as session:
+        for offset in range(0, amount, SEED_CHUNK_SIZE):
+            chunk_size = min(SEED_CHUNK_SIZE, amount - offset)
+            await session.execute(
+                insert(BorrowModel),
+                [
+                    {
+                        "book_id": 1,
+                        "reader_name": f"reader_{offset + i}",
+                        "date_of_issue": date.today(),
+                    }
+                    for i in range(chunk_size)
+                ],
+            )
+
+
+async def _read_page(
+    repository: BorrowRepository, size: int, columns: Optional[List[str]],
+) -> bytes:
+    """Reads and encodes a page of borrows."""
+    borrows = await repository.borrows_page(after_id=None, limit=size, columns=columns)
+    return encode_response(ResponseBorrowList(message="", data=borrows))
+
+
+async def _rows_per_second(
+    repository: BorrowRepository, size: int, columns: Optional[List[str]],
+) -> float:
+    """Best of three runs of reading pages, in rows per second."""
+    runs = max(1, MIN_ROWS_PER_RUN // size)
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(runs):
+            await _read_page(repository, size, columns)
+        best = min(best, (time.perf_counter() - started) / runs)
+    return size / best
+
+
+async def _peak_memory_per_row(
+    repository: BorrowRepository, size: int, columns: Optional[List[str]],
+) -> float:
+    """Peak memory of reading rows of a page (without encoding), per row."""
+    tracemalloc.start()
+    try:
+        await repository.borrows_page(after_id=None, limit=size, columns=columns)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak / size
+
+
+async def main(sizes: List[int]) -> None:
+    """Runs benchmark for every page size."""
+    load_all_models()
+    await create_database()
+    database = Database(url=str(settings.db_url))
+    try:
+        async with database._async_engine.begin() as connection:
+            await connection.run_sync(meta.create_all)
+        async with database.get_session() as session:
+            await session.execute(
+                insert(AuthorModel).values(
+                    id=1, name="Bench", surname="Author", birth_date=date.today(),
+                ),
+            )
+            await session.execute(
+                insert(BookModel).values(
+                    id=1, title="Bench", description="", author_id=1,
+                    remaining_amount=1,
+                ),
+            )
+        await _seed_borrows(database, max(sizes))
+
+        repository = BorrowRepository(database)
+        modes = {"entities": None, "rows": repository.column_names}
+        print(  # noqa: T201
+            f"{'rows':>10}"
+            + "".join(f"{mode + ' rows/s':>18}{mode + ' peak':>18}" for mode in modes),
+        )
+        for size in sorted(sizes):
+            bodies = {await _read_page(repository, size, columns) for columns in modes.values()}
+            assert len(bodies) == 1  # noqa: S101
+            line = f"{size:>10}"
+            for columns in modes.values():
+                rows_per_second = await _rows_per_second(repository, size, columns)
+                peak = await _peak_memory_per_row(repository, size, columns)
+                line += f"{rows_per_second:>18.0f}{peak:>16.0f}B"
+            print(line)  # noqa: T201
+    finally:
+        await database._async_engine.dispose()
+        await drop_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1_000, 10_000])
+    asyncio.run(main(parser.parse_args().sizes))
@@ -0,0 +1,110 @@
+"""
+Serialization benchmark for list responses.
+
+Compares per-entity cost of encoding a page of books the way it was done
+before typed schemas (entities copied to dicts, untyped response encoded
+with jsonable_encoder and ujson, or validated again against response_model
+as FastAPI does for returned models) against typed schemas validated once
+and encoded with orjson.
+
+Runs in memory on transient entities, no database is required, usage:
+
+    python benchmarks/serialization.py --sizes 1 1000 100000
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import time
+from typing import Callable, List
+
+import ujson
+from fastapi.encoders import jsonable_encoder
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from robust_library_api.db.models import load_all_models
+from robust_library_api.db.models.book import BookModel
+from robust_library_api.services.utils import model_row_to_dict
+from robust_library_api.web.api.books.schema import ResponseBookList
+from robust_library_api.web.api.schema import StandardSuccessPageResponse
+from robust_library_api.web.api.utils import encode_response
+
+MIN_ENTITIES_PER_RUN = 100_000
+
+
+def _books(amount: int) -> List[BookModel]:
+    """Builds transient books as loaded by repositories."""
+    return [
+        BookModel(
+            id=i, title=f"Title {i}", description="Description", author_id=1,
+            remaining_amount=3, isbn=None, version=1,
+        )
+        for i in range(amount)
+    ]
+
+
+def _untyped_response(books: List[BookModel]) -> StandardSuccessPageResponse:
+    return StandardSuccessPageResponse(
+        message="Books fetched successfully.",
+        data=[model_row_to_dict(book) for book in books],
+    )
+
+
+def untyped_encoded(books: List[BookModel]) -> bytes:
+    """Dict rows, encoded with jsonable_encoder and ujson."""
+    return ujson.dumps(jsonable_encoder(_untyped_response(books))).encode()
+
+
+_response_field = create_response_field(name="response", type_=StandardSuccessPageResponse)
+
+
+async def untyped_revalidated(books: List[BookModel]) -> bytes:
+    """Dict rows, validated again against response_model by FastAPI."""
+    content = await serialize_response(
+        field=_response_field, response_content=_untyped_response(books)
+    )
+    return ujson.dumps(content).encode()
+
+
+def typed(books: List[BookModel]) -> bytes:
+    """Typed schemas validated once, encoded with orjson."""
+    return encode_response(
+        ResponseBookList(message="Books fetched successfully.", data=books)
+    )
+
+
+async def _encode(encode: Callable, books: List[BookModel]) -> bytes:
+    body = encode(books)
+    return await body if inspect.isawaitable(body) else body
+
+
+async def _per_entity_us(encode: Callable, books: List[BookModel]) -> float:
+    """Best of three runs of encoding books, in microseconds per entity."""
+    runs = max(1, MIN_ENTITIES_PER_RUN // len(books))
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(runs):
+            await _encode(encode, books)
+        best = min(best, (time.perf_counter() - started) / runs)
+    return best / len(books) * 1e6
+
+
+async def main(sizes: List[int]) -> None:
+    """Runs benchmark for every page size."""
+    load_all_models()
+    encoders = [untyped_encoded, untyped_revalidated, typed]
+    print(f"{'rows':>10}" + "".join(f"{encode.__name__:>22}" for encode in encoders))  # noqa: T201
+    for size in sorted(sizes):
+        books = _books(size)
+        bodies = [json.loads(await _encode(encode, books)) for encode in encoders]
+        assert all(body == bodies[0] for body in bodies)  # noqa: S101
+        timings = [await _per_entity_us(encode, books) for encode in encoders]
+        print(f"{size:>10}" + "".join(f"{timing:>17.2f}us/row" for timing in timings))  # noqa: T201
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 1_000, 100_000])
+    asyncio.run(main(parser.parse_args().sizes))
@@ -47,6 +47,14 @@ def _init_container() -> Container:
         Database, scope=Scope.singleton,
         factory=lambda: Database(
             url=str(settings.db_url),
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
+            echo=settings.db_echo,
+            replica_urls=settings.db_replica_urls,
+            read_your_writes_window=settings.db_read_your_writes_seconds,
         ))
 
     container.register(AuthorRepository)
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, Optional, Sequence, Tuple
+
+from robust_library_api.settings import settings
+
+MISSING = object()
+
+
+class LRUCache:
+    """
+    Bounded in-process LRU cache with TTL, e.g. of entity rows keyed by id.
+
+    None values (ids of missing entities) are cached with their own TTL.
+    Every invalidation bumps generation, values read before it
+    are not put into the cache afterwards.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Any:
+        """
+        Returns cached value (None for cached missing entity) or MISSING.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return MISSING
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Caches value read when cache was at provided generation.
+        Value is dropped if cache was invalidated since then.
+        """
+        if generation != self.generation:
+            return
+        ttl = self.ttl if value is not None else self.negative_ttl
+        if ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, keys: Iterable[Hashable]) -> None:
+        self.generation += 1
+        for key in keys:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+@lru_cache(maxsize=None)
+def entity_cache_for(model) -> Optional[LRUCache]:
+    """
+    Returns cache shared by all repositories of the model,
+    or None if caching is not enabled for its table in settings.
+    """
+    cache_settings = settings.entity_cache.get(model.__tablename__)
+    if cache_settings is None or cache_settings.max_size <= 0:
+        return None
+    return LRUCache(
+        max_size=cache_settings.max_size,
+        ttl=cache_settings.ttl,
+        negative_ttl=cache_settings.negative_ttl,
+    )
+
+
+class TableVersions:
+    """
+    Per-process write counters of tables.
+    Anything built from tables stays valid while their versions are the same.
+    """
+
+    def __init__(self) -> None:
+        self._versions: Dict[str, int] = {}
+
+    def get(self, tables: Sequence[str]) -> Tuple[int, ...]:
+        return tuple(self._versions.get(table, 0) for table in tables)
+
+    def bump(self, table: str) -> None:
+        self._versions[table] = self._versions.get(table, 0) + 1
+
+
+table_versions = TableVersions()
@@ -1,17 +1,36 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Type, TypeVar, List, Optional, Any, Dict, Generic
-from sqlalchemy import select as sql_select, update as sql_update, delete as sql_delete, Select
+from typing import Type, TypeVar, List, Optional, Any, AsyncIterator, Dict, Generic, Iterable, Sequence
+from sqlalchemy import select as sql_select, insert as sql_insert, update as sql_update, delete as sql_delete, inspect, or_, Select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.sql import Executable
 from sqlalchemy.exc import SQLAlchemyError, IntegrityError
 
 from robust_library_api.db.database import Database
+from .cache import LRUCache, entity_cache_for, table_versions
 from .exc import (
     CommonRepositoryError,
-    ForeignKeyViolation
+    ForeignKeyViolation,
+    UniqueConstraintViolationError
 )
 
 T = TypeVar("T")
 
+FOREIGN_KEY_VIOLATION_SQLSTATE = "23503"
+UNIQUE_VIOLATION_SQLSTATE = "23505"
+
+
+def _integrity_error(e: IntegrityError) -> CommonRepositoryError:
+    """
+    Maps integrity error to repository error by its SQLSTATE.
+    """
+    sqlstate = getattr(e.orig, "sqlstate", None)
+    if sqlstate == FOREIGN_KEY_VIOLATION_SQLSTATE:
+        return ForeignKeyViolation(str(e.orig))
+    if sqlstate == UNIQUE_VIOLATION_SQLSTATE:
+        return UniqueConstraintViolationError(str(e.orig))
+    return CommonRepositoryError(f"Integrity constraint violated: {e.orig}")
+
 
 class AbstractCRUDRepository(ABC, Generic[T]):
     @abstractmethod
@@ -22,37 +41,112 @@ class AbstractCRUDRepository(ABC, Generic[T]):
         :param entity: Optional instance of the model to create.
         :param kwargs: Additional fields to create a new instance if entity is not provided.
         :return: The created instance of the entity.
+        :raises ForeignKeyViolation: If a foreign key is violated.
         :raises UniqueConstraintViolationError: If a unique constraint is violated.
         :raises RepositoryError: If the creation fails due to other database issues.
         """
         pass
 
+    @abstractmethod
+    async def create_many(
+        self, rows: Sequence[Dict[str, Any]], chunk_size: int = 500
+    ) -> List[T]:
+        """
+        Creates entities from sequence of field mappings.
+
+        :param rows: Fields of entities to create, all rows must share the same keys.
+        :param chunk_size: Amount of rows inserted with single statement.
+        :return: Created entities in order of provided rows.
+        :raises ForeignKeyViolation: If any of rows violates a foreign key.
+        :raises RepositoryError: If the creation fails due to other database issues.
+        """
+        pass
+
+    @abstractmethod
+    async def upsert_many(
+        self, rows: Sequence[Dict[str, Any]], conflict_fields: Sequence[str],
+        chunk_size: int = 500, skip_unchanged: bool = True,
+        insert_only_fields: Sequence[str] = (),
+    ) -> List[T]:
+        """
+        Inserts entities or updates existing ones matched by conflict fields.
+
+        :param rows: Fields of entities to upsert, all rows must share the same keys.
+        :param conflict_fields: Fields of unique constraint identifying an entity.
+        :param chunk_size: Amount of rows upserted with single statement.
+        :param skip_unchanged: Do not rewrite (and return) rows equal to stored ones.
+        :param insert_only_fields: Fields set on insert only, existing entities keep theirs.
+        :return: Inserted and updated entities.
+        :raises ForeignKeyViolation: If any of rows violates a foreign key.
+        :raises RepositoryError: If the upsert fails due to other database issues.
+        """
+        pass
+
     @abstractmethod
     async def read(
         self, only_first=False, limit: Optional[int] = None, 
-        offset: Optional[int] = None, order_by=None, **filters: Any
+        offset: Optional[int] = None, order_by=None,
+        columns: Optional[Sequence[str]] = None, **filters: Any
     ) -> List[T]:
         """
         Reads entities with an optional QueryBuilder for custom filtering.
         By default reads all entries, alter only_first flag to read only first entry.
 
+        :param columns: Optional names of columns to select, rows are returned
+            as Core named tuple rows of these columns instead of entities.
 
         :return: List of entities matching the conditions.
         :raises RepositoryError: If the read operation fails.
         """
         pass
 
+    @abstractmethod
+    def read_stream(
+        self, raw_query: Select = None, yield_per: int = 1000,
+        columns: Optional[Sequence[str]] = None, **filters: Any
+    ) -> AsyncIterator[List[T]]:
+        """
+        Streams entities from server-side cursor instead of loading all of them.
+
+        :param raw_query: Optional query to stream instead of filtered select.
+        :param yield_per: Amount of rows fetched from the cursor at once.
+        :param columns: Optional names of columns to select, rows are returned
+            as Core named tuple rows of these columns instead of entities.
+        :return: Async iterator over partitions of at most yield_per entities.
+        :raises RepositoryError: If the read operation fails.
+        """
+        pass
+
     @abstractmethod
     async def update(
-        self, fields: Dict[str, Any], **filters: Any
+        self, fields: Dict[str, Any], expected_version: Optional[int] = None,
+        **filters: Any
     ) -> int:
         """
         Updates entities based on conditions set in QueryBuilder and specified fields.
 
 
         :param fields: Fields to update in the matching entities.
-        :return: Number of rows affected by the update.
-        :raises ValueError: If no fields are provided for updating.
+        :param expected_version: Update only entities with this row version.
+        :return: Number of rows affected by the update
+            (matching rows, if no fields are provided).
+        :raises ForeignKeyViolation: If new fields violate a foreign key.
+        :raises RepositoryError: If the update operation fails.
+        """
+        pass
+
+    @abstractmethod
+    async def update_returning(
+        self, fields: Dict[str, Any], expected_version: Optional[int] = None,
+        **filters: Any
+    ) -> List[T]:
+        """
+        Updates entities like update does and returns them as persisted.
+
+        :param fields: Fields to update in the matching entities.
+        :param expected_version: Update only entities with this row version.
+        :return: Updated entities (matching ones unchanged, if no fields are provided).
+        :raises ForeignKeyViolation: If new fields violate a foreign key.
         :raises RepositoryError: If the update operation fails.
         """
         pass
@@ -86,22 +180,183 @@ class CRUDRepository(AbstractCRUDRepository[T]):
     database: Database
     model: Type[T]
 
+    @property
+    def cache(self) -> Optional[LRUCache]:
+        """
+        Entity cache of the model, None if it is disabled or current unit
+        of work has started its transaction: cache holds committed rows,
+        which may be older than writes of the transaction.
+        """
+        if self.database.in_transaction():
+            return None
+        return entity_cache_for(self.model)
+
+    @property
+    def column_names(self) -> List[str]:
+        """
+        Names of columns loaded with entities, deferred columns are left out.
+        """
+        return [
+            attribute.key
+            for attribute in inspect(self.model).column_attrs
+            if not attribute.deferred
+        ]
+
+    def _invalidate_cached(self, ids: Iterable[Any], model: Optional[Type] = None) -> None:
+        """
+        Drops written entities of the model (own model by default) from entity
+        cache and bumps version of its table. Called after every write, it also
+        pins reads of the client to the primary database (read-your-writes).
+        Inside unit of work it is done again once it ends, so anything read
+        from its uncommitted transaction does not outlive it in caches.
+        """
+        model = model if model is not None else self.model
+        cache = entity_cache_for(model)
+        ids = list(ids)
+
+        def invalidate() -> None:
+            table_versions.bump(model.__tablename__)
+            if cache is not None:
+                cache.invalidate(ids)
+
+        invalidate()
+        self.database.on_transaction_end(invalidate)
+        self.database.record_write()
+
+    def _version_bump(self) -> Dict[str, Any]:
+        """
+        Values incrementing row version of the model (if it is versioned)
+        for UPDATE statements which bypass ORM versioning.
+        """
+        version_column = inspect(self.model).version_id_col
+        if version_column is None:
+            return {}
+        return {version_column.key: version_column + 1}
+
     async def create(self, entity: Optional[T] = None, **kwargs: Any) -> T:
         try:
             instance = entity if entity else self.model(**kwargs)
             async with self.database.get_session() as session:
                 session.add(instance)
                 await session.flush([instance])
-                return instance
+        except IntegrityError as e:
+            raise _integrity_error(e) from e
         except SQLAlchemyError as e:
             raise CommonRepositoryError(f"Failed to create entity: {e}") from e
+        self._invalidate_cached([instance.id])
+        return instance
+
+    async def create_many(
+        self, rows: Sequence[Dict[str, Any]], chunk_size: int = 500
+    ) -> List[T]:
+        """
+        Creates entities in bulk.
+        Every chunk of rows is inserted with single multi-row INSERT ... RETURNING,
+        returned rows are sorted in order of the inserted ones.
+        """
+        if not rows:
+            return []
+        try:
+            created = []
+            query = sql_insert(self.model).returning(self.model, sort_by_parameter_order=True)
+            async with self.database.get_session() as session:
+                for offset in range(0, len(rows), chunk_size):
+                    chunk = rows[offset:offset + chunk_size]
+                    result = await session.scalars(query, chunk)
+                    created.extend(result.all())
+        except IntegrityError as e:
+            raise _integrity_error(e) from e
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to create entities: {e}") from e
+        self._invalidate_cached(entity.id for entity in created)
+        return created
+
+    def _upsert_query(
+        self, rows: Sequence[Dict[str, Any]], conflict_fields: Sequence[str],
+        skip_unchanged: bool, insert_only_fields: Sequence[str] = (),
+    ):
+        query = pg_insert(self.model).values(rows)
+        updated_fields = [
+            field for field in rows[0]
+            if field not in conflict_fields and field not in insert_only_fields
+        ]
+        if not updated_fields:
+            query = query.on_conflict_do_nothing(index_elements=conflict_fields)
+        else:
+            columns = self.model.__table__.c
+            query = query.on_conflict_do_update(
+                index_elements=conflict_fields,
+                set_={
+                    **{field: query.excluded[field] for field in updated_fields},
+                    **self._version_bump(),
+                },
+                where=or_(*(
+                    columns[field].is_distinct_from(query.excluded[field])
+                    for field in updated_fields
+                )) if skip_unchanged else None,
+            )
+        return (
+            query.returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+
+    async def upsert_many(
+        self, rows: Sequence[Dict[str, Any]], conflict_fields: Sequence[str],
+        chunk_size: int = 500, skip_unchanged: bool = True,
+        insert_only_fields: Sequence[str] = (),
+    ) -> List[T]:
+        """
+        Inserts entities or updates existing ones matched by conflict fields.
+        Every chunk is written with single INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+        With skip_unchanged, rows equal to stored ones are neither rewritten nor returned.
+        Insert only fields are neither updated nor compared.
+        """
+        if not rows:
+            return []
+        try:
+            upserted = []
+            async with self.database.get_session() as session:
+                for offset in range(0, len(rows), chunk_size):
+                    chunk = rows[offset:offset + chunk_size]
+                    query = self._upsert_query(
+                        chunk, conflict_fields, skip_unchanged, insert_only_fields
+                    )
+                    result = await session.scalars(query)
+                    upserted.extend(result.all())
+        except IntegrityError as e:
+            raise _integrity_error(e) from e
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to upsert entities: {e}") from e
+        self._invalidate_cached(entity.id for entity in upserted)
+        return upserted
+
+    async def upsert(
+        self, conflict_fields: Sequence[str], skip_unchanged: bool = False, **fields: Any
+    ) -> Optional[T]:
+        """
+        Inserts an entity or updates existing one matched by conflict fields.
+        """
+        upserted = await self.upsert_many(
+            [fields], conflict_fields, skip_unchanged=skip_unchanged
+        )
+        return upserted[0] if upserted else None
+
+    def _project(self, query: Select, columns: Sequence[str]) -> Select:
+        table_columns = self.model.__table__.c
+        return query.with_only_columns(*(table_columns[column] for column in columns))
 
     async def read(
         self, only_first=False, raw_query: Select = None, limit: Optional[int] = None, 
-        offset: Optional[int] = None, order_by=None, **filters: Any
+        offset: Optional[int] = None, order_by=None,
+        columns: Optional[Sequence[str]] = None, **filters: Any
     ) -> List[T]:
         """
         Reads entities with optional filters, pagination, and ordering.
+        With columns, only these columns are selected with Core statement
+        and rows are returned as named tuples (Row), skipping ORM entity
+        hydration, identity map and instance state bookkeeping.
+        Reads run in read-only session, outside of a transaction
+        unless the unit of work has already started one.
         """
         try:
             query = sql_select(self.model).filter_by(**filters)
@@ -115,7 +370,12 @@ class CRUDRepository(AbstractCRUDRepository[T]):
             if raw_query is not None:
                 query = raw_query
 
-            async with self.database.get_session() as session:
+            if columns is not None:
+                async with self.database.get_session(readonly=True) as session:
+                    result = await session.execute(self._project(query, columns))
+                    return result.first() if only_first else result.all()
+
+            async with self.database.get_session(readonly=True) as session:
                 result = await session.execute(query)
                 result_scalars = result.scalars()
                 return result_scalars.first() if only_first else result_scalars.all()
@@ -123,20 +383,118 @@ class CRUDRepository(AbstractCRUDRepository[T]):
         except SQLAlchemyError as e:
             raise CommonRepositoryError(f"Failed to read entities: {e}") from e
 
-    async def update(self, fields: Dict[str, Any], **filters: Any) -> int:
+    async def read_stream(
+        self, raw_query: Select = None, yield_per: int = 1000,
+        columns: Optional[Sequence[str]] = None, **filters: Any
+    ) -> AsyncIterator[List[T]]:
         """
-        Updates entities based on conditions provided in filters and fields to update.
+        Streams entities in partitions of yield_per rows using server-side cursor,
+        so only one partition is held in memory at a time.
+        With columns, partitions hold named tuple rows of these columns instead of entities.
+        Stream owns its read-only session: it is usually consumed after
+        the request unit of work is already closed.
+        """
+        query = raw_query if raw_query is not None else sql_select(self.model).filter_by(**filters)
+        try:
+            async with self.database.stream_session() as session:
+                if columns is not None:
+                    result = await session.stream(
+                        self._project(query, columns).execution_options(yield_per=yield_per)
+                    )
+                    async for partition in result.partitions():
+                        yield partition
+                    return
+                result = await session.stream_scalars(
+                    query.execution_options(yield_per=yield_per)
+                )
+                async for partition in result.partitions():
+                    yield partition
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to stream entities: {e}") from e
+
+    async def read_scalar(self, query: Executable) -> Any:
+        """
+        Executes a query returning single value (aggregates, existence checks).
+        No entities are loaded into session.
+        """
+        try:
+            async with self.database.get_session(readonly=True) as session:
+                return await session.scalar(query)
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to read scalar: {e}") from e
+
+    async def read_rows(self, query: Select) -> List[Dict[str, Any]]:
+        """
+        Executes a query selecting columns and computed expressions
+        (e.g. ranks), rows are returned as field mappings.
+        """
+        try:
+            async with self.database.get_session(readonly=True) as session:
+                result = await session.execute(query)
+                return [dict(row) for row in result.mappings()]
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to read rows: {e}") from e
+
+    async def execute_returning(self, query: Executable) -> List[Dict[str, Any]]:
+        """
+        Executes data modifying statement with RETURNING clause
+        (e.g. multi-table statements built with CTEs).
+        Returns returned rows as field mappings, no entities are loaded.
         """
-        if not fields:
-            raise ValueError("No fields provided to update")
         try:
             async with self.database.get_session() as session:
-                query = sql_update(self.model).values(**fields).filter_by(**filters)
                 result = await session.execute(query)
-                await session.commit()
-                return result.rowcount
+                return [dict(row) for row in result.mappings()]
+        except IntegrityError as e:
+            raise _integrity_error(e) from e
+        except SQLAlchemyError as e:
+            raise CommonRepositoryError(f"Failed to execute statement: {e}") from e
+
+    async def update(
+        self, fields: Dict[str, Any], expected_version: Optional[int] = None,
+        **filters: Any
+    ) -> int:
+        """
+        Updates entities based on conditions provided in filters and fields to update.
+        With expected_version, entities whose row version differs are left intact
+        (optimistic concurrency check within the same UPDATE statement).
+        """
+        return len(await self.update_returning(
+            fields=fields, expected_version=expected_version, **filters
+        ))
+
+    async def update_returning(
+        self, fields: Dict[str, Any], expected_version: Optional[int] = None,
+        **filters: Any
+    ) -> List[T]:
+        """
+        Updates entities with single UPDATE ... RETURNING statement,
+        so their new state is known without reading them back.
+        Without fields nothing is updated: matching entities are read
+        unchanged (no version bump), as PUT with empty body is a no-op.
+        """
+        try:
+            async with self.database.get_session() as session:
+                if fields:
+                    query = (
+                        sql_update(self.model).values(**fields, **self._version_bump())
+                        .filter_by(**filters)
+                        .returning(self.model)
+                        .execution_options(populate_existing=True)
+                    )
+                else:
+                    query = sql_select(self.model).filter_by(**filters)
+                if expected_version is not None:
+                    version_column = inspect(self.model).version_id_col
+                    query = query.where(version_column == expected_version)
+                updated = (await session.scalars(query)).all()
+        except IntegrityError as e:
+            raise _integrity_error(e) from e
         except SQLAlchemyError as e:
             raise CommonRepositoryError(f"Failed to update entities: {e}") from e
+        if fields:
+            self._invalidate_cached(entity.id for entity in updated)
+        return list(updated)
 
     async def delete(self, entity: Optional[T] = None, **filters: Any) -> int:
         """
@@ -146,28 +504,33 @@ class CRUDRepository(AbstractCRUDRepository[T]):
             async with self.database.get_session() as session:
                 if entity is not None:
                     await session.delete(entity)
-                    return 1
-                
-                query = sql_delete(self.model).filter_by(**filters)
-                result = await session.execute(query)
-                await session.commit()
-                return result.rowcount
+                    deleted_ids = [entity.id]
+                else:
+                    query = (
+                        sql_delete(self.model).filter_by(**filters)
+                        .returning(self.model.id)
+                    )
+                    deleted_ids = (await session.scalars(query)).all()
         except IntegrityError as e:
-            raise ForeignKeyViolation from e
+            raise _integrity_error(e) from e
         except SQLAlchemyError as e:
             raise CommonRepositoryError(f"Failed to delete entities: {e}") from e
+        self._invalidate_cached(deleted_ids)
+        return len(deleted_ids)
 
     async def save(self, entity: T) -> T:
         """
         Saves (inserts or updates) the provided entity in the database.
+        Server generated values are fetched by the INSERT/UPDATE itself
+        with RETURNING (see eager_defaults of the models), not by a SELECT.
         """
         try:
             async with self.database.get_session() as session:
                 session.add(entity)
-                await session.flush()
-                await session.refresh(entity)
-                return entity
+                await session.flush([entity])
         except IntegrityError as e:
-            raise ForeignKeyViolation from e
+            raise _integrity_error(e) from e
         except SQLAlchemyError as e:
-            raise CommonRepositoryError(f"Failed to save entity: {e}") from e
\ No newline at end of file
+            raise CommonRepositoryError(f"Failed to save entity: {e}") from e
+        self._invalidate_cached([entity.id])
+        return entity
\ No newline at end of file
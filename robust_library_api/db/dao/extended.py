@@ -1,39 +1,181 @@
-from typing import List, Optional, Any, Dict, TypeVar
-from sqlalchemy import asc, desc
+from typing import AsyncIterator, ClassVar, FrozenSet, Iterable, List, Optional, Any, Dict, Sequence, Set, TypeVar
+from sqlalchemy import Integer, Select, any_, asc, bindparam, desc, func, select as sql_select
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import make_transient_to_detached, selectinload
 from . import CRUDRepository
+from .cache import MISSING
+from .filters import Filter, Ordering, compile_filters, compile_seek
 
 T = TypeVar("T")
 
 class ExtendedCRUDRepository(CRUDRepository[T]):
+    # Columns clients may filter and sort by, should be backed by indexes.
+    # Sorting is allowed only by NOT NULL columns, so keyset seek stays exact.
+    filterable_columns: ClassVar[FrozenSet[str]] = frozenset()
+    sortable_columns: ClassVar[FrozenSet[str]] = frozenset({"id"})
+    # Relationships clients may embed into entities, each one is loaded
+    # with single additional SELECT ... WHERE id IN (...) per query.
+    includable_relationships: ClassVar[FrozenSet[str]] = frozenset()
+
+    def _loader_options(self, include: Sequence[str]) -> list:
+        """
+        Builds selectinload options for relationships to include.
+        Raises ValueError if relationship is not includable.
+        """
+        options = []
+        for relationship in include:
+            if relationship not in self.includable_relationships:
+                raise ValueError(f"Including {relationship!r} is not allowed")
+            options.append(selectinload(getattr(self.model, relationship)))
+        return options
+
     async def find_all(self, **filters) -> List[T]:
         """
         Retrieve all entities matching specified filters.
         """
         return await self.read(only_first=False, **filters)
 
-    async def find_by_id(self, item_id: int) -> Optional[T]:
+    async def find_by_id(
+        self, item_id: int, columns: Optional[Sequence[str]] = None,
+        include: Sequence[str] = (),
+    ) -> Optional[T]:
+        """
+        Retrieve an entity (or only its columns) by its ID.
+        Reads through entity cache of the model if it is enabled,
+        ids of missing entities are cached too. Cache misses are read
+        as rows of all columns, without ORM entity hydration.
+        Rows read from a replica are not cached, as they may be older
+        than writes already made on the primary.
+        Entity with included relationships is always read from the database
+        (columns are ignored), the cache holds only rows of the model.
+        """
+        if include:
+            query = sql_select(self.model).where(self.model.id == item_id).options(
+                *self._loader_options(include)
+            )
+            return await self.read(only_first=True, raw_query=query)
+        cache = self.cache
+        if cache is None:
+            return await self.find_one(columns=columns, id=item_id)
+
+        cached_row = cache.get(item_id)
+        if cached_row is MISSING:
+            generation = cache.generation
+            from_replica = self.database.reads_from_replica()
+            row = await self.find_one(columns=self.column_names, id=item_id)
+            cached_row = row._asdict() if row is not None else None
+            if not from_replica:
+                cache.put(item_id, cached_row, generation)
+        if cached_row is None:
+            return None
+        return self._from_cached_row(cached_row, columns)
+
+    async def find_by_ids(
+        self, ids: Sequence[int], columns: Optional[Sequence[str]] = None,
+        include: Sequence[str] = (),
+    ) -> List[T]:
+        """
+        Retrieve entities (or only their columns) by their IDs in order
+        of provided ids, missing entities are left out.
+        Entities not found in entity cache are read with single
+        SELECT ... WHERE id = ANY(:ids) query, whatever the amount of ids
+        (they are cached unless read from a replica).
+        Entities with included relationships are always read from the database
+        (columns are ignored then).
+        """
+        ids = list(dict.fromkeys(ids))
+        cache = self.cache if not include else None
+        found: Dict[int, Any] = {}
+        missed_ids = []
+        for item_id in ids:
+            cached_row = cache.get(item_id) if cache is not None else MISSING
+            if cached_row is MISSING:
+                missed_ids.append(item_id)
+            elif cached_row is not None:
+                found[item_id] = self._from_cached_row(cached_row, columns)
+        if missed_ids:
+            generation = cache.generation if cache is not None else None
+            from_replica = self.database.reads_from_replica()
+            query = sql_select(self.model).where(
+                self.model.id == any_(bindparam("ids", missed_ids, type_=ARRAY(Integer)))
+            ).options(*self._loader_options(include))
+            if cache is None:
+                rows = await self.read(raw_query=query, columns=None if include else columns)
+                found.update((row.id, row) for row in rows)
+            else:
+                rows = await self.read(raw_query=query, columns=self.column_names)
+                cached_rows = {row.id: row._asdict() for row in rows}
+                for item_id in missed_ids:
+                    cached_row = cached_rows.get(item_id)
+                    if not from_replica:
+                        cache.put(item_id, cached_row, generation)
+                    if cached_row is not None:
+                        found[item_id] = self._from_cached_row(cached_row, columns)
+        return [found[item_id] for item_id in ids if item_id in found]
+
+    async def find_version(self, item_id: int) -> Optional[int]:
+        """
+        Retrieve only row version of an entity by its ID
+        (None if entity does not exist), from entity cache if possible.
+        """
+        cache = self.cache
+        cached_row = cache.get(item_id) if cache is not None else MISSING
+        if cached_row is not MISSING:
+            return cached_row["version"] if cached_row is not None else None
+        query = sql_select(self.model.version).where(self.model.id == item_id)
+        return await self.read_scalar(query)
+
+    def _entity_from_row(self, row: Dict[str, Any]) -> T:
+        entity = self.model(**row)
+        make_transient_to_detached(entity)
+        return entity
+
+    def _from_cached_row(
+        self, row: Dict[str, Any], columns: Optional[Sequence[str]]
+    ) -> Any:
+        """
+        Builds result of a read from cached row: dict of columns
+        if columns are provided, detached entity otherwise.
+        """
+        if columns is not None:
+            return {column: row[column] for column in columns}
+        return self._entity_from_row(row)
+
+    async def find_existing_ids(self, ids: Iterable[int]) -> Set[int]:
         """
-        Retrieve an entity by its ID.
+        Retrieve which of provided ids belong to existing entities.
+        Checks all ids with single query.
         """
-        return await self.find_one(id=item_id)
+        ids = set(ids)
+        if not ids:
+            return set()
+        query = sql_select(self.model.id).where(self.model.id.in_(ids))
+        return set(await self.read(raw_query=query))
 
     async def count_all(self) -> int:
         """
         Count all entities in the model.
         """
-        entities = await self.find_all()
-        return len(entities)
+        return await self.count_by_filter()
 
     async def count_by_filter(self, **filters) -> int:
         """
         Count entities matching specific filters.
+        Counting is done with SELECT count(*), no rows are loaded.
         """
-        entities = await self.find_all(**filters)
-        return len(entities)
+        query = sql_select(func.count()).select_from(self.model).filter_by(**filters)
+        return await self.read_scalar(query)
 
-    async def find_and_count(self, **filters) -> dict:
-        values = await self.find_all(**filters)
-        return {"values": values, "count": len(values)}
+    async def find_and_count(
+        self, limit: Optional[int] = None, offset: Optional[int] = None, **filters
+    ) -> dict:
+        """
+        Retrieve entities (optionally limited) along with total count of
+        entities matching the filters.
+        """
+        values = await self.read(limit=limit, offset=offset, **filters)
+        count = await self.count_by_filter(**filters)
+        return {"values": values, "count": count}
 
     async def find_with_pagination(
         self, page: int = 1, per_page: int = 10, **filters
@@ -44,6 +186,87 @@ class ExtendedCRUDRepository(CRUDRepository[T]):
         offset = (page - 1) * per_page
         return await self.read(limit=per_page, offset=offset, **filters)
 
+    def _keyset_query(
+        self, after_id: Optional[int], conditions: Sequence[Filter],
+        ordering: Optional[Ordering], after_value: Any,
+        include: Sequence[str] = (), **filters
+    ) -> Select:
+        """
+        Builds SELECT of entities matching filters and conditions,
+        ordered by ordering column and id, starting right after
+        entity with after_id (and after_value of ordering column),
+        with included relationships loaded.
+        """
+        query = sql_select(self.model).filter_by(**filters).where(
+            *compile_filters(self.model, conditions, self.filterable_columns)
+        ).options(*self._loader_options(include))
+        ordering = ordering or Ordering("id")
+        if ordering.column not in self.sortable_columns:
+            raise ValueError(f"Sorting by {ordering.column!r} is not allowed")
+        column = getattr(self.model, ordering.column)
+        if after_id is not None and ordering.column == "id":
+            query = query.where(column < after_id if ordering.descending else column > after_id)
+        elif after_id is not None:
+            query = query.where(compile_seek(self.model, ordering, after_id, after_value))
+        query = query.order_by(desc(column) if ordering.descending else asc(column))
+        if ordering.column != "id":
+            query = query.order_by(self.model.id)
+        return query
+
+    async def find_with_keyset(
+        self, after_id: Optional[int] = None, limit: int = 10,
+        columns: Optional[Sequence[str]] = None,
+        conditions: Sequence[Filter] = (), ordering: Optional[Ordering] = None,
+        after_value: Any = None, include: Sequence[str] = (), **filters
+    ) -> List[T]:
+        """
+        Paginate results with keyset (seek) method:
+        WHERE id > :after_id ORDER BY id LIMIT :limit.
+        Unlike OFFSET pagination, cost does not grow with page depth.
+        With ordering by other column, page starts after (after_value, after_id)
+        in order of (column, id).
+        Included relationships are loaded for the whole page at once,
+        so page takes 1 + len(include) queries regardless of its size
+        (columns are ignored then, entities are returned).
+        """
+        query = self._keyset_query(
+            after_id, conditions, ordering, after_value, include, **filters
+        ).limit(limit)
+        return await self.read(raw_query=query, columns=None if include else columns)
+
+    def stream_all(
+        self, after_id: Optional[int] = None, yield_per: int = 1000,
+        columns: Optional[Sequence[str]] = None,
+        conditions: Sequence[Filter] = (), ordering: Optional[Ordering] = None,
+        after_value: Any = None, include: Sequence[str] = (), **filters
+    ) -> AsyncIterator[List[T]]:
+        """
+        Stream all entities matching filters ordered by id (or by ordering),
+        optionally starting right after provided id.
+        Included relationships are loaded once per partition.
+        """
+        query = self._keyset_query(
+            after_id, conditions, ordering, after_value, include, **filters
+        )
+        return self.read_stream(
+            raw_query=query, yield_per=yield_per, columns=None if include else columns
+        )
+
+    def hot_queries(self) -> List[Select]:
+        """
+        Statements of the most frequent reads: first and next list pages,
+        entity by id (as read on entity cache miss) and count.
+        SQL of a statement does not depend on its parameters, so executing
+        these prepares statements of actual requests.
+        """
+        columns = self.column_names
+        return [
+            self._project(self._keyset_query(None, (), None, None).limit(1), columns),
+            self._project(self._keyset_query(0, (), None, None).limit(1), columns),
+            self._project(sql_select(self.model).filter_by(id=0), columns),
+            sql_select(func.count()).select_from(self.model),
+        ]
+
     async def find_with_ordering(
         self, order_by: str, descending: bool = False, **filters
     ) -> List[T]:
@@ -55,15 +278,15 @@ class ExtendedCRUDRepository(CRUDRepository[T]):
             if descending
             else asc(getattr(self.model, order_by))
         )
-        print("chlen", order)
         return await self.read(order_by=order, **filters)
 
     async def exists(self, **filters) -> bool:
         """
         Check if any entity exists that matches the filters.
+        Uses SELECT EXISTS(...), matched entity is not loaded.
         """
-        entity = await self.find_one(**filters)
-        return entity is not None
+        query = sql_select(sql_select(self.model).filter_by(**filters).exists())
+        return await self.read_scalar(query)
 
     async def find_or_create(
         self, defaults: Optional[Dict[str, Any]] = None, **filters
@@ -74,11 +297,13 @@ class ExtendedCRUDRepository(CRUDRepository[T]):
         entity = await self.find_one(**filters)
         return entity if entity else await self.create(**{**defaults, **filters})
 
-    async def find_one(self, **filters) -> Optional[T]:
+    async def find_one(
+        self, columns: Optional[Sequence[str]] = None, **filters
+    ) -> Optional[T]:
         """
-        Retrieve a single entity matching the filters.
+        Retrieve a single entity (or only its columns) matching the filters.
         """
-        return await self.read(only_first=True, **filters)
+        return await self.read(only_first=True, columns=columns, **filters)
 
     async def update_by_filter(self, fields: Dict[str, Any], **filters) -> int:
         """
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Collection, Dict, List, Optional, Sequence
+
+from sqlalchemy import ColumnElement, and_, or_, true
+
+
+def _in_range(column, bounds) -> ColumnElement:
+    low, high = bounds
+    conditions = []
+    if low is not None:
+        conditions.append(column >= low)
+    if high is not None:
+        conditions.append(column <= high)
+    return and_(true(), *conditions)
+
+
+OPERATORS: Dict[str, Callable[[Any, Any], ColumnElement]] = {
+    "eq": lambda column, value: column == value,
+    "in": lambda column, values: column.in_(list(values)),
+    "lt": lambda column, value: column < value,
+    "gt": lambda column, value: column > value,
+    "range": _in_range,
+    "isnull": lambda column, value: column.is_(None) if value else column.is_not(None),
+    "prefix": lambda column, value: column.startswith(value, autoescape=True),
+}
+
+
+@dataclass(frozen=True)
+class Filter:
+    """
+    Single condition on a column, e.g. Filter("author_id", "in", [1, 2]).
+
+    Operators:
+    eq, lt, gt - comparison with value;
+    in - value is one of provided values;
+    range - value within inclusive (low, high) bounds, None bound is open;
+    isnull - column is NULL if value is true, NOT NULL otherwise;
+    prefix - string column starts with value (LIKE 'value%').
+    """
+
+    column: str
+    op: str
+    value: Any
+
+
+@dataclass(frozen=True)
+class Ordering:
+    """
+    Sort order by a column, ties are broken by id ascending.
+    Parsed from and formatted to "column" or "-column" (descending).
+    """
+
+    column: str
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, sort: str) -> "Ordering":
+        if sort.startswith("-"):
+            return cls(column=sort[1:], descending=True)
+        return cls(column=sort)
+
+    def __str__(self) -> str:
+        return f"-{self.column}" if self.descending else self.column
+
+
+def compile_filters(
+    model, filters: Sequence[Filter], allowed_columns: Collection[str]
+) -> List[ColumnElement]:
+    """
+    Compiles filters to SQL conditions on columns of the model.
+    Raises ValueError if column is not allowed or operator is unknown.
+    """
+    conditions = []
+    for condition in filters:
+        if condition.column not in allowed_columns:
+            raise ValueError(f"Filtering by {condition.column!r} is not allowed")
+        operator = OPERATORS.get(condition.op)
+        if operator is None:
+            raise ValueError(f"Unknown filter operator {condition.op!r}")
+        conditions.append(operator(getattr(model, condition.column), condition.value))
+    return conditions
+
+
+def compile_seek(
+    model, ordering: Ordering, after_id: int, after_value: Any,
+    key: Optional[ColumnElement] = None,
+) -> ColumnElement:
+    """
+    Compiles keyset condition selecting rows after (after_value, after_id)
+    in order of (ordering column, id).
+    Expression to order by (e.g. search rank) may be provided as key
+    instead of the column.
+    """
+    column = key if key is not None else getattr(model, ordering.column)
+    beyond = column < after_value if ordering.descending else column > after_value
+    return or_(beyond, and_(column == after_value, model.id > after_id))
@@ -1,24 +1,284 @@
-from contextlib import asynccontextmanager
-from typing import Any, AsyncGenerator
+import asyncio
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Callable, Dict, Iterator, Optional, Sequence
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.sql import Executable
+
+from .pool import InstrumentedQueuePool
+
+
+@dataclass
+class ClientConsistency:
+    """
+    Read-your-writes state of the client whose request is being handled.
+    Reads of the client go to the primary until primary_until (epoch seconds),
+    writes made while handling the request move it forward.
+    """
+    primary_until: float = 0.0
+    wrote: bool = False
+
+    def pinned_to_primary(self) -> bool:
+        return self.primary_until > time.time()
 
 
 class Database:
-    def __init__(self, url: str) -> None:
+    def __init__(
+        self, url: str, pool_size: int = 5, max_overflow: int = 10,
+        pool_timeout: float = 30.0, pool_recycle: int = -1,
+        pool_pre_ping: bool = False, echo: bool = False,
+        replica_urls: Sequence[str] = (), read_your_writes_window: float = 5.0,
+    ) -> None:
+        engine_options = dict(
+            poolclass=InstrumentedQueuePool,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=pool_timeout,
+            pool_recycle=pool_recycle,
+            pool_pre_ping=pool_pre_ping,
+            echo=echo,
+        )
         self._async_engine = create_async_engine(
-            url=url,
-            pool_pre_ping=False,
-            isolation_level="READ COMMITTED",
+            url=url, isolation_level="READ COMMITTED", **engine_options,
         )
         self._async_session = async_sessionmaker(
             bind=self._async_engine,
             expire_on_commit=False,
         )
+        # Reads run in autocommit mode: no BEGIN and COMMIT round trips
+        # around their statements, connections are shared with the engine pool.
+        self._readonly_session = async_sessionmaker(
+            bind=self._async_engine.execution_options(isolation_level="AUTOCOMMIT"),
+            expire_on_commit=False,
+        )
+        # Streams read with server-side cursor, which needs a transaction,
+        # read-only one is enough.
+        self._stream_session = async_sessionmaker(
+            bind=self._async_engine.execution_options(postgresql_readonly=True),
+            expire_on_commit=False,
+        )
+        # Read-only sessions and streams are spread over replicas round-robin,
+        # while writes and reads pinned by read-your-writes go to the primary.
+        self._replica_engines = [
+            create_async_engine(
+                url=replica_url, isolation_level="READ COMMITTED", **engine_options,
+            )
+            for replica_url in replica_urls
+        ]
+        self._replica_sessions = [
+            async_sessionmaker(
+                bind=engine.execution_options(isolation_level="AUTOCOMMIT"),
+                expire_on_commit=False,
+            )
+            for engine in self._replica_engines
+        ]
+        self._replica_stream_sessions = [
+            async_sessionmaker(
+                bind=engine.execution_options(postgresql_readonly=True),
+                expire_on_commit=False,
+            )
+            for engine in self._replica_engines
+        ]
+        self._next_replica = itertools.count()
+        self._read_your_writes_window = read_your_writes_window
+        self._bound_session: ContextVar[Optional[AsyncSession]] = ContextVar(
+            f"bound_session_{id(self)}", default=None,
+        )
+        self._client_consistency: ContextVar[Optional[ClientConsistency]] = ContextVar(
+            f"client_consistency_{id(self)}", default=None,
+        )
 
     @asynccontextmanager
-    async def get_session(self) -> AsyncGenerator[AsyncSession, Any]:
+    async def unit_of_work(self) -> AsyncGenerator[AsyncSession, Any]:
+        """
+        Binds single session to the current context.
+
+        Every get_session call made inside the unit of work shares its session
+        and transaction, which is committed once on exit
+        and rolled back if an exception is raised.
+        Nested unit of work joins the outer one.
+        Unit of work checks out at most one connection of the primary pool,
+        reads made before its first write run on it in autocommit mode.
+        """
+        bound_session = self._bound_session.get()
+        if bound_session is not None:
+            yield bound_session
+            return
+
+        session: AsyncSession = self._async_session()
+        token = self._bound_session.set(session)
+        try:
+            yield session
+            await session.commit()
+        except BaseException:
+            session.info.pop("on_commit", None)
+            await session.rollback()
+            raise
+        finally:
+            self._bound_session.reset(token)
+            await session.close()
+            connection = session.info.pop("connection", None)
+            if connection is not None:
+                await connection.close()
+            for callback in session.info.pop("on_transaction_end", []):
+                callback()
+            for callback in session.info.pop("on_commit", []):
+                callback()
+
+    async def _begin_autocommit(self, session: AsyncSession) -> None:
+        """
+        Binds unit of work session, which has not started its transaction,
+        to a connection in autocommit mode, so its reads take no BEGIN and
+        COMMIT round trips. The connection is kept for the following writes.
+        """
+        if "connection" in session.info:
+            return
+        connection = await self._async_engine.connect()
+        await connection.execution_options(isolation_level="AUTOCOMMIT")
+        session.sync_session.bind = connection.sync_connection
+        session.info["connection"] = connection
+        session.info["autocommit"] = True
+
+    async def _end_autocommit(self, session: AsyncSession) -> None:
+        """
+        Switches connection of unit of work session back from autocommit mode
+        before its first write, so writes run in the unit of work transaction.
+        """
+        if session.info.pop("autocommit", False):
+            # Nothing was started on the database, so nothing is committed.
+            await session.commit()
+            await session.info["connection"].execution_options(
+                isolation_level="READ COMMITTED",
+            )
+
+    def on_transaction_end(self, callback: Callable[[], None]) -> None:
+        """
+        Calls callback once current unit of work is committed or rolled back.
+        Outside of unit of work every operation is committed on its own,
+        so nothing is deferred and callback is not called.
+        """
+        bound_session = self._bound_session.get()
+        if bound_session is not None:
+            bound_session.info.setdefault("on_transaction_end", []).append(callback)
+
+    def on_commit(self, callback: Callable[[], None]) -> None:
+        """
+        Calls callback once current unit of work is committed,
+        callback is dropped if it is rolled back.
+        Outside of unit of work every operation is committed on its own,
+        so callback is called at once.
+        """
+        bound_session = self._bound_session.get()
+        if bound_session is None:
+            callback()
+            return
+        bound_session.info.setdefault("on_commit", []).append(callback)
+
+    def in_transaction(self) -> bool:
+        """
+        Tells whether current unit of work has started its transaction,
+        reads made inside it then must see its uncommitted writes.
+        """
+        bound_session = self._bound_session.get()
+        return (
+            bound_session is not None and bound_session.in_transaction()
+            and not bound_session.info.get("autocommit")
+        )
+
+    @property
+    def read_your_writes_window(self) -> float:
+        return self._read_your_writes_window
+
+    @contextmanager
+    def client_consistency(self, primary_until: float = 0.0) -> Iterator[ClientConsistency]:
+        """
+        Tracks read-your-writes state of a client while its request is handled.
+        primary_until is provided by the client (as returned after its previous
+        write), so it is trusted for no longer than read-your-writes window.
+        """
+        consistency = ClientConsistency(
+            primary_until=min(primary_until, time.time() + self._read_your_writes_window),
+        )
+        token = self._client_consistency.set(consistency)
+        try:
+            yield consistency
+        finally:
+            self._client_consistency.reset(token)
+
+    def record_write(self) -> None:
+        """
+        Pins reads of the current client to the primary for read-your-writes
+        window, as replicas may not have replayed its write yet.
+        """
+        consistency = self._client_consistency.get()
+        if consistency is not None and self._replica_sessions:
+            consistency.primary_until = time.time() + self._read_your_writes_window
+            consistency.wrote = True
+
+    def reads_from_replica(self) -> bool:
+        """
+        Tells whether read-only sessions and streams opened now go to replicas.
+        Rows read from a replica may be older than writes already made
+        on the primary, so they must not fill caches shared by all clients.
+        """
+        consistency = self._client_consistency.get()
+        return bool(self._replica_sessions) and not self.in_transaction() and not (
+            consistency is not None and consistency.pinned_to_primary()
+        )
+
+    def _readonly_sessionmaker(self) -> async_sessionmaker:
+        """
+        Picks database of a read-only session: next replica, or the primary
+        if there are no replicas or reads of the client are pinned to it.
+        """
+        if not self.reads_from_replica():
+            return self._readonly_session
+        return self._replica_sessions[next(self._next_replica) % len(self._replica_sessions)]
+
+    @asynccontextmanager
+    async def get_session(
+        self, join_unit_of_work: bool = True, readonly: bool = False,
+    ) -> AsyncGenerator[AsyncSession, Any]:
+        """
+        Provides session for a single repository operation.
+
+        Inside a unit of work its session is returned as is and is left
+        to be committed by the unit of work. Otherwise new session is opened
+        and committed on exit.
+
+        Read-only session runs its statements in autocommit mode and is
+        never committed, so a read takes a single round trip. Inside a unit
+        of work, until it starts its transaction, reads run in autocommit mode
+        on the connection of the unit of work, later reads join its transaction
+        to see its uncommitted writes. Under READ COMMITTED every statement
+        sees its own snapshot anyway, so reads made before are not less
+        consistent. Outside of a transaction read-only sessions go to replicas,
+        if there are any.
+        """
+        bound_session = self._bound_session.get() if join_unit_of_work else None
+        if bound_session is not None:
+            if not readonly:
+                await self._end_autocommit(bound_session)
+            elif not self.in_transaction():
+                session_factory = self._readonly_sessionmaker()
+                if session_factory is not self._readonly_session:
+                    async with session_factory() as session:
+                        yield session
+                    return
+                await self._begin_autocommit(bound_session)
+            yield bound_session
+            return
+
+        if readonly:
+            async with self._readonly_sessionmaker()() as session:
+                yield session
+            return
+
         session: AsyncSession = self._async_session()
         try:
             yield session
@@ -27,4 +287,60 @@ class Database:
             raise
         finally:
             await session.commit()
-            await session.close()
\ No newline at end of file
+            await session.close()
+
+    @asynccontextmanager
+    async def stream_session(self) -> AsyncGenerator[AsyncSession, Any]:
+        """
+        Provides session for a read streamed with server-side cursor.
+        Cursor needs a transaction, stream runs in its own read-only one
+        on next replica (or on the primary, as a read-only session would),
+        it is never joined with unit of work: stream is usually consumed
+        after the request unit of work is closed.
+        """
+        if self.reads_from_replica():
+            replica = next(self._next_replica) % len(self._replica_stream_sessions)
+            session_factory = self._replica_stream_sessions[replica]
+        else:
+            session_factory = self._stream_session
+        async with session_factory() as session:
+            yield session
+
+    async def warm_up(self, statements: Sequence[Executable]) -> None:
+        """
+        Opens pool size connections at once, to the primary and to every
+        replica, and executes statements on each of them, so asyncpg prepares
+        them (and SQLAlchemy compiles them) before first requests need them.
+        Statements are run in read-only sessions and must not write.
+        """
+        async def prepare(session_factory: async_sessionmaker) -> None:
+            async with session_factory() as session:
+                for statement in statements:
+                    await session.execute(statement)
+
+        read_databases = [
+            (self._async_engine, self._readonly_session),
+            *zip(self._replica_engines, self._replica_sessions),
+        ]
+        await asyncio.gather(*(
+            prepare(session_factory)
+            for engine, session_factory in read_databases
+            for _ in range(engine.pool.size())
+        ))
+
+    def pool_stats(self) -> Dict[str, Any]:
+        """
+        Returns occupancy and checkout counters of the connection pool
+        of the primary, with pools of replicas under "replicas".
+        """
+        return {
+            **self._async_engine.pool.stats(),
+            "replicas": [engine.pool.stats() for engine in self._replica_engines],
+        }
+
+    async def dispose(self) -> None:
+        """
+        Closes all connections of the pools.
+        """
+        for engine in (self._async_engine, *self._replica_engines):
+            await engine.dispose()
@@ -1,19 +1,21 @@
-from typing import AsyncGenerator, Callable
+from typing import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.requests import Request
 
-async def get_db_session(request: Request) -> AsyncGenerator[AsyncSession, None]:
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+
+
+async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
     """
-    Create and get database session.
+    Create and get database session bound to the request.
+
+    Session is opened as a unit of work, so all repositories used while
+    handling the request share it, and it is committed once after the
+    handler returns (or rolled back if the handler fails).
 
-    :param request: current request.
     :yield: database session.
     """
-    session: AsyncSession = request.app.state.db_session_factory()
-
-    try:
+    database: Database = init_container().resolve(Database)
+    async with database.unit_of_work() as session:
         yield session
-    finally:
-        await session.commit()
-        await session.close()
\ No newline at end of file
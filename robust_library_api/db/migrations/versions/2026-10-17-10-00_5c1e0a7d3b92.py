@@ -0,0 +1,60 @@
+"""Initial schema.
+
+Schema of the application before migrations were introduced, databases
+created by it with create_all are stamped with this revision.
+
+Revision ID: 5c1e0a7d3b92
+Revises:
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5c1e0a7d3b92"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "author",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("name", sa.String(length=200), nullable=False),
+        sa.Column("surname", sa.String(length=200), nullable=False),
+        sa.Column("birth_date", sa.Date(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "book",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("title", sa.String(length=200), nullable=False),
+        sa.Column("description", sa.String(length=1024), nullable=False),
+        sa.Column("author_id", sa.Integer(), nullable=False),
+        sa.Column("remaining_amount", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["author_id"], ["author.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_table(
+        "borrow",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("book_id", sa.Integer(), nullable=False),
+        sa.Column("reader_name", sa.String(length=200), nullable=False),
+        sa.Column("date_of_issue", sa.Date(), nullable=False),
+        sa.Column("date_of_return", sa.Date(), nullable=True),
+        sa.ForeignKeyConstraint(["book_id"], ["book.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("borrow")
+    op.drop_table("book")
+    op.drop_table("author")
@@ -0,0 +1,47 @@
+"""Book ISBN, row versions and remaining amount check.
+
+Existing rows get version 1 from the server default. Check constraint
+is added NOT VALID and validated separately, so validation scanning
+book table does not block writes to it.
+
+Revision ID: 7a2d9c4e1f68
+Revises: 5c1e0a7d3b92
+Create Date: 2026-10-17 10:15:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "7a2d9c4e1f68"
+down_revision: Union[str, Sequence[str], None] = "5c1e0a7d3b92"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ("author", "book", "borrow"):
+        op.add_column(
+            table,
+            sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+        )
+    op.add_column("book", sa.Column("isbn", sa.String(length=20), nullable=True))
+    op.create_unique_constraint("book_isbn_key", "book", ["isbn"])
+    op.execute(
+        "ALTER TABLE book ADD CONSTRAINT book_remaining_amount_non_negative "
+        "CHECK (remaining_amount >= 0) NOT VALID"
+    )
+    op.execute("ALTER TABLE book VALIDATE CONSTRAINT book_remaining_amount_non_negative")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("book_remaining_amount_non_negative", "book", type_="check")
+    op.drop_constraint("book_isbn_key", "book", type_="unique")
+    op.drop_column("book", "isbn")
+    for table in ("borrow", "book", "author"):
+        op.drop_column(table, "version")
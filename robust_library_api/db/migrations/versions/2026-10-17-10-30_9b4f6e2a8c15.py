@@ -0,0 +1,72 @@
+"""Indexes for hot access paths.
+
+Indexes are built CONCURRENTLY, so writes to the tables are not blocked
+while they are built. CONCURRENTLY can not run inside a transaction,
+so every statement is run in autocommit mode.
+
+Revision ID: 9b4f6e2a8c15
+Revises: 7a2d9c4e1f68
+Create Date: 2026-10-17 10:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9b4f6e2a8c15"
+down_revision: Union[str, Sequence[str], None] = "7a2d9c4e1f68"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_book_author_id_remaining_amount",
+            "book",
+            ["author_id", "remaining_amount"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_book_title_prefix",
+            "book",
+            ["title"],
+            postgresql_ops={"title": "varchar_pattern_ops"},
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_borrow_book_id",
+            "borrow",
+            ["book_id"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_borrow_reader_name",
+            "borrow",
+            ["reader_name"],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_borrow_open_book_id",
+            "borrow",
+            ["book_id"],
+            postgresql_where=sa.text("date_of_return IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        for table, index in (
+            ("borrow", "ix_borrow_open_book_id"),
+            ("borrow", "ix_borrow_reader_name"),
+            ("borrow", "ix_borrow_book_id"),
+            ("book", "ix_book_title_prefix"),
+            ("book", "ix_book_author_id_remaining_amount"),
+        ):
+            op.drop_index(index, table_name=table, postgresql_concurrently=True)
@@ -0,0 +1,56 @@
+"""Full-text search vector of books.
+
+Adding stored generated column rewrites book table under exclusive lock,
+GIN index on it is built CONCURRENTLY afterwards.
+
+Revision ID: 3d8a5f1c7e40
+Revises: 9b4f6e2a8c15
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3d8a5f1c7e40"
+down_revision: Union[str, Sequence[str], None] = "9b4f6e2a8c15"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "book",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('english', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=False,
+        ),
+    )
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_book_search_vector",
+            "book",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_book_search_vector", table_name="book", postgresql_concurrently=True
+        )
+    op.drop_column("book", "search_vector")
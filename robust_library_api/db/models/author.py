@@ -1,10 +1,14 @@
 from datetime import date
+from typing import TYPE_CHECKING, List
 
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import String, Date
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.sqltypes import String, Date, Integer
 
 from robust_library_api.db.base import Base
 
+if TYPE_CHECKING:
+    from robust_library_api.db.models.book import BookModel
+
 
 class AuthorModel(Base):
     __tablename__ = "author"
@@ -13,3 +17,12 @@ class AuthorModel(Base):
     name: Mapped[str] = mapped_column(String(length=200))
     surname: Mapped[str] = mapped_column(String(length=200))
     birth_date: Mapped[date] = mapped_column(Date())
+    # Row version, bumped on every update, exposed as ETag
+    version: Mapped[int] = mapped_column(Integer(), server_default="1")
+    # Loaded only on request (selectinload), lazy loading raises instead of
+    # issuing a query per author
+    books: Mapped[List["BookModel"]] = relationship(
+        back_populates="author", lazy="raise", order_by="BookModel.id"
+    )
+
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
@@ -1,15 +1,62 @@
-from sqlalchemy import ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import CheckConstraint, Computed, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from sqlalchemy.sql.sqltypes import String, Integer
 
 from robust_library_api.db.base import Base
 
+if TYPE_CHECKING:
+    from robust_library_api.db.models.author import AuthorModel
+
+# Text search configuration of search_vector, queries must use the same one
+BOOK_SEARCH_CONFIG = "english"
+
 
 class BookModel(Base):
     __tablename__ = "book"
+    __table_args__ = (
+        CheckConstraint(
+            "remaining_amount >= 0", name="book_remaining_amount_non_negative"
+        ),
+        # Books of an author, optionally sorted by remaining amount
+        Index("ix_book_author_id_remaining_amount", "author_id", "remaining_amount"),
+        # Title prefix search (LIKE 'prefix%') regardless of collation
+        Index(
+            "ix_book_title_prefix", "title",
+            postgresql_ops={"title": "varchar_pattern_ops"},
+        ),
+        Index("ix_book_search_vector", "search_vector", postgresql_using="gin"),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     title: Mapped[str] = mapped_column(String(length=200))
     description: Mapped[str] = mapped_column(String(length=1024))
     author_id: Mapped[int] = mapped_column(ForeignKey("author.id"))
     remaining_amount: Mapped[int] = mapped_column(Integer())
+    # Natural key of the book in external catalogs, used by catalog sync upserts
+    isbn: Mapped[Optional[str]] = mapped_column(
+        String(length=20), unique=True, nullable=True
+    )
+    # Row version, bumped on every update, exposed as ETag
+    version: Mapped[int] = mapped_column(Integer(), server_default="1")
+    # Full-text document of title (weighted higher) and description,
+    # maintained by the database. Column of the table only, it is not mapped
+    # so it is never loaded or returned with books.
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR(),
+        Computed(
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', coalesce(title, '')), 'A') || "
+            f"setweight(to_tsvector('{BOOK_SEARCH_CONFIG}', coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+    )
+    # Loaded only on request (selectinload), lazy loading raises
+    author: Mapped["AuthorModel"] = relationship(back_populates="books", lazy="raise")
+
+    __mapper_args__ = {
+        "version_id_col": version,
+        "eager_defaults": True,
+        "exclude_properties": ["search_vector"],
+    }
@@ -1,17 +1,36 @@
 from datetime import date
+from typing import TYPE_CHECKING
 
-from sqlalchemy import ForeignKey
-from sqlalchemy.orm import Mapped, mapped_column
-from sqlalchemy.sql.sqltypes import String, Date
+from sqlalchemy import ForeignKey, Index, text
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.sql.sqltypes import String, Date, Integer
 
 from robust_library_api.db.base import Base
 
+if TYPE_CHECKING:
+    from robust_library_api.db.models.book import BookModel
+
 
 class BorrowModel(Base):
     __tablename__ = "borrow"
+    __table_args__ = (
+        Index("ix_borrow_book_id", "book_id"),
+        Index("ix_borrow_reader_name", "reader_name"),
+        # Open borrows of a book, returned ones are only history
+        Index(
+            "ix_borrow_open_book_id", "book_id",
+            postgresql_where=text("date_of_return IS NULL"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     book_id: Mapped[str] = mapped_column(ForeignKey("book.id"))
     reader_name: Mapped[str] = mapped_column(String(length=200))
     date_of_issue: Mapped[date] = mapped_column(Date())
     date_of_return: Mapped[date] = mapped_column(Date(), nullable=True)
+    # Row version, bumped on every update, exposed as ETag
+    version: Mapped[int] = mapped_column(Integer(), server_default="1")
+    # Loaded only on request (selectinload), lazy loading raises
+    book: Mapped["BookModel"] = relationship(lazy="raise")
+
+    __mapper_args__ = {"version_id_col": version, "eager_defaults": True}
@@ -1,3 +1,7 @@
+from typing import AsyncIterator
+
+from sqlalchemy import Row
+
 from robust_library_api.db.dao import ExtendedCRUDRepository, repository_for
 
 from robust_library_api.db.models.author import AuthorModel
@@ -5,22 +9,68 @@ from robust_library_api.db.models.author import AuthorModel
 
 @repository_for(AuthorModel)
 class AuthorRepository(ExtendedCRUDRepository[AuthorModel]):
+    includable_relationships = frozenset({"books"})
+
     async def is_author_exists(self, author_id: int) -> bool:
         return await self.exists(id=author_id)
 
     async def create_author(self, **author_fields) -> AuthorModel:
         return await self.create(**author_fields)
 
+    async def create_authors(
+        self, authors_fields: list[dict], chunk_size: int = 500
+    ) -> list[AuthorModel]:
+        return await self.create_many(authors_fields, chunk_size=chunk_size)
+
+    async def existing_author_ids(self, author_ids: set[int]) -> set[int]:
+        return await self.find_existing_ids(author_ids)
+
     async def all_authors(self) -> list[AuthorModel]:
         return await self.find_all()
 
-    async def get_author_by_id(self, author_id: int) -> AuthorModel | None:
-        return await self.find_by_id(item_id=author_id)
+    async def authors_page(
+        self, after_id: int | None, limit: int, columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> list[AuthorModel] | list[Row]:
+        return await self.find_with_keyset(
+            after_id=after_id, limit=limit, columns=columns, include=include
+        )
+
+    def authors_stream(
+        self, after_id: int | None, yield_per: int, columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> AsyncIterator[list[AuthorModel] | list[Row]]:
+        return self.stream_all(
+            after_id=after_id, yield_per=yield_per, columns=columns, include=include
+        )
+
+    async def get_author_by_id(
+        self, author_id: int, columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> AuthorModel | dict | None:
+        return await self.find_by_id(item_id=author_id, columns=columns, include=include)
+
+    async def get_authors_by_ids(
+        self, author_ids: list[int], columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> list[AuthorModel] | list[dict]:
+        return await self.find_by_ids(ids=author_ids, columns=columns, include=include)
+
+    async def get_author_version(self, author_id: int) -> int | None:
+        return await self.find_version(item_id=author_id)
 
     async def update_author_by_id(
-        self, author_to_update_id: int, **new_fields
-    ) -> int:
-        return await self.update(fields=new_fields, id=author_to_update_id)
+        self, author_to_update_id: int, expected_version: int | None = None,
+        **new_fields
+    ) -> AuthorModel | None:
+        updated = await self.update_returning(
+            fields=new_fields, expected_version=expected_version,
+            id=author_to_update_id,
+        )
+        return updated[0] if updated else None
 
     async def delete_author_by_id(self, author_id: int) -> int:
         return await self.delete(id=author_id)
+
+    async def count_authors(self) -> int:
+        return await self.count_all()
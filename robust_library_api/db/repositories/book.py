@@ -1,26 +1,129 @@
+from typing import AsyncIterator
+
+from sqlalchemy import Row, func, literal_column, select
+
 from robust_library_api.db.dao import ExtendedCRUDRepository, repository_for
+from robust_library_api.db.dao.filters import Filter, Ordering, compile_seek
 
-from robust_library_api.db.models.book import BookModel
+from robust_library_api.db.models.book import BOOK_SEARCH_CONFIG, BookModel
+
+# Books found by search are ordered by rank descending, then by id
+SEARCH_ORDERING = Ordering("rank", descending=True)
 
 
 @repository_for(BookModel)
 class BookRepository(ExtendedCRUDRepository[BookModel]):
+    filterable_columns = frozenset({"author_id", "title", "remaining_amount", "isbn"})
+    sortable_columns = frozenset({"id", "title", "remaining_amount"})
+    includable_relationships = frozenset({"author"})
+
     async def is_book_exists(self, book_id: int) -> bool:
         return await self.exists(id=book_id)
 
     async def create_book(self, **book_fields) -> BookModel:
         return await self.create(**book_fields)
 
+    async def create_books(
+        self, books_fields: list[dict], chunk_size: int = 500
+    ) -> list[BookModel]:
+        return await self.create_many(books_fields, chunk_size=chunk_size)
+
+    async def existing_isbns(self, isbns: set[str]) -> set[str]:
+        if not isbns:
+            return set()
+        query = select(BookModel.isbn).where(BookModel.isbn.in_(isbns))
+        return set(await self.read(raw_query=query))
+
+    async def upsert_books_by_isbn(
+        self, books_fields: list[dict], chunk_size: int = 500
+    ) -> list[BookModel]:
+        # Stored books keep remaining amount, their copies may be lent out
+        return await self.upsert_many(
+            books_fields, conflict_fields=["isbn"], chunk_size=chunk_size,
+            insert_only_fields=["remaining_amount"],
+        )
+
     async def all_books(self) -> list[BookModel]:
         return await self.find_all()
 
-    async def get_book_by_id(self, book_id: int) -> BookModel | None:
-        return await self.find_by_id(item_id=book_id)
+    async def books_page(
+        self, after_id: int | None, limit: int, columns: list[str] | None = None,
+        conditions: list[Filter] = (), ordering: Ordering | None = None,
+        after_value=None, include: list[str] = (),
+    ) -> list[BookModel] | list[Row]:
+        return await self.find_with_keyset(
+            after_id=after_id, limit=limit, columns=columns,
+            conditions=conditions, ordering=ordering, after_value=after_value,
+            include=include,
+        )
+
+    def books_stream(
+        self, after_id: int | None, yield_per: int, columns: list[str] | None = None,
+        conditions: list[Filter] = (), ordering: Ordering | None = None,
+        after_value=None, include: list[str] = (),
+    ) -> AsyncIterator[list[BookModel] | list[Row]]:
+        return self.stream_all(
+            after_id=after_id, yield_per=yield_per, columns=columns,
+            conditions=conditions, ordering=ordering, after_value=after_value,
+            include=include,
+        )
+
+    async def search_books(
+        self, text: str, after_id: int | None, after_rank: float | None,
+        limit: int, columns: list[str] | None = None,
+    ) -> list[dict]:
+        """
+        Finds books matching web search style query (quoted phrases, OR, -word)
+        in title or description, using GIN index on search_vector.
+        Returns dicts of columns with rank of the book, best matches first.
+        Page starts after book with after_id and after_rank.
+        """
+        query = func.websearch_to_tsquery(
+            literal_column(f"'{BOOK_SEARCH_CONFIG}'::regconfig"), text
+        )
+        table_columns = BookModel.__table__.c
+        rank = func.ts_rank_cd(table_columns.search_vector, query)
+        statement = (
+            select(
+                *(table_columns[column] for column in columns or self.column_names),
+                rank.label(SEARCH_ORDERING.column),
+            )
+            .where(table_columns.search_vector.bool_op("@@")(query))
+        )
+        if after_id is not None:
+            statement = statement.where(
+                compile_seek(BookModel, SEARCH_ORDERING, after_id, after_rank, key=rank)
+            )
+        statement = statement.order_by(rank.desc(), BookModel.id).limit(limit)
+        return await self.read_rows(statement)
+
+    async def get_book_by_id(
+        self, book_id: int, columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> BookModel | dict | None:
+        return await self.find_by_id(item_id=book_id, columns=columns, include=include)
+
+    async def get_books_by_ids(
+        self, book_ids: list[int], columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> list[BookModel] | list[dict]:
+        return await self.find_by_ids(ids=book_ids, columns=columns, include=include)
+
+    async def get_book_version(self, book_id: int) -> int | None:
+        return await self.find_version(item_id=book_id)
 
     async def update_book_by_id(
-        self, book_to_update_id: int, **new_fields
-    ) -> int:
-        return await self.update(fields=new_fields, id=book_to_update_id)
+        self, book_to_update_id: int, expected_version: int | None = None,
+        **new_fields
+    ) -> BookModel | None:
+        updated = await self.update_returning(
+            fields=new_fields, expected_version=expected_version,
+            id=book_to_update_id,
+        )
+        return updated[0] if updated else None
 
     async def delete_book_by_id(self, book_id: int):
         return await self.delete(id=book_id)
+
+    async def count_books(self) -> int:
+        return await self.count_all()
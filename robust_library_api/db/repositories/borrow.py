@@ -1,21 +1,138 @@
+from datetime import date
+from typing import AsyncIterator
+
+from sqlalchemy import Row, insert, literal, select, update
+
 from robust_library_api.db.dao import ExtendedCRUDRepository, repository_for
+from robust_library_api.db.dao.filters import Filter, Ordering
 
+from robust_library_api.db.models.book import BookModel
 from robust_library_api.db.models.borrow import BorrowModel
 
 
 @repository_for(BorrowModel)
 class BorrowRepository(ExtendedCRUDRepository[BorrowModel]):
+    filterable_columns = frozenset({"book_id", "reader_name", "date_of_issue", "date_of_return"})
+    sortable_columns = frozenset({"id", "book_id", "reader_name"})
+    includable_relationships = frozenset({"book"})
+
     async def is_borrow_exists(self, borrow_id: int) -> bool:
         return await self.exists(id=borrow_id)
 
     async def create_borrow(self, **borrow_fields) -> BorrowModel:
         return await self.create(**borrow_fields)
 
+    async def borrow_book(
+        self, book_id: int, reader_name: str, date_of_issue: date
+    ) -> dict | None:
+        """
+        Takes one copy of the book and registers borrow with single statement.
+        Nothing is written and None is returned if the book does not exist
+        or has no copies left.
+        """
+        taken_book = (
+            update(BookModel)
+            .where(BookModel.id == book_id, BookModel.remaining_amount > 0)
+            .values(
+                remaining_amount=BookModel.remaining_amount - 1,
+                version=BookModel.version + 1,
+            )
+            .returning(BookModel.id)
+            .cte("taken_book")
+        )
+        query = (
+            insert(BorrowModel)
+            .from_select(
+                ["book_id", "reader_name", "date_of_issue"],
+                select(taken_book.c.id, literal(reader_name), literal(date_of_issue)),
+            )
+            .returning(
+                BorrowModel.id,
+                BorrowModel.book_id,
+                BorrowModel.reader_name,
+                BorrowModel.date_of_issue,
+                BorrowModel.version,
+            )
+        )
+        created_borrows = await self.execute_returning(query)
+        if not created_borrows:
+            return None
+        self._invalidate_cached([book_id], model=BookModel)
+        self._invalidate_cached([created_borrows[0]["id"]])
+        return created_borrows[0]
+
+    async def return_book(self, borrow_id: int, date_of_return: date) -> int | None:
+        """
+        Closes open borrow and puts its book copy back with single statement.
+        Returns id of the returned book, or None if the borrow does not exist
+        or is already closed.
+        """
+        closed_borrow = (
+            update(BorrowModel)
+            .where(BorrowModel.id == borrow_id, BorrowModel.date_of_return.is_(None))
+            .values(date_of_return=date_of_return, version=BorrowModel.version + 1)
+            .returning(BorrowModel.book_id)
+            .cte("closed_borrow")
+        )
+        query = (
+            update(BookModel)
+            .where(BookModel.id == closed_borrow.c.book_id)
+            .values(
+                remaining_amount=BookModel.remaining_amount + 1,
+                version=BookModel.version + 1,
+            )
+            .returning(BookModel.id)
+            .execution_options(synchronize_session=False)
+        )
+        returned_books = await self.execute_returning(query)
+        if not returned_books:
+            return None
+        self._invalidate_cached([returned_books[0]["id"]], model=BookModel)
+        self._invalidate_cached([borrow_id])
+        return returned_books[0]["id"]
+
     async def all_borrows(self) -> list[BorrowModel]:
         return await self.find_all()
 
-    async def get_borrow_by_id(self, borrow_id: int) -> BorrowModel | None:
-        return await self.find_by_id(item_id=borrow_id)
+    async def borrows_page(
+        self, after_id: int | None, limit: int, columns: list[str] | None = None,
+        conditions: list[Filter] = (), ordering: Ordering | None = None,
+        after_value=None, include: list[str] = (),
+    ) -> list[BorrowModel] | list[Row]:
+        return await self.find_with_keyset(
+            after_id=after_id, limit=limit, columns=columns,
+            conditions=conditions, ordering=ordering, after_value=after_value,
+            include=include,
+        )
+
+    def borrows_stream(
+        self, after_id: int | None, yield_per: int, columns: list[str] | None = None,
+        conditions: list[Filter] = (), ordering: Ordering | None = None,
+        after_value=None, include: list[str] = (),
+    ) -> AsyncIterator[list[BorrowModel] | list[Row]]:
+        return self.stream_all(
+            after_id=after_id, yield_per=yield_per, columns=columns,
+            conditions=conditions, ordering=ordering, after_value=after_value,
+            include=include,
+        )
+
+    async def get_borrow_by_id(
+        self, borrow_id: int, columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> BorrowModel | dict | None:
+        return await self.find_by_id(item_id=borrow_id, columns=columns, include=include)
+
+    async def get_borrows_by_ids(
+        self, borrow_ids: list[int], columns: list[str] | None = None,
+        include: list[str] = (),
+    ) -> list[BorrowModel] | list[dict]:
+        return await self.find_by_ids(ids=borrow_ids, columns=columns, include=include)
+
+    async def get_borrow_version(self, borrow_id: int) -> int | None:
+        return await self.find_version(item_id=borrow_id)
 
     async def update_borrow_by_id(self, borrow_id: int, **new_fields):
-        return await self.update(fields=new_fields, id=borrow_id)
\ No newline at end of file
+        return await self.update(fields=new_fields, id=borrow_id)
+
+    async def count_borrows(self) -> int:
+        return await self.count_all()
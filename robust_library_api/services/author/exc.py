@@ -17,6 +17,10 @@ class AuthorNotFoundDeletedError(AuthorServiceError):
     def __init__(self, not_deleted_author_id: int, **details):
         super().__init__(f"0 author(s) deleted. Author with ID {not_deleted_author_id} not found.")
 
+class AuthorVersionMismatchError(AuthorServiceError):
+    def __init__(self, author_id: int, expected_version: int, **details):
+        super().__init__(f"Author with ID {author_id} was modified: version {expected_version} is outdated.")
+
 class AuthorServiceRepositoryError(ServiceRepositoryError):
     def __init__(self, error_message_details: str = None):
         super().__init__(f"Author service failed with repository error. {error_message_details if error_message_details else 'No details provided.'}")
\ No newline at end of file
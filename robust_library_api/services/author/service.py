@@ -1,30 +1,60 @@
+from typing import Optional
+
 from robust_library_api.db.repositories.author import AuthorRepository
 from robust_library_api.db.dao.exc import ForeignKeyViolation
 from robust_library_api.db.models.author import AuthorModel
+from robust_library_api.settings import settings
 from robust_library_api.services.utils import (
+    decode_cursor,
+    keyset_page,
+    model_partitions_to_dicts,
+    parse_fields,
+    parse_ids,
+    parse_include,
     model_row_to_dict,
+    project_row,
+    read_columns,
     repository_fallback
 )
+from robust_library_api.services.author.suggest import AuthorPrefixIndex
 from robust_library_api.services.author.exc import (
     AuthorNotFoundError, 
     AuthorNotFoundDeletedError, 
     AuthorServiceRepositoryError,
-    AuthorStillObtainsBooksError
+    AuthorStillObtainsBooksError,
+    AuthorVersionMismatchError
 )
 
 from robust_library_api.web.api.authors.schema import (
     ResponseAuthor,
+    ResponseAuthorBatch,
+    ResponseAuthorBulk,
     ResponseAuthorCount,
-    ResponseAuthorList
+    ResponseAuthorList,
+    ResponseAuthorSuggestions
 )
 
 class AuthorService:
     def __init__(self, author_repository: AuthorRepository):
         self.author_repository: AuthorRepository = author_repository
+        self.name_index: AuthorPrefixIndex = AuthorPrefixIndex()
     
+    def _index_on_commit(self, author: AuthorModel) -> None:
+        """
+        Adds written author to name index once the write is committed,
+        so suggestions never hold authors of rolled back writes.
+        """
+        author = model_row_to_dict(author)
+        self.author_repository.database.on_commit(lambda: self.name_index.add(author))
+
     @repository_fallback(AuthorServiceRepositoryError)
-    async def _verify_extract_author(self, author_id: int) -> AuthorModel:
-        author_entity = await self.author_repository.get_author_by_id(author_id=author_id)
+    async def _verify_extract_author(
+        self, author_id: int, columns: Optional[list[str]] = None,
+        include: list[str] = (),
+    ) -> AuthorModel | dict:
+        author_entity = await self.author_repository.get_author_by_id(
+            author_id=author_id, columns=columns, include=include
+        )
         if not author_entity:
             raise AuthorNotFoundError(author_id)
         return author_entity
@@ -32,45 +62,156 @@ class AuthorService:
     @repository_fallback(AuthorServiceRepositoryError)
     async def author_creation(self, **author_creation_fields) -> ResponseAuthor:
         created_author = await self.author_repository.create_author(**author_creation_fields)
+        self._index_on_commit(created_author)
         return ResponseAuthor(
             message="Author created successfully.",
-            data=model_row_to_dict(created_author),
+            data=created_author,
         )
 
     @repository_fallback(AuthorServiceRepositoryError)
-    async def all_authors_list(self) -> ResponseAuthorList:
-        all_authors = await self.author_repository.all_authors()
+    async def bulk_author_creation(
+        self, authors_creation_fields: list[dict]
+    ) -> ResponseAuthorBulk:
+        created_authors = await self.author_repository.create_authors(
+            authors_creation_fields, chunk_size=settings.bulk_chunk_size
+        )
+        for author in created_authors:
+            self._index_on_commit(author)
+        return ResponseAuthorBulk(
+            message=f"{len(created_authors)} author(s) created.",
+            data=created_authors,
+        )
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def all_authors_list(
+        self, cursor: Optional[str] = None,
+        limit: int = settings.pagination_default_limit,
+        fields: Optional[str] = None, include: Optional[str] = None,
+    ) -> ResponseAuthorList:
+        columns = parse_fields(fields, AuthorModel.__table__.columns.keys())
+        include = parse_include(include, self.author_repository.includable_relationships)
+        columns = read_columns(columns, include, self.author_repository.column_names)
+        authors = await self.author_repository.authors_page(
+            after_id=decode_cursor(cursor), limit=limit + 1,
+            columns=columns, include=include,
+        )
+        authors_page, next_cursor = keyset_page(authors, limit)
         return ResponseAuthorList(
             message="Authors fetched successfully.",
-            data=[model_row_to_dict(author) for author in all_authors],
+            data=[project_row(author, columns, include) for author in authors_page],
+            next_cursor=next_cursor,
+        )
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def all_authors_stream(
+        self, cursor: Optional[str] = None, fields: Optional[str] = None,
+        include: Optional[str] = None,
+    ):
+        columns = parse_fields(fields, AuthorModel.__table__.columns.keys())
+        include = parse_include(include, self.author_repository.includable_relationships)
+        columns = read_columns(columns, include, self.author_repository.column_names)
+        authors_partitions = self.author_repository.authors_stream(
+            after_id=decode_cursor(cursor), yield_per=settings.stream_yield_per,
+            columns=columns, include=include,
+        )
+        return model_partitions_to_dicts(authors_partitions, columns, include)
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def build_name_index(self) -> None:
+        """
+        Fills name index used for suggestions with all stored authors.
+        """
+        authors = []
+        async for partition in self.author_repository.authors_stream(
+            after_id=None, yield_per=settings.stream_yield_per,
+            columns=["id", "name", "surname"],
+        ):
+            authors.extend(model_row_to_dict(author) for author in partition)
+        self.name_index.rebuild(authors)
+
+    def author_suggestions(self, prefix: str, limit: int) -> ResponseAuthorSuggestions:
+        suggestions = self.name_index.suggest(prefix, limit)
+        return ResponseAuthorSuggestions(
+            message=f"{len(suggestions)} author(s) suggested.",
+            data=suggestions,
+        )
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def authors_batch(
+        self, ids: str, fields: Optional[str] = None, include: Optional[str] = None
+    ) -> ResponseAuthorBatch:
+        author_ids = parse_ids(ids, settings.batch_max_ids)
+        columns = parse_fields(fields, AuthorModel.__table__.columns.keys())
+        include = parse_include(include, self.author_repository.includable_relationships)
+        columns = read_columns(columns, include, self.author_repository.column_names)
+        authors = await self.author_repository.get_authors_by_ids(
+            author_ids=author_ids, columns=columns, include=include
+        )
+        data = [project_row(author, columns, include) for author in authors]
+        found_ids = {model_row_to_dict(author)["id"] for author in data}
+        return ResponseAuthorBatch(
+            message=f"{len(data)} author(s) fetched.",
+            data=data,
+            missing_ids=[author_id for author_id in author_ids if author_id not in found_ids],
         )
 
     @repository_fallback(AuthorServiceRepositoryError)
-    async def obtain_author_information(self, author_id: int) -> ResponseAuthor:
-        author_entity = await self._verify_extract_author(author_id=author_id)
+    async def authors_count(self) -> ResponseAuthorCount:
+        authors_count = await self.author_repository.count_authors()
+        return ResponseAuthorCount(
+            message=f"{authors_count} author(s) found.",
+            data=authors_count,
+        )
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def author_version(self, author_id: int) -> Optional[int]:
+        return await self.author_repository.get_author_version(author_id=author_id)
+
+    @repository_fallback(AuthorServiceRepositoryError)
+    async def obtain_author_information(
+        self, author_id: int, fields: Optional[str] = None,
+        include: Optional[str] = None,
+    ) -> ResponseAuthor:
+        columns = parse_fields(fields, AuthorModel.__table__.columns.keys())
+        include = parse_include(include, self.author_repository.includable_relationships)
+        columns = read_columns(columns, include, self.author_repository.column_names)
+        author_entity = await self._verify_extract_author(
+            author_id=author_id, columns=columns, include=include,
+        )
         return ResponseAuthor(
             message="Author information fetched successfully.",
-            data=model_row_to_dict(author_entity),
+            data=project_row(author_entity, columns, include),
         )
 
     @repository_fallback(AuthorServiceRepositoryError)
     async def update_author_information(
-        self, author_id: int, **new_author_fields
-    ) -> ResponseAuthorCount:
-        await self._verify_extract_author(author_id)
-        
+        self, author_id: int, expected_version: Optional[int] = None,
+        count_only: bool = False, **new_author_fields
+    ) -> ResponseAuthor | ResponseAuthorCount:
         new_author_fields_without_nones = {
             field: value
             for field, value in new_author_fields.items()
             if value is not None
         }
-        update_count = await self.author_repository.update_author_by_id(
-            author_to_update_id=author_id, **new_author_fields_without_nones
+        updated_author = await self.author_repository.update_author_by_id(
+            author_to_update_id=author_id, expected_version=expected_version,
+            **new_author_fields_without_nones
         )
         
-        return ResponseAuthorCount(
-            message=f"{update_count} author(s) updated.",
-            data=update_count,
+        if updated_author is None:
+            if expected_version is not None and await self.author_repository.is_author_exists(author_id=author_id):
+                raise AuthorVersionMismatchError(author_id, expected_version)
+            raise AuthorNotFoundError(author_id)
+        self._index_on_commit(updated_author)
+        
+        if count_only:
+            return ResponseAuthorCount(
+                message="1 author(s) updated.",
+                data=1,
+            )
+        return ResponseAuthor(
+            message="Author updated successfully.",
+            data=updated_author,
         )
 
     @repository_fallback(AuthorServiceRepositoryError)
@@ -82,6 +223,9 @@ class AuthorService:
         else:
             if delete_count == 0:
                 raise AuthorNotFoundDeletedError(author_id)
+            self.author_repository.database.on_commit(
+                lambda: self.name_index.remove(author_id)
+            )
             return ResponseAuthorCount(
                 message=f"{delete_count} author(s) deleted.",
                 data=delete_count,
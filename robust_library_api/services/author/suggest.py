@@ -0,0 +1,93 @@
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Iterable, List, Tuple
+
+
+def normalize(text: str) -> str:
+    """
+    Normalizes text for case and width insensitive prefix matching.
+    """
+    return " ".join(unicodedata.normalize("NFKC", text).casefold().split())
+
+
+class AuthorPrefixIndex:
+    """
+    In-process index of author names for typeahead suggestions.
+
+    Keeps sorted array of (normalized key, author id) pairs, where keys are
+    name, surname and "name surname" of every author. Suggestions for a prefix
+    are found with binary search, without touching the database.
+    Index is per process, writes made by other processes are seen
+    only after it is rebuilt.
+    """
+
+    def __init__(self) -> None:
+        self._keys: List[Tuple[str, int]] = []
+        self._authors: dict[int, dict] = {}
+
+    @staticmethod
+    def _keys_of(author: dict) -> set[str]:
+        name, surname = normalize(author["name"]), normalize(author["surname"])
+        return {name, surname, f"{name} {surname}"}
+
+    def rebuild(self, authors: Iterable[dict]) -> None:
+        """
+        Replaces content of the index with provided authors.
+        """
+        self._authors = {
+            author["id"]: {
+                "id": author["id"],
+                "name": author["name"],
+                "surname": author["surname"],
+            }
+            for author in authors
+        }
+        self._keys = sorted(
+            (key, author_id)
+            for author_id, author in self._authors.items()
+            for key in self._keys_of(author)
+        )
+
+    def add(self, author: dict) -> None:
+        """
+        Adds author to the index or replaces indexed one with the same id.
+        """
+        self.remove(author["id"])
+        author = {"id": author["id"], "name": author["name"], "surname": author["surname"]}
+        self._authors[author["id"]] = author
+        for key in self._keys_of(author):
+            insort(self._keys, (key, author["id"]))
+
+    def remove(self, author_id: int) -> None:
+        """
+        Removes author from the index if it is indexed.
+        """
+        author = self._authors.pop(author_id, None)
+        if author is None:
+            return
+        for key in self._keys_of(author):
+            position = bisect_left(self._keys, (key, author_id))
+            if position < len(self._keys) and self._keys[position] == (key, author_id):
+                del self._keys[position]
+
+    def suggest(self, prefix: str, limit: int) -> List[dict]:
+        """
+        Returns at most limit authors with name, surname or full name
+        starting with prefix, in order of matched key.
+        Blank prefix matches no author.
+        """
+        prefix = normalize(prefix)
+        if not prefix:
+            return []
+        suggestions: dict[int, dict] = {}
+        position = bisect_left(self._keys, (prefix,))
+        while position < len(self._keys) and len(suggestions) < limit:
+            key, author_id = self._keys[position]
+            if not key.startswith(prefix):
+                break
+            suggestions.setdefault(author_id, self._authors[author_id])
+            position += 1
+        return list(suggestions.values())
+
+    def __len__(self) -> int:
+        return len(self._authors)
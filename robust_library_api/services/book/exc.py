@@ -17,6 +17,14 @@ class BookNotFoundDeletedError(BookServiceError):
     def __init__(self, not_deleted_book_id: int, **details):
         super().__init__(f"0 book(s) deleted. Book with ID {not_deleted_book_id} not found.")
 
+class BookIsbnAlreadyExistsError(BookServiceError):
+    def __init__(self, isbn: str, **details):
+        super().__init__(f"Book with ISBN {isbn} already exists.")
+
+class BookVersionMismatchError(BookServiceError):
+    def __init__(self, book_id: int, expected_version: int, **details):
+        super().__init__(f"Book with ID {book_id} was modified: version {expected_version} is outdated.")
+
 class BookServiceRepositoryError(ServiceRepositoryError):
     def __init__(self, error_message_details: str = None):
         super().__init__(f"Book service failed with repository error. {error_message_details if error_message_details else 'No details provided.'}")
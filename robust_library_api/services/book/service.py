@@ -1,26 +1,45 @@
-from robust_library_api.db.repositories.book import BookRepository
+from typing import Optional
+
+from robust_library_api.db.repositories.book import SEARCH_ORDERING, BookRepository
 from robust_library_api.db.repositories.author import AuthorRepository
 
 from robust_library_api.db.dao.exc import ForeignKeyViolation
+from robust_library_api.db.dao.filters import Filter
+
+from robust_library_api.settings import settings
 
 from robust_library_api.services.utils import (
     repository_fallback, 
-    model_row_to_dict
+    model_row_to_dict,
+    decode_sorted_cursor,
+    sort_value_type,
+    keyset_page,
+    model_partitions_to_dicts,
+    parse_fields,
+    parse_ids,
+    parse_include,
+    parse_sort,
+    project_row,
+    read_columns
 )
 
-from robust_library_api.db.models.author import AuthorModel
 from robust_library_api.db.models.book import BookModel
 
 from robust_library_api.services.book.exc import (
     BookNotFoundBookError,
     BookNotFoundAuthorError,
     BookNotFoundDeletedError,
+    BookIsbnAlreadyExistsError,
     BookServiceRepositoryError,
-    BookStillObtainsBorrowsError
+    BookStillObtainsBorrowsError,
+    BookVersionMismatchError
 )
 
+from robust_library_api.web.api.schema import BulkItemError
 from robust_library_api.web.api.books.schema import (
     ResponseBook,
+    ResponseBookBatch,
+    ResponseBookBulk,
     ResponseBookCount,
     ResponseBookList
 )
@@ -31,15 +50,13 @@ class BookService:
         self.author_repository: AuthorRepository = author_repository
         
     @repository_fallback(BookServiceRepositoryError)
-    async def _verify_extract_author(self, author_id: int) -> AuthorModel:
-        author_entity = await self.author_repository.get_author_by_id(author_id=author_id)
-        if not author_entity:
-            raise BookNotFoundAuthorError(author_id)
-        return author_entity
-
-    @repository_fallback(BookServiceRepositoryError)
-    async def _verify_extract_book(self, book_id: int) -> BookModel:
-        book_entity = await self.book_repository.get_book_by_id(book_id=book_id)
+    async def _verify_extract_book(
+        self, book_id: int, columns: Optional[list[str]] = None,
+        include: list[str] = (),
+    ) -> BookModel | dict:
+        book_entity = await self.book_repository.get_book_by_id(
+            book_id=book_id, columns=columns, include=include
+        )
         if not book_entity:
             raise BookNotFoundBookError(book_id)
         return book_entity
@@ -47,36 +64,252 @@ class BookService:
     @repository_fallback(BookServiceRepositoryError)
     async def book_creation(self, **book_creation_fields):
         author_id = book_creation_fields.get('author_id', None)
-        await self._verify_extract_author(author_id=author_id)
-        created_book = await self.book_repository.create_book(**book_creation_fields)
+        try:
+            created_book = await self.book_repository.create_book(**book_creation_fields)
+        except ForeignKeyViolation:
+            raise BookNotFoundAuthorError(author_id)
         return ResponseBook(
             message="Book created sucessfully.",
-            data=model_row_to_dict(created_book),
+            data=created_book,
+        )
+
+    async def _split_books_by_author_existence(
+        self, books_fields_by_index: dict[int, dict]
+    ) -> tuple[list[dict], list[BulkItemError]]:
+        existing_author_ids = await self.author_repository.existing_author_ids(
+            {fields["author_id"] for fields in books_fields_by_index.values()}
         )
+        valid_books_fields, errors = [], []
+        for index, fields in books_fields_by_index.items():
+            if fields["author_id"] in existing_author_ids:
+                valid_books_fields.append(fields)
+            else:
+                errors.append(BulkItemError(
+                    index=index,
+                    message=BookNotFoundAuthorError(fields["author_id"]).message,
+                ))
+        return valid_books_fields, errors
+
+    async def _split_books_by_isbn_uniqueness(
+        self, books_fields_by_index: dict[int, dict]
+    ) -> tuple[dict[int, dict], list[BulkItemError]]:
+        first_index_by_isbn: dict[str, int] = {}
+        for index, fields in books_fields_by_index.items():
+            if fields.get("isbn") is not None:
+                first_index_by_isbn.setdefault(fields["isbn"], index)
+        existing_isbns = await self.book_repository.existing_isbns(set(first_index_by_isbn))
+        unique_books_fields, errors = {}, []
+        for index, fields in books_fields_by_index.items():
+            isbn = fields.get("isbn")
+            if isbn in existing_isbns:
+                errors.append(BulkItemError(
+                    index=index, message=BookIsbnAlreadyExistsError(isbn).message,
+                ))
+            elif isbn is not None and first_index_by_isbn[isbn] != index:
+                errors.append(BulkItemError(
+                    index=index,
+                    message=f"Book with ISBN {isbn} duplicates item {first_index_by_isbn[isbn]}.",
+                ))
+            else:
+                unique_books_fields[index] = fields
+        return unique_books_fields, errors
 
     @repository_fallback(BookServiceRepositoryError)
-    async def all_books_list(self):
-        all_books = await self.book_repository.all_books()
+    async def bulk_book_creation(self, books_creation_fields: list[dict]):
+        """
+        Creates books, skipping and reporting by index books with missing
+        authors and books with ISBN already stored or taken by earlier item.
+        Book with the same ISBN stored concurrently still fails the whole batch.
+        """
+        unique_books_fields, isbn_errors = await self._split_books_by_isbn_uniqueness(
+            dict(enumerate(books_creation_fields))
+        )
+        books_to_create, errors = await self._split_books_by_author_existence(
+            unique_books_fields
+        )
+        errors = sorted(isbn_errors + errors, key=lambda error: error.index)
+        created_books = await self.book_repository.create_books(
+            books_to_create, chunk_size=settings.bulk_chunk_size
+        )
+        return ResponseBookBulk(
+            message=f"{len(created_books)} book(s) created, {len(errors)} failed.",
+            data=created_books,
+            errors=errors,
+        )
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def bulk_book_upsert(self, books_upsert_fields: list[dict]):
+        last_index_by_isbn = {
+            fields["isbn"]: index for index, fields in enumerate(books_upsert_fields)
+        }
+        duplicate_errors = [
+            BulkItemError(
+                index=index,
+                message=f"Book with ISBN {fields['isbn']} is overridden by item {last_index_by_isbn[fields['isbn']]}.",
+            )
+            for index, fields in enumerate(books_upsert_fields)
+            if last_index_by_isbn[fields["isbn"]] != index
+        ]
+        books_to_upsert, errors = await self._split_books_by_author_existence(
+            {
+                index: books_upsert_fields[index]
+                for index in sorted(last_index_by_isbn.values())
+            }
+        )
+        upserted_books = await self.book_repository.upsert_books_by_isbn(
+            books_to_upsert, chunk_size=settings.bulk_chunk_size
+        )
+        return ResponseBookBulk(
+            message=(
+                f"{len(upserted_books)} book(s) created or updated, "
+                f"{len(books_to_upsert) - len(upserted_books)} unchanged, "
+                f"{len(errors) + len(duplicate_errors)} failed."
+            ),
+            data=upserted_books,
+            errors=sorted(duplicate_errors + errors, key=lambda error: error.index),
+        )
+
+    @staticmethod
+    def _book_filters(
+        author_ids: Optional[list[int]] = None,
+        title_prefix: Optional[str] = None,
+        available: Optional[bool] = None,
+    ) -> list[Filter]:
+        filters = []
+        if author_ids:
+            filters.append(Filter("author_id", "in", author_ids))
+        if title_prefix:
+            filters.append(Filter("title", "prefix", title_prefix))
+        if available is not None:
+            filters.append(
+                Filter("remaining_amount", "gt", 0) if available
+                else Filter("remaining_amount", "eq", 0)
+            )
+        return filters
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def all_books_list(
+        self, cursor: Optional[str] = None,
+        limit: int = settings.pagination_default_limit,
+        fields: Optional[str] = None,
+        sort: Optional[str] = None,
+        include: Optional[str] = None,
+        **filter_params
+    ):
+        ordering = parse_sort(sort, self.book_repository.sortable_columns)
+        after_id, after_value = decode_sorted_cursor(
+            cursor, ordering, sort_value_type(BookModel, ordering)
+        )
+        columns = parse_fields(fields, self.book_repository.column_names, ordering)
+        include = parse_include(include, self.book_repository.includable_relationships)
+        columns = read_columns(columns, include, self.book_repository.column_names)
+        books = await self.book_repository.books_page(
+            after_id=after_id, after_value=after_value, limit=limit + 1,
+            columns=columns, include=include,
+            conditions=self._book_filters(**filter_params), ordering=ordering,
+        )
+        books_page, next_cursor = keyset_page(books, limit, ordering)
         return ResponseBookList(
             status="success",
             message="Books fetched successfully.",
-            data=[model_row_to_dict(book) for book in all_books],
+            data=[project_row(book, columns, include) for book in books_page],
+            next_cursor=next_cursor,
         )
     
     @repository_fallback(BookServiceRepositoryError)
-    async def obtain_book_information(self, book_id: int):
-        book_entity = await self._verify_extract_book(book_id=book_id)
+    async def all_books_stream(
+        self, cursor: Optional[str] = None, fields: Optional[str] = None,
+        sort: Optional[str] = None, include: Optional[str] = None,
+        **filter_params
+    ):
+        ordering = parse_sort(sort, self.book_repository.sortable_columns)
+        after_id, after_value = decode_sorted_cursor(
+            cursor, ordering, sort_value_type(BookModel, ordering)
+        )
+        columns = parse_fields(fields, self.book_repository.column_names, ordering)
+        include = parse_include(include, self.book_repository.includable_relationships)
+        columns = read_columns(columns, include, self.book_repository.column_names)
+        books_partitions = self.book_repository.books_stream(
+            after_id=after_id, after_value=after_value,
+            yield_per=settings.stream_yield_per,
+            columns=columns, include=include,
+            conditions=self._book_filters(**filter_params), ordering=ordering,
+        )
+        return model_partitions_to_dicts(books_partitions, columns, include)
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def books_search(
+        self, q: str, cursor: Optional[str] = None,
+        limit: int = settings.pagination_default_limit,
+        fields: Optional[str] = None,
+    ):
+        after_id, after_rank = decode_sorted_cursor(cursor, SEARCH_ORDERING, float)
+        books = await self.book_repository.search_books(
+            text=q, after_id=after_id, after_rank=after_rank, limit=limit + 1,
+            columns=parse_fields(fields, self.book_repository.column_names),
+        )
+        books_page, next_cursor = keyset_page(books, limit, SEARCH_ORDERING)
+        for book in books_page:
+            del book[SEARCH_ORDERING.column]
+        return ResponseBookList(
+            status="success",
+            message="Books found successfully.",
+            data=books_page,
+            next_cursor=next_cursor,
+        )
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def books_batch(
+        self, ids: str, fields: Optional[str] = None, include: Optional[str] = None
+    ) -> ResponseBookBatch:
+        book_ids = parse_ids(ids, settings.batch_max_ids)
+        columns = parse_fields(fields, self.book_repository.column_names)
+        include = parse_include(include, self.book_repository.includable_relationships)
+        columns = read_columns(columns, include, self.book_repository.column_names)
+        books = await self.book_repository.get_books_by_ids(
+            book_ids=book_ids, columns=columns, include=include
+        )
+        data = [project_row(book, columns, include) for book in books]
+        found_ids = {model_row_to_dict(book)["id"] for book in data}
+        return ResponseBookBatch(
+            message=f"{len(data)} book(s) fetched.",
+            data=data,
+            missing_ids=[book_id for book_id in book_ids if book_id not in found_ids],
+        )
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def books_count(self):
+        books_count = await self.book_repository.count_books()
+        return ResponseBookCount(
+            message=f"{books_count} book(s) found.",
+            data=books_count,
+        )
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def book_version(self, book_id: int) -> Optional[int]:
+        return await self.book_repository.get_book_version(book_id=book_id)
+
+    @repository_fallback(BookServiceRepositoryError)
+    async def obtain_book_information(
+        self, book_id: int, fields: Optional[str] = None,
+        include: Optional[str] = None,
+    ):
+        columns = parse_fields(fields, self.book_repository.column_names)
+        include = parse_include(include, self.book_repository.includable_relationships)
+        columns = read_columns(columns, include, self.book_repository.column_names)
+        book_entity = await self._verify_extract_book(
+            book_id=book_id, columns=columns, include=include,
+        )
         return ResponseBook(
             message="Book information fetched successfully.",
-            data=model_row_to_dict(book_entity),
+            data=project_row(book_entity, columns, include),
         )
     
     @repository_fallback(BookServiceRepositoryError)
     async def update_book_information(
-        self, book_id: int, **new_book_fields
-    ):
-        await self._verify_extract_book(book_id=book_id)
-        
+        self, book_id: int, expected_version: Optional[int] = None,
+        count_only: bool = False, **new_book_fields
+    ) -> ResponseBook | ResponseBookCount:
         author_id = new_book_fields.get('author_id', None)
         
         new_book_fields_without_nones = {
@@ -85,16 +318,27 @@ class BookService:
             if value is not None
         }
         
-        if author_id is not None:
-            await self._verify_extract_author(author_id=author_id)
+        try:
+            updated_book = await self.book_repository.update_book_by_id(
+                book_to_update_id=book_id, expected_version=expected_version,
+                **new_book_fields_without_nones
+            )
+        except ForeignKeyViolation:
+            raise BookNotFoundAuthorError(author_id)
         
-        update_count = await self.book_repository.update_book_by_id(
-            book_to_update_id=book_id, **new_book_fields_without_nones
-        )
+        if updated_book is None:
+            if expected_version is not None and await self.book_repository.is_book_exists(book_id=book_id):
+                raise BookVersionMismatchError(book_id, expected_version)
+            raise BookNotFoundBookError(book_id)
         
-        return ResponseBookCount(
-            message=f"{update_count} book(s) updated.",
-            data=update_count,
+        if count_only:
+            return ResponseBookCount(
+                message="1 book(s) updated.",
+                data=1,
+            )
+        return ResponseBook(
+            message="Book updated successfully.",
+            data=updated_book,
         )
 
     @repository_fallback(BookServiceRepositoryError)
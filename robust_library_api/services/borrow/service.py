@@ -1,14 +1,28 @@
 from datetime import date
+from typing import Optional
 
 from robust_library_api.db.repositories.borrow import BorrowRepository
 from robust_library_api.db.repositories.book import BookRepository
 
+from robust_library_api.db.dao.filters import Filter
+
+from robust_library_api.settings import settings
+
 from robust_library_api.services.utils import (
     repository_fallback, 
-    model_row_to_dict
+    model_row_to_dict,
+    decode_sorted_cursor,
+    sort_value_type,
+    keyset_page,
+    model_partitions_to_dicts,
+    parse_fields,
+    parse_ids,
+    parse_include,
+    parse_sort,
+    project_row,
+    read_columns
 )
 
-from robust_library_api.db.models.book import BookModel
 from robust_library_api.db.models.borrow import BorrowModel
 
 from robust_library_api.services.borrow.exc import (
@@ -21,6 +35,8 @@ from robust_library_api.services.borrow.exc import (
 
 from robust_library_api.web.api.borrows.schema import (
     ResponseBorrow,
+    ResponseBorrowBatch,
+    ResponseBorrowCount,
     ResponseBorrowList
 )
 
@@ -30,15 +46,13 @@ class BorrowService:
         self.book_repository: BookRepository = book_repository
         
     @repository_fallback(BorrowServiceRepositoryError)
-    async def _verify_extract_book(self, book_id: int) -> BookModel:
-        book_entity = await self.book_repository.get_book_by_id(book_id=book_id)
-        if not book_entity:
-            raise BorrowNotFoundBookError(book_id)
-        return book_entity
-
-    @repository_fallback(BorrowServiceRepositoryError)
-    async def _verify_extract_borrow(self, borrow_id: int) -> BorrowModel:
-        borrow_entity = await self.borrow_repository.get_borrow_by_id(borrow_id=borrow_id)
+    async def _verify_extract_borrow(
+        self, borrow_id: int, columns: Optional[list[str]] = None,
+        include: list[str] = (),
+    ) -> BorrowModel | dict:
+        borrow_entity = await self.borrow_repository.get_borrow_by_id(
+            borrow_id=borrow_id, columns=columns, include=include
+        )
         if not borrow_entity:
             raise BorrowNotFoundBorrowError(borrow_id)
         return borrow_entity
@@ -47,57 +61,146 @@ class BorrowService:
     async def borrow_creation(self, **borrow_creation_fields):
         book_id = borrow_creation_fields.get('book_id', None)
         
-        book_entity = await self._verify_extract_book(book_id=book_id)
-        
-        if book_entity.remaining_amount == 0:
-            raise BorrowBookExhaustedError(book_entity.id)
-        
-        book_entity.remaining_amount -= 1
-        
-        await self.book_repository.save(book_entity)
-        
-        created_borrow = await self.borrow_repository.create_borrow(
+        created_borrow = await self.borrow_repository.borrow_book(
             **borrow_creation_fields,
             date_of_issue=date.today()
         )
         
+        if created_borrow is None:
+            if await self.book_repository.is_book_exists(book_id=book_id):
+                raise BorrowBookExhaustedError(book_id)
+            raise BorrowNotFoundBookError(book_id)
+        
         return ResponseBorrow(
             message="Borrow created sucessfully.",
-            data=model_row_to_dict(created_borrow),
+            data=created_borrow,
         )
 
+    @staticmethod
+    def _borrow_filters(
+        open: Optional[bool] = None,
+        reader_name: Optional[str] = None,
+        book_ids: Optional[list[int]] = None,
+        issued_from: Optional[date] = None,
+        issued_to: Optional[date] = None,
+    ) -> list[Filter]:
+        filters = []
+        if open is not None:
+            filters.append(Filter("date_of_return", "isnull", open))
+        if reader_name is not None:
+            filters.append(Filter("reader_name", "eq", reader_name))
+        if book_ids:
+            filters.append(Filter("book_id", "in", book_ids))
+        if issued_from is not None or issued_to is not None:
+            filters.append(Filter("date_of_issue", "range", (issued_from, issued_to)))
+        return filters
+
     @repository_fallback(BorrowServiceRepositoryError)
-    async def all_borrows_list(self):
-        all_borrows = await self.borrow_repository.all_borrows()
+    async def all_borrows_list(
+        self, cursor: Optional[str] = None,
+        limit: int = settings.pagination_default_limit,
+        fields: Optional[str] = None,
+        sort: Optional[str] = None,
+        include: Optional[str] = None,
+        **filter_params
+    ):
+        ordering = parse_sort(sort, self.borrow_repository.sortable_columns)
+        after_id, after_value = decode_sorted_cursor(
+            cursor, ordering, sort_value_type(BorrowModel, ordering)
+        )
+        columns = parse_fields(fields, BorrowModel.__table__.columns.keys(), ordering)
+        include = parse_include(include, self.borrow_repository.includable_relationships)
+        columns = read_columns(columns, include, self.borrow_repository.column_names)
+        borrows = await self.borrow_repository.borrows_page(
+            after_id=after_id, after_value=after_value, limit=limit + 1,
+            columns=columns, include=include,
+            conditions=self._borrow_filters(**filter_params), ordering=ordering,
+        )
+        borrows_page, next_cursor = keyset_page(borrows, limit, ordering)
         return ResponseBorrowList(
             status="success",
             message="Borrows fetched successfully.",
-            data=[model_row_to_dict(borrow) for borrow in all_borrows],
+            data=[project_row(borrow, columns, include) for borrow in borrows_page],
+            next_cursor=next_cursor,
         )
     
     @repository_fallback(BorrowServiceRepositoryError)
-    async def obtain_borrow_information(self, borrow_id: int):
-        borrow_entity = await self._verify_extract_borrow(borrow_id=borrow_id)
+    async def all_borrows_stream(
+        self, cursor: Optional[str] = None, fields: Optional[str] = None,
+        sort: Optional[str] = None, include: Optional[str] = None,
+        **filter_params
+    ):
+        ordering = parse_sort(sort, self.borrow_repository.sortable_columns)
+        after_id, after_value = decode_sorted_cursor(
+            cursor, ordering, sort_value_type(BorrowModel, ordering)
+        )
+        columns = parse_fields(fields, BorrowModel.__table__.columns.keys(), ordering)
+        include = parse_include(include, self.borrow_repository.includable_relationships)
+        columns = read_columns(columns, include, self.borrow_repository.column_names)
+        borrows_partitions = self.borrow_repository.borrows_stream(
+            after_id=after_id, after_value=after_value,
+            yield_per=settings.stream_yield_per,
+            columns=columns, include=include,
+            conditions=self._borrow_filters(**filter_params), ordering=ordering,
+        )
+        return model_partitions_to_dicts(borrows_partitions, columns, include)
+
+    @repository_fallback(BorrowServiceRepositoryError)
+    async def borrows_batch(
+        self, ids: str, fields: Optional[str] = None, include: Optional[str] = None
+    ) -> ResponseBorrowBatch:
+        borrow_ids = parse_ids(ids, settings.batch_max_ids)
+        columns = parse_fields(fields, BorrowModel.__table__.columns.keys())
+        include = parse_include(include, self.borrow_repository.includable_relationships)
+        columns = read_columns(columns, include, self.borrow_repository.column_names)
+        borrows = await self.borrow_repository.get_borrows_by_ids(
+            borrow_ids=borrow_ids, columns=columns, include=include
+        )
+        data = [project_row(borrow, columns, include) for borrow in borrows]
+        found_ids = {model_row_to_dict(borrow)["id"] for borrow in data}
+        return ResponseBorrowBatch(
+            message=f"{len(data)} borrow(s) fetched.",
+            data=data,
+            missing_ids=[borrow_id for borrow_id in borrow_ids if borrow_id not in found_ids],
+        )
+
+    @repository_fallback(BorrowServiceRepositoryError)
+    async def borrows_count(self):
+        borrows_count = await self.borrow_repository.count_borrows()
+        return ResponseBorrowCount(
+            message=f"{borrows_count} borrow(s) found.",
+            data=borrows_count,
+        )
+
+    @repository_fallback(BorrowServiceRepositoryError)
+    async def borrow_version(self, borrow_id: int) -> Optional[int]:
+        return await self.borrow_repository.get_borrow_version(borrow_id=borrow_id)
+
+    @repository_fallback(BorrowServiceRepositoryError)
+    async def obtain_borrow_information(
+        self, borrow_id: int, fields: Optional[str] = None,
+        include: Optional[str] = None,
+    ):
+        columns = parse_fields(fields, BorrowModel.__table__.columns.keys())
+        include = parse_include(include, self.borrow_repository.includable_relationships)
+        columns = read_columns(columns, include, self.borrow_repository.column_names)
+        borrow_entity = await self._verify_extract_borrow(
+            borrow_id=borrow_id, columns=columns, include=include,
+        )
         return ResponseBorrow(
             message="Borrow information fetched successfully.",
-            data=model_row_to_dict(borrow_entity),
+            data=project_row(borrow_entity, columns, include),
         )
     
     @repository_fallback(BorrowServiceRepositoryError)
     async def close_borrow(self, borrow_id: int):
-        borrow_entity = await self._verify_extract_borrow(borrow_id=borrow_id)
-        
-        if borrow_entity.date_of_return is not None:
-            raise BorrowAlreadyClosedError(already_closed_borrow_id=borrow_id)
-        
-        book_entity = await self.book_repository.find_by_id(borrow_entity.book_id)
-        
-        book_entity.remaining_amount += 1
-        
-        await self.book_repository.save(book_entity)
-        
-        borrow_entity.date_of_return = date.today()
+        returned_book_id = await self.borrow_repository.return_book(
+            borrow_id=borrow_id, date_of_return=date.today()
+        )
         
-        await self.borrow_repository.save(borrow_entity)
+        if returned_book_id is None:
+            if await self.borrow_repository.is_borrow_exists(borrow_id=borrow_id):
+                raise BorrowAlreadyClosedError(already_closed_borrow_id=borrow_id)
+            raise BorrowNotFoundBorrowError(borrow_id)
         
-        return borrow_entity
\ No newline at end of file
+        return returned_book_id
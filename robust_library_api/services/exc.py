@@ -8,4 +8,39 @@ class ServiceError(BaseError):
     """Service layer specific exceptions."""
     
 class ServiceRepositoryError(BaseError):
-    """Service layer exceptions caused by repository errors."""
\ No newline at end of file
+    """Service layer exceptions caused by repository errors."""
+
+class ServiceRequestParameterError(ServiceError):
+    """Service layer exceptions caused by malformed request parameters."""
+
+class InvalidCursorError(ServiceRequestParameterError):
+    def __init__(self, cursor: str, **details):
+        super().__init__(f"Provided cursor {cursor!r} is malformed or expired.")
+
+class InvalidFieldsError(ServiceRequestParameterError):
+    def __init__(self, unknown_fields: list[str], allowed_fields: list[str], **details):
+        super().__init__(
+            f"Unknown field(s) {', '.join(unknown_fields)}, "
+            f"allowed fields are: {', '.join(allowed_fields)}."
+        )
+
+class InvalidSortError(ServiceRequestParameterError):
+    def __init__(self, sort: str, allowed_fields: list[str], **details):
+        super().__init__(
+            f"Can not sort by {sort!r}, allowed fields are: {', '.join(allowed_fields)} "
+            f"(prefixed with - for descending order)."
+        )
+
+class InvalidIdsError(ServiceRequestParameterError):
+    def __init__(self, ids: str, max_ids: int, **details):
+        super().__init__(
+            f"Provided ids {ids!r} are malformed, expected at most {max_ids} "
+            f"comma separated integers."
+        )
+
+class InvalidIncludeError(ServiceRequestParameterError):
+    def __init__(self, unknown: list[str], allowed: list[str], **details):
+        super().__init__(
+            f"Can not include {', '.join(unknown)}, "
+            f"allowed relationships are: {', '.join(allowed) or 'none'}."
+        )
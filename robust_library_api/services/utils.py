@@ -1,12 +1,62 @@
+import base64
+import binascii
+import json
 from functools import wraps
+from typing import Any, AsyncIterator, Iterable, List, Optional
+
+from sqlalchemy import Row
 
 from robust_library_api.db.dao.exc import CommonRepositoryError
+from robust_library_api.db.dao.filters import Ordering
+from robust_library_api.services.exc import (
+    InvalidCursorError, InvalidFieldsError, InvalidIdsError, InvalidIncludeError, InvalidSortError
+)
 
 def model_row_to_dict(author_row) -> dict:
+    if isinstance(author_row, dict):
+        return author_row
+    if isinstance(author_row, Row):
+        return dict(zip(author_row._fields, author_row))
     formatted_row = dict(author_row.__dict__)
     formatted_row.pop('_sa_instance_state', None)
+    # Loaded relationships are converted too
+    for key, value in formatted_row.items():
+        if isinstance(value, list):
+            formatted_row[key] = [model_row_to_dict(item) for item in value]
+        elif hasattr(value, '_sa_instance_state'):
+            formatted_row[key] = model_row_to_dict(value)
     return formatted_row
 
+def project_row(row, columns: Optional[List[str]] = None, include: Iterable[str] = ()):
+    """
+    Leaves only columns and included relationships of the row.
+    Row is returned as is if columns are not provided or nothing is included
+    (then it was read with these columns only).
+    """
+    if columns is None or not include:
+        return row
+    row = model_row_to_dict(row)
+    return {field: row[field] for field in [*columns, *include]}
+
+def read_columns(
+    columns: Optional[List[str]], include: Iterable[str], column_names: Iterable[str]
+) -> Optional[List[str]]:
+    """
+    Columns to read entities with. Without included relationships entities
+    are read as plain rows of all columns unless fields are requested,
+    ORM entities are loaded only to embed relationships into them.
+    """
+    if columns is None and not include:
+        return list(column_names)
+    return columns
+
+async def model_partitions_to_dicts(
+    partitions: AsyncIterator[list], columns: Optional[List[str]] = None,
+    include: Iterable[str] = (),
+) -> AsyncIterator[List[dict]]:
+    async for partition in partitions:
+        yield [model_row_to_dict(project_row(row, columns, include)) for row in partition]
+
 def repository_fallback(custom_exception: Exception, 
                         repository_error: Exception = CommonRepositoryError):
     def decorator(func):
@@ -17,4 +67,148 @@ def repository_fallback(custom_exception: Exception,
             except repository_error as e:
                 raise custom_exception
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def encode_cursor(
+    last_id: int, ordering: Optional[Ordering] = None, last_value: Any = None
+) -> str:
+    """
+    Builds opaque cursor pointing right after entity with provided id
+    (and value of the column the entities are sorted by).
+    """
+    payload = {"id": last_id}
+    if ordering is not None:
+        payload.update(sort=str(ordering), after=last_value)
+    payload = json.dumps(payload, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+def sort_value_type(model, ordering: Optional[Ordering]) -> Optional[type]:
+    """
+    Returns python type of the column entities are sorted by
+    (None if they are not sorted).
+    """
+    if ordering is None:
+        return None
+    return model.__table__.c[ordering.column].type.python_type
+
+def _is_of_type(value: Any, value_type: type) -> bool:
+    if isinstance(value, bool):
+        return value_type is bool
+    if value_type is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, value_type)
+
+def decode_sorted_cursor(
+    cursor: Optional[str], ordering: Optional[Ordering] = None,
+    value_type: Optional[type] = None,
+) -> tuple[Optional[int], Any]:
+    """
+    Extracts id of the last seen entity and value of the column
+    the entities are sorted by from opaque cursor.
+    Raises InvalidCursorError if cursor can not be decoded,
+    was issued for another sort order or its value is not of value_type.
+    """
+    if cursor is None:
+        return None, None
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        last_id = payload["id"]
+    except (binascii.Error, UnicodeError, ValueError, TypeError, KeyError):
+        raise InvalidCursorError(cursor)
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise InvalidCursorError(cursor)
+    if payload.get("sort") != (str(ordering) if ordering is not None else None):
+        raise InvalidCursorError(cursor)
+    after_value = payload.get("after")
+    if value_type is not None and not _is_of_type(after_value, value_type):
+        raise InvalidCursorError(cursor)
+    return last_id, after_value
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """
+    Extracts id of the last seen entity from opaque cursor of id ordered entities.
+    Raises InvalidCursorError if cursor can not be decoded.
+    """
+    return decode_sorted_cursor(cursor)[0]
+
+def keyset_page(
+    rows: list, limit: int, ordering: Optional[Ordering] = None
+) -> tuple[list, Optional[str]]:
+    """
+    Trims rows fetched with limit + 1 to page of limit size.
+    Returns page and cursor to the next page (None on the last page).
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    last_row = model_row_to_dict(page[-1])
+    if ordering is None:
+        return page, encode_cursor(last_row["id"])
+    return page, encode_cursor(last_row["id"], ordering, last_row[ordering.column])
+
+def parse_sort(sort: Optional[str], allowed_fields: Iterable[str]) -> Optional[Ordering]:
+    """
+    Parses sort parameter, e.g. "-remaining_amount" for descending order.
+    Returns None if sort is not provided.
+    Raises InvalidSortError if field is not allowed.
+    """
+    if sort is None:
+        return None
+    ordering = Ordering.parse(sort.strip())
+    allowed_fields = sorted(allowed_fields)
+    if ordering.column not in allowed_fields:
+        raise InvalidSortError(sort, allowed_fields)
+    return ordering
+
+def parse_fields(
+    fields: Optional[str], allowed_fields: Iterable[str],
+    ordering: Optional[Ordering] = None,
+) -> Optional[List[str]]:
+    """
+    Parses comma separated sparse fieldset into list of columns to select.
+    id and version (used for cursors and ETags) are always selected first,
+    column of ordering (used for cursors) is selected last.
+    Returns None if fields are not provided.
+    Raises InvalidFieldsError if any of fields is not allowed.
+    """
+    if fields is None:
+        return None
+    allowed_fields = list(allowed_fields)
+    requested_fields = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown_fields = [field for field in requested_fields if field not in allowed_fields]
+    if unknown_fields:
+        raise InvalidFieldsError(unknown_fields, allowed_fields)
+    always_selected = [field for field in ("id", "version") if field in allowed_fields]
+    sort_fields = [ordering.column] if ordering is not None else []
+    return list(dict.fromkeys([*always_selected, *requested_fields, *sort_fields]))
+
+def parse_include(include: Optional[str], allowed_relationships: Iterable[str]) -> List[str]:
+    """
+    Parses comma separated related entities to embed, e.g. "books".
+    Returns empty list if include is not provided.
+    Raises InvalidIncludeError if any of relationships is not allowed.
+    """
+    if include is None:
+        return []
+    allowed_relationships = sorted(allowed_relationships)
+    requested = [name.strip() for name in include.split(",") if name.strip()]
+    unknown = [name for name in requested if name not in allowed_relationships]
+    if unknown:
+        raise InvalidIncludeError(unknown, allowed_relationships)
+    return list(dict.fromkeys(requested))
+
+def parse_ids(ids: str, max_ids: int) -> List[int]:
+    """
+    Parses comma separated ids, e.g. "1,2,3", keeping their order
+    and dropping duplicates.
+    Raises InvalidIdsError if any of ids is not an integer
+    or there are none or more than max_ids of them.
+    """
+    try:
+        parsed_ids = [int(item) for item in ids.split(",") if item.strip()]
+    except ValueError:
+        raise InvalidIdsError(ids, max_ids)
+    parsed_ids = list(dict.fromkeys(parsed_ids))
+    if not parsed_ids or len(parsed_ids) > max_ids:
+        raise InvalidIdsError(ids, max_ids)
+    return parsed_ids
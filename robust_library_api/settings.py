@@ -1,7 +1,9 @@
 import enum
 from pathlib import Path
 from tempfile import gettempdir
+from typing import Dict, List
 
+from pydantic import BaseModel
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from yarl import URL
 
@@ -19,6 +21,16 @@ class LogLevel(str, enum.Enum):
     FATAL = "FATAL"
 
 
+class EntityCacheSettings(BaseModel):
+    """Read-through entity cache settings of a single model."""
+
+    # Max cached entities, 0 disables the cache
+    max_size: int = 0
+    # Seconds entity and missing id are cached for
+    ttl: float = 30.0
+    negative_ttl: float = 5.0
+
+
 class Settings(BaseSettings):
     """
     Application settings.
@@ -45,6 +57,55 @@ class Settings(BaseSettings):
     db_pass: str = "robust_library_api"
     db_base: str = "admin"
     db_echo: bool = False
+    # Connection pool of the database engine, connections beyond pool size
+    # (up to max overflow) are closed once returned
+    db_pool_size: int = 10
+    db_max_overflow: int = 10
+    # Seconds to wait for a free connection before failing
+    db_pool_timeout: float = 30.0
+    # Seconds after which connections are reopened, -1 keeps them forever
+    db_pool_recycle: int = 1800
+    # Check connections with a round trip on every checkout
+    db_pool_pre_ping: bool = False
+    # Open pool size connections on startup and prepare hot queries on them
+    db_pool_warmup: bool = True
+    # URLs of read replicas (postgresql+asyncpg://...), reads outside
+    # of transactions are spread over them round-robin
+    db_replica_urls: List[str] = []
+    # Seconds reads of a client go to the primary after its write,
+    # so it sees its own writes before replicas replay them
+    db_read_your_writes_seconds: float = 5.0
+
+    # Page size limits for list endpoints
+    pagination_default_limit: int = 50
+    pagination_max_limit: int = 500
+
+    # Bulk endpoints: max items per request and rows per INSERT statement
+    bulk_max_items: int = 10000
+    bulk_chunk_size: int = 500
+
+    # Max ids fetched at once by list endpoints with ids parameter
+    batch_max_ids: int = 100
+
+    # Rows fetched from server-side cursor at once by streaming list endpoints
+    stream_yield_per: int = 1000
+
+    # Amount of suggestions returned by typeahead endpoints
+    suggest_default_limit: int = 10
+    suggest_max_limit: int = 50
+
+    # Entity caches by model table name. Caches are per process and are only
+    # invalidated by writes made in it, so with several workers
+    # entities may be stale for up to ttl seconds.
+    entity_cache: Dict[str, EntityCacheSettings] = {
+        "author": EntityCacheSettings(max_size=1024),
+        "book": EntityCacheSettings(max_size=1024),
+        "borrow": EntityCacheSettings(max_size=1024),
+    }
+    # Encoded bodies of catalog list responses, keyed by query string
+    # and versions of tables they are built from. max_size 0 disables it
+    response_cache_max_size: int = 256
+    response_cache_ttl: float = 30.0
 
     @property
     def db_url(self) -> URL:
@@ -1,11 +1,15 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 from datetime import date
 
 from robust_library_api.web.api.schema import (
+    AuthorSchema,
     StandardSuccessResponse,
     StandardSuccessListResponse,
+    StandardSuccessPageResponse,
+    StandardSuccessBatchResponse,
+    StandardSuccessBulkResponse,
     StandardSuccessCountResponse,
     StandardFailResponse,
     StandardServiceRepositoryErrorResponse
@@ -24,11 +28,21 @@ class RequestAuthorUpdate(BaseModel):
     class Config:
         extra = "forbid"
 
-class ResponseAuthor(StandardSuccessResponse): ...
+class ResponseAuthor(StandardSuccessResponse):
+    data: Optional[AuthorSchema] = None
         
-class ResponseAuthorList(StandardSuccessListResponse): ...
+class ResponseAuthorList(StandardSuccessPageResponse):
+    data: Optional[List[AuthorSchema]] = None
+class ResponseAuthorBatch(StandardSuccessBatchResponse):
+    data: Optional[List[AuthorSchema]] = None
+class ResponseAuthorSuggestions(StandardSuccessListResponse):
+    data: Optional[List[AuthorSchema]] = None
+class ResponseAuthorBulk(StandardSuccessBulkResponse):
+    data: Optional[List[AuthorSchema]] = None
 class ResponseAuthorCount(StandardSuccessCountResponse): ...
 
 class ResponseAuthorNotFound(StandardFailResponse): ...
 class ResponseAuthorStillObtainsBooks(StandardFailResponse): ...
+class ResponseAuthorInvalidParameter(StandardFailResponse): ...
+class ResponseAuthorVersionMismatch(StandardFailResponse): ...
 class ResponseAuthorServiceRepositoryError(StandardServiceRepositoryErrorResponse): ...
\ No newline at end of file
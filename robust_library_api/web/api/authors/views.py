@@ -1,24 +1,47 @@
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, status
 
 from robust_library_api.services.author.service import AuthorService
 from robust_library_api.services.author.exc import (
     AuthorNotFoundError, 
     AuthorNotFoundDeletedError,
     AuthorServiceRepositoryError,
-    AuthorStillObtainsBooksError
+    AuthorStillObtainsBooksError,
+    AuthorVersionMismatchError
 )
 
 from robust_library_api.container.container import init_container
 
-from robust_library_api.web.api.utils import raise_http_exception_with_model_response
+from robust_library_api.services.exc import ServiceRequestParameterError
+
+from robust_library_api.settings import settings
+
+from robust_library_api.web.api.schema import StreamFormat
+
+from robust_library_api.web.api.utils import (
+    cached_json_response,
+    etag_json_response,
+    if_match_version,
+    json_response,
+    raise_http_exception_with_model_response,
+    streaming_list_response,
+    version_etag,
+    versioned_response
+)
 
 from robust_library_api.web.api.authors.schema import (
     RequestAuthorCreate,
     RequestAuthorUpdate,
     ResponseAuthor,
+    ResponseAuthorBulk,
     ResponseAuthorCount,
+    ResponseAuthorBatch,
     ResponseAuthorList,
+    ResponseAuthorSuggestions,
     ResponseAuthorNotFound,
+    ResponseAuthorInvalidParameter,
+    ResponseAuthorVersionMismatch,
     ResponseAuthorServiceRepositoryError,
     ResponseAuthorStillObtainsBooks,
 )
@@ -63,7 +86,10 @@ async def create_author(
     Creates new author.
     """
     try:
-        return await author_service.author_creation(**dict(data))
+        return json_response(
+            await author_service.author_creation(**dict(data)),
+            status_code=status.HTTP_201_CREATED,
+        )
     except AuthorServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -73,10 +99,56 @@ async def create_author(
         
 
 
+@router.post(
+    "/authors/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ResponseAuthorBulk,
+    responses={
+        201: {
+            "description": "Authors created successfully.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "2 author(s) created.",
+                        "data": [
+                            {"id": 1, "name": "John", "surname": "Doe", "birth_date": "1990-11-11"},
+                            {"id": 2, "name": "Jane", "surname": "Doe", "birth_date": "1991-11-11"},
+                        ],
+                        "errors": []
+                    }
+                }
+            },
+        },
+    },
+)
+async def create_authors_bulk(
+    data: List[RequestAuthorCreate] = Body(
+        ..., min_length=1, max_length=settings.bulk_max_items
+    ),
+    author_service: AuthorService = Depends(get_author_service),
+):
+    """
+    Creates many authors at once.
+    Authors are inserted in chunks, one statement per chunk.
+    """
+    try:
+        return json_response(
+            await author_service.bulk_author_creation([dict(author) for author in data]),
+            status_code=status.HTTP_201_CREATED,
+        )
+    except AuthorServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseAuthorServiceRepositoryError
+        )
+
+
 @router.get(
     "/authors",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseAuthorList,
+    response_model=Union[ResponseAuthorList, ResponseAuthorBatch],
     responses={
         200: {
             "description": "List of authors fetched successfully.",
@@ -85,6 +157,7 @@ async def create_author(
                     "example": {
                         "status": "success",
                         "message": "Authors fetched successfully.",
+                        "next_cursor": "eyJpZCI6MX0=",
                         "data": [
                             {"id": 1, "name": "John", "surname": "Doe", "birth_date": "11.11.990"},
                         ]
@@ -94,12 +167,150 @@ async def create_author(
         },
     },
 )
-async def list_authors(author_service: AuthorService = Depends(get_author_service)):
+async def list_authors(
+    request: Request,
+    cursor: Optional[str] = Query(
+        default=None, description="Opaque cursor from previous page next_cursor."
+    ),
+    limit: int = Query(
+        default=settings.pagination_default_limit,
+        ge=1, le=settings.pagination_max_limit,
+    ),
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    stream: Optional[StreamFormat] = Query(
+        default=None,
+        description="Stream all authors after cursor as JSON array or NDJSON, limit is ignored.",
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into every author: "books".'
+    ),
+    ids: Optional[str] = Query(
+        default=None,
+        description=f'Comma separated ids of authors to fetch at once (at most {settings.batch_max_ids}), e.g. "1,2,3". '
+        'Only fields and include apply to them.',
+    ),
+    author_service: AuthorService = Depends(get_author_service),
+):
     """
-    Returns all authors in list.
+    Returns page of authors ordered by id.
+    Next page is requested with cursor from next_cursor field of the response,
+    next_cursor is null on the last page.
+    With stream set, returns all authors after cursor written to the response
+    as they are read from the database (JSON array or NDJSON) instead of a page.
+    With include=books, books of every author are embedded, loaded
+    with one additional query for the whole page.
+    Pages are served from in-process cache until authors (or included books)
+    are changed.
+    With ids set, returns authors with these ids in the same order fetched
+    with single query, ids of missing authors are listed in missing_ids.
+    Page has ETag of its body, if it matches If-None-Match returns 304.
+    If cursor is malformed, fields or include are unknown,
+    or ids are malformed or too many, returns 400.
     """
     try:
-        return await author_service.all_authors_list()
+        if ids is not None:
+            return await cached_json_response(
+                request, tables=("author", "book") if include else ("author",),
+                build_response=lambda: author_service.authors_batch(
+                    ids=ids, fields=fields, include=include
+                ),
+            )
+        if stream is not None:
+            return streaming_list_response(
+                await author_service.all_authors_stream(
+                    cursor=cursor, fields=fields, include=include
+                ),
+                stream,
+            )
+        return await cached_json_response(
+            request, tables=("author", "book") if include else ("author",),
+            build_response=lambda: author_service.all_authors_list(
+                cursor=cursor, limit=limit, fields=fields, include=include
+            ),
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseAuthorInvalidParameter
+        )
+    except AuthorServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseAuthorServiceRepositoryError
+        )
+
+
+@router.get(
+    "/authors/suggest",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseAuthorSuggestions,
+    responses={
+        200: {
+            "description": "Authors with name or surname starting with prefix.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "1 author(s) suggested.",
+                        "data": [
+                            {
+                                "id": 1,
+                                "name": "John",
+                                "surname": "Doe"
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+    },
+)
+async def suggest_authors(
+    prefix: str = Query(
+        min_length=1, max_length=200,
+        description="Beginning of author name, surname or full name, case insensitive.",
+    ),
+    limit: int = Query(
+        default=settings.suggest_default_limit,
+        ge=1, le=settings.suggest_max_limit,
+    ),
+    author_service: AuthorService = Depends(get_author_service),
+):
+    """
+    Returns authors for typeahead, served from in-process index of author names
+    without querying the database.
+    """
+    return json_response(author_service.author_suggestions(prefix=prefix, limit=limit))
+
+@router.get(
+    "/authors/count",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseAuthorCount,
+    responses={
+        200: {
+            "description": "Authors counted successfully.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "42 author(s) found.",
+                        "data": 42
+                    }
+                }
+            },
+        },
+    },
+)
+async def count_authors(author_service: AuthorService = Depends(get_author_service)):
+    """
+    Returns total amount of authors.
+    """
+    try:
+        return json_response(await author_service.authors_count())
     except AuthorServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -146,14 +357,44 @@ async def list_authors(author_service: AuthorService = Depends(get_author_servic
     },
 )
 async def get_author_info(
-    id: int, author_service: AuthorService = Depends(get_author_service)
+    id: int,
+    request: Request,
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into the author: "books".'
+    ),
+    author_service: AuthorService = Depends(get_author_service)
 ): 
     """
     Gathers information about sepcific author by related id.
     If no author found with provided id, returns 404.
+    Response has ETag of author version, if it matches If-None-Match
+    returns 304 without loading the author.
+    With include=books, books of the author are embedded and ETag
+    is of the response body, as author version does not change with its books.
+    If fields or include are unknown, returns 400.
     """
+    def build_response():
+        return author_service.obtain_author_information(
+            author_id=id, fields=fields, include=include
+        )
+
     try:
-        return await author_service.obtain_author_information(author_id=id)
+        if include:
+            return await etag_json_response(request, build_response)
+        return await versioned_response(
+            request,
+            get_version=lambda: author_service.author_version(author_id=id),
+            build_response=build_response,
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseAuthorInvalidParameter
+        )
     except AuthorNotFoundError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -170,7 +411,7 @@ async def get_author_info(
 @router.put(
     "/authors/{id}",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseAuthorCount,
+    response_model=Union[ResponseAuthor, ResponseAuthorCount],
     responses={
         200: {
             "description": "Author information updated successfully.",
@@ -178,8 +419,14 @@ async def get_author_info(
                 "application/json": {
                     "example": {
                         "status": "success",
-                        "message": "1 author(s) updated successfully.",
-                        "data": 1
+                        "message": "Author updated successfully.",
+                        "data": {
+                            "id": 1,
+                            "name": "John",
+                            "surname": "Doe",
+                            "birth_date": "1980-01-01",
+                            "version": 2
+                        }
                     }
                 }
             },
@@ -197,27 +444,61 @@ async def get_author_info(
                 }
             },
         },
+        412: {
+            "description": "Author was modified since provided version.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": {
+                            "status": "fail",
+                            "message": "Author with ID 42 was modified: version 3 is outdated."
+                        }
+                    }
+                }
+            },
+        },
     },
 )
 async def update_author(
     id: int,
     new_author_fields: RequestAuthorUpdate,
+    if_match: Optional[str] = Header(
+        default=None, description='ETag of the author version the update is based on, e.g. "3".'
+    ),
+    count_only: bool = Query(
+        default=False, description="Respond with the count of updated authors instead of the updated author."
+    ),
     author_service: AuthorService = Depends(get_author_service),
 ):
     """
     Updates author entry with provided fields.
     If no author found with provided id, returns 404.
+    With If-Match, author is updated only if its version still matches,
+    otherwise returns 412.
+    Responds with the updated author and its ETag,
+    or with the count of updated authors if count_only is set.
     """
     try:
-        return await author_service.update_author_information(
-            author_id=id, **dict(new_author_fields)
+        result = await author_service.update_author_information(
+            author_id=id, expected_version=if_match_version(if_match),
+            count_only=count_only,
+            **dict(new_author_fields)
         )
+        if isinstance(result, ResponseAuthor):
+            return json_response(result, headers={"ETag": version_etag(result.data.version)})
+        return json_response(result)
     except AuthorNotFoundError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
             status=status.HTTP_404_NOT_FOUND,
             response_model=ResponseAuthorNotFound      
         )
+    except AuthorVersionMismatchError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_412_PRECONDITION_FAILED,
+            response_model=ResponseAuthorVersionMismatch
+        )
     except AuthorServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -259,7 +540,8 @@ async def update_author(
     },
 )
 async def delete_author(
-    id: int, author_service: AuthorService = Depends(get_author_service)
+    id: int,
+    author_service: AuthorService = Depends(get_author_service)
 ):
     """
     Deletes an author from database.
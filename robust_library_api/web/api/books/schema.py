@@ -1,9 +1,12 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 
 from robust_library_api.web.api.schema import (
+    BookSchema,
     StandardSuccessResponse,
-    StandardSuccessListResponse,
+    StandardSuccessPageResponse,
+    StandardSuccessBatchResponse,
+    StandardSuccessBulkResponse,
     StandardSuccessCountResponse,
     StandardFailResponse,
     StandardServiceRepositoryErrorResponse
@@ -15,19 +18,33 @@ class RequestBookCreate(BaseModel):
     author_id: int = Field(...)
     remaining_amount: int = Field(..., gt=0)
 
+class RequestBookBulkCreate(RequestBookCreate):
+    isbn: Optional[str] = Field(default=None, min_length=1, max_length=20)
+
+class RequestBookUpsert(RequestBookCreate):
+    isbn: str = Field(..., min_length=1, max_length=20)
+
 class RequestBookUpdate(BaseModel):
     title: Optional[str] = Field(default=None, max_length=200)
     description: Optional[str] = Field(default=None, max_length=1024)
     author_id: Optional[int] = Field(default=None)
     remaining_amount: Optional[int] = Field(default=None, gt=0, le=20000)
 
-class ResponseBook(StandardSuccessResponse): ...
+class ResponseBook(StandardSuccessResponse):
+    data: Optional[BookSchema] = None
 
-class ResponseBookList(StandardSuccessListResponse): ...
+class ResponseBookList(StandardSuccessPageResponse):
+    data: Optional[List[BookSchema]] = None
+class ResponseBookBatch(StandardSuccessBatchResponse):
+    data: Optional[List[BookSchema]] = None
+class ResponseBookBulk(StandardSuccessBulkResponse):
+    data: Optional[List[BookSchema]] = None
 class ResponseBookCount(StandardSuccessCountResponse): ...
 
 class ResponseBookNotFoundBook(StandardFailResponse): ...
 class ResponseBookNotFoundAuthor(StandardFailResponse): ...
 class ResponseBookStillObtainsBorrowsError(StandardFailResponse): ...
+class ResponseBookInvalidParameter(StandardFailResponse): ...
+class ResponseBookVersionMismatch(StandardFailResponse): ...
 
 class ResponseBookServiceRepositoryError(StandardServiceRepositoryErrorResponse): ...
\ No newline at end of file
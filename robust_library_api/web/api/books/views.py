@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, status
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Body, Depends, Header, Query, Request, status
 
 from robust_library_api.container.container import init_container
 
+from robust_library_api.services.exc import ServiceRequestParameterError
+
+from robust_library_api.settings import settings
+
 from robust_library_api.services.book.service import BookService
 
 from robust_library_api.services.book.exc import (
@@ -9,20 +15,38 @@ from robust_library_api.services.book.exc import (
     BookNotFoundAuthorError,
     BookNotFoundBookError,
     BookNotFoundDeletedError,
-    BookStillObtainsBorrowsError
+    BookStillObtainsBorrowsError,
+    BookVersionMismatchError
 )
 
 
-from robust_library_api.web.api.utils import raise_http_exception_with_model_response
+from robust_library_api.web.api.schema import StreamFormat
+
+from robust_library_api.web.api.utils import (
+    cached_json_response,
+    etag_json_response,
+    if_match_version,
+    json_response,
+    raise_http_exception_with_model_response,
+    streaming_list_response,
+    version_etag,
+    versioned_response
+)
 
 from robust_library_api.web.api.books.schema import (
     RequestBookCreate, 
+    RequestBookBulkCreate,
     RequestBookUpdate,
+    RequestBookUpsert,
     ResponseBook,
+    ResponseBookBulk,
     ResponseBookCount,
+    ResponseBookBatch,
     ResponseBookList,
     ResponseBookNotFoundBook,
     ResponseBookNotFoundAuthor,
+    ResponseBookInvalidParameter,
+    ResponseBookVersionMismatch,
     ResponseBookServiceRepositoryError,
     ResponseBookStillObtainsBorrowsError
 )
@@ -66,7 +90,10 @@ async def create_book(
 ):
     """Creates a book entity related to author."""
     try:
-        return await book_service.book_creation(**dict(data))
+        return json_response(
+            await book_service.book_creation(**dict(data)),
+            status_code=status.HTTP_201_CREATED,
+        )
     except BookNotFoundAuthorError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -82,10 +109,118 @@ async def create_book(
         
 
 
+@router.post(
+    "/books/bulk",
+    status_code=status.HTTP_201_CREATED,
+    response_model=ResponseBookBulk,
+    responses={
+        201: {
+            "description": "Books created, failed items are reported in errors.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "1 book(s) created, 1 failed.",
+                        "data": [
+                            {
+                                "title": "The Hitchhiker’s Guide to the Galaxy",
+                                "description": "42",
+                                "author_id": 1,
+                                "remaining_amount": 50,
+                                "id": 4
+                            }
+                        ],
+                        "errors": [
+                            {"index": 1, "message": "Author with ID 42 not found."}
+                        ]
+                    }
+                }
+            },
+        },
+    },
+)
+async def create_books_bulk(
+    data: List[RequestBookBulkCreate] = Body(
+        ..., min_length=1, max_length=settings.bulk_max_items
+    ),
+    book_service: BookService = Depends(get_book_service),
+):
+    """
+    Creates many books at once.
+    Authors of all books are verified with single query,
+    books with missing authors are skipped and reported in errors by their index,
+    as well as books with ISBN already stored or repeated in the batch.
+    Remaining books are inserted in chunks, one statement per chunk.
+    """
+    try:
+        return json_response(
+            await book_service.bulk_book_creation([dict(book) for book in data]),
+            status_code=status.HTTP_201_CREATED,
+        )
+    except BookServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseBookServiceRepositoryError
+        )
+
+@router.put(
+    "/books/bulk",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBookBulk,
+    responses={
+        200: {
+            "description": "Books synchronized, failed items are reported in errors.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "1 book(s) created or updated, 1 unchanged, 0 failed.",
+                        "data": [
+                            {
+                                "title": "The Hitchhiker’s Guide to the Galaxy",
+                                "description": "42",
+                                "author_id": 1,
+                                "remaining_amount": 50,
+                                "isbn": "9780345391803",
+                                "id": 4
+                            }
+                        ],
+                        "errors": []
+                    }
+                }
+            },
+        },
+    },
+)
+async def upsert_books_bulk(
+    data: List[RequestBookUpsert] = Body(
+        ..., min_length=1, max_length=settings.bulk_max_items
+    ),
+    book_service: BookService = Depends(get_book_service),
+):
+    """
+    Idempotently synchronizes books with external catalog by ISBN.
+    Books with unknown ISBN are created, known ones are updated in place,
+    except remaining amount: it is set only for created books, as copies
+    of stored ones may be lent out.
+    Books equal to stored ones are left untouched and are not returned.
+    Books with missing authors and earlier duplicates of the same ISBN
+    are skipped and reported in errors by their index.
+    """
+    try:
+        return json_response(await book_service.bulk_book_upsert([dict(book) for book in data]))
+    except BookServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseBookServiceRepositoryError
+        )
+
 @router.get(
     "/books",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseBookList,
+    response_model=Union[ResponseBookList, ResponseBookBatch],
     responses={
         200: {
             "description": "List of books fetched successfully.",
@@ -94,6 +229,7 @@ async def create_book(
                     "example": {
                     "status": "success",
                     "message": "Books fetched successfully.",
+                    "next_cursor": "eyJpZCI6MX0=",
                     "data": [
                         {
                         "author_id": 1,
@@ -109,10 +245,191 @@ async def create_book(
         },
     },
 )
-async def list_books(book_service: BookService = Depends(get_book_service)):
-    """Returns all books in a list."""
+async def list_books(
+    request: Request,
+    cursor: Optional[str] = Query(
+        default=None, description="Opaque cursor from previous page next_cursor."
+    ),
+    limit: int = Query(
+        default=settings.pagination_default_limit,
+        ge=1, le=settings.pagination_max_limit,
+    ),
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    stream: Optional[StreamFormat] = Query(
+        default=None,
+        description="Stream all books after cursor as JSON array or NDJSON, limit is ignored.",
+    ),
+    author_id: Optional[List[int]] = Query(
+        default=None, description="Only books of the author(s), may be repeated."
+    ),
+    title_prefix: Optional[str] = Query(default=None, description="Only books with title starting with the prefix."),
+    available: Optional[bool] = Query(
+        default=None, description="Only books with copies left (true) or only exhausted ones (false)."
+    ),
+    sort: Optional[str] = Query(
+        default=None, description='Field to sort by: id, title or remaining_amount, prefixed with "-" for descending order.'
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into every book: "author".'
+    ),
+    ids: Optional[str] = Query(
+        default=None,
+        description=f'Comma separated ids of books to fetch at once (at most {settings.batch_max_ids}), e.g. "1,2,3". '
+        'Only fields and include apply to them.',
+    ),
+    book_service: BookService = Depends(get_book_service),
+):
+    """
+    Returns page of books ordered by id, or by sort field and then id.
+    Books may be filtered by authors, title prefix and availability.
+    Next page is requested with cursor from next_cursor field of the response,
+    next_cursor is null on the last page.
+    With stream set, returns all books after cursor written to the response
+    as they are read from the database (JSON array or NDJSON) instead of a page.
+    With include=author, author of every book is embedded, loaded
+    with one additional query for the whole page.
+    Pages are served from in-process cache until books (or included authors)
+    are changed.
+    With ids set, returns books with these ids in the same order fetched
+    with single query, ids of missing books are listed in missing_ids.
+    Page has ETag of its body, if it matches If-None-Match returns 304.
+    If cursor is malformed or issued for another sort, or fields, sort
+    or include are unknown, or ids are malformed or too many, returns 400.
+    """
+    list_params = dict(
+        cursor=cursor, fields=fields, sort=sort, include=include,
+        author_ids=author_id, title_prefix=title_prefix, available=available,
+    )
     try:
-        return await book_service.all_books_list()
+        if ids is not None:
+            return await cached_json_response(
+                request, tables=("book", "author") if include else ("book",),
+                build_response=lambda: book_service.books_batch(
+                    ids=ids, fields=fields, include=include
+                ),
+            )
+        if stream is not None:
+            return streaming_list_response(
+                await book_service.all_books_stream(**list_params), stream
+            )
+        return await cached_json_response(
+            request, tables=("book", "author") if include else ("book",),
+            build_response=lambda: book_service.all_books_list(
+                limit=limit, **list_params
+            ),
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseBookInvalidParameter
+        )
+    except BookServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseBookServiceRepositoryError
+        )
+
+@router.get(
+    "/books/search",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBookList,
+    responses={
+        200: {
+            "description": "Books matching the query, best matches first.",
+            "content": {
+                "application/json": {
+                    "example": {
+                    "status": "success",
+                    "message": "Books found successfully.",
+                    "next_cursor": "eyJpZCI6MSwic29ydCI6LXJhbmsiLCJhZnRlciI6MC4xfQ==",
+                    "data": [
+                        {
+                        "author_id": 1,
+                        "id": 1,
+                        "title": "sample_book_title",
+                        "description": "string",
+                        "remaining_amount": 8
+                        }
+                    ]
+                    }
+                }
+            },
+        },
+    },
+)
+async def search_books(
+    request: Request,
+    q: str = Query(
+        min_length=1, max_length=200,
+        description='Words to search in titles and descriptions, supports "quoted phrases", or and -excluded words.',
+    ),
+    cursor: Optional[str] = Query(
+        default=None, description="Opaque cursor from previous page next_cursor."
+    ),
+    limit: int = Query(
+        default=settings.pagination_default_limit,
+        ge=1, le=settings.pagination_max_limit,
+    ),
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    book_service: BookService = Depends(get_book_service),
+):
+    """
+    Returns page of books with title or description matching the query,
+    ordered by relevance (title matches rank higher than description ones).
+    Next page is requested with cursor from next_cursor field of the response,
+    next_cursor is null on the last page.
+    Pages are served from in-process cache until books are changed.
+    If cursor is malformed or fields are unknown, returns 400.
+    """
+    try:
+        return await cached_json_response(
+            request, tables=("book",),
+            build_response=lambda: book_service.books_search(
+                q=q, cursor=cursor, limit=limit, fields=fields
+            ),
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseBookInvalidParameter
+        )
+    except BookServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseBookServiceRepositoryError
+        )
+
+@router.get(
+    "/books/count",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBookCount,
+    responses={
+        200: {
+            "description": "Books counted successfully.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "42 book(s) found.",
+                        "data": 42
+                    }
+                }
+            },
+        },
+    },
+)
+async def count_books(book_service: BookService = Depends(get_book_service)):
+    """Returns total amount of books."""
+    try:
+        return json_response(await book_service.books_count())
     except BookServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -159,14 +476,44 @@ async def list_books(book_service: BookService = Depends(get_book_service)):
     },
 )
 async def get_book_info(
-    id: int, book_service: BookService = Depends(get_book_service)
+    id: int,
+    request: Request,
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into the book: "author".'
+    ),
+    book_service: BookService = Depends(get_book_service)
 ):
     """
     Returns book rows by its id.
     If id does not match with any existing books, returns 404.
+    Response has ETag of book version, if it matches If-None-Match
+    returns 304 without loading the book.
+    With include=author, author of the book is embedded and ETag
+    is of the response body, as book version does not change with its author.
+    If fields or include are unknown, returns 400.
     """
+    def build_response():
+        return book_service.obtain_book_information(
+            id, fields=fields, include=include
+        )
+
     try:
-        return await book_service.obtain_book_information(id)
+        if include:
+            return await etag_json_response(request, build_response)
+        return await versioned_response(
+            request,
+            get_version=lambda: book_service.book_version(book_id=id),
+            build_response=build_response,
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseBookInvalidParameter
+        )
     except BookNotFoundBookError as e:
         raise raise_http_exception_with_model_response(
             exc_from=e,
@@ -184,7 +531,7 @@ async def get_book_info(
 @router.put(
     "/books/{id}",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseBookCount,
+    response_model=Union[ResponseBook, ResponseBookCount],
     responses={
         200: {
             "description": "Book information updated successfully.",
@@ -192,8 +539,16 @@ async def get_book_info(
                 "application/json": {
                     "example": {
                         "status": "success",
-                        "message": "1 book updated successfully.",
-                        "data": 1
+                        "message": "Book updated successfully.",
+                        "data": {
+                            "id": 1,
+                            "title": "Revised Title",
+                            "description": "Revised description.",
+                            "author_id": 1,
+                            "remaining_amount": 5,
+                            "isbn": None,
+                            "version": 2
+                        }
                     }
                 }
             },
@@ -225,22 +580,50 @@ async def get_book_info(
                 }
             },
         },
+        412: {
+            "description": "Book was modified since provided version.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": {
+                            "status": "fail",
+                            "message": "Book with ID 42 was modified: version 3 is outdated."
+                        }
+                    }
+                }
+            },
+        },
     },
 )
 async def update_book(
     id: int,
     new_book_fields: RequestBookUpdate,
+    if_match: Optional[str] = Header(
+        default=None, description='ETag of the book version the update is based on, e.g. "3".'
+    ),
+    count_only: bool = Query(
+        default=False, description="Respond with the count of updated books instead of the updated book."
+    ),
     book_service: BookService = Depends(get_book_service),
 ):
     """
     Attempts in updating provided book fields.
     If no book with provided id exists, returns 404.
     If no author with provided author_id exists, return 400.
+    With If-Match, book is updated only if its version still matches,
+    otherwise returns 412.
+    Responds with the updated book and its ETag,
+    or with the count of updated books if count_only is set.
     """
     try:
-        return await book_service.update_book_information(
-            id, **dict(new_book_fields)
+        result = await book_service.update_book_information(
+            id, expected_version=if_match_version(if_match),
+            count_only=count_only,
+            **dict(new_book_fields)
         )
+        if isinstance(result, ResponseBook):
+            return json_response(result, headers={"ETag": version_etag(result.data.version)})
+        return json_response(result)
     except BookNotFoundBookError as e:
         raise raise_http_exception_with_model_response(
             exc_from=e,
@@ -253,6 +636,12 @@ async def update_book(
             status=status.HTTP_400_BAD_REQUEST,
             response_model=ResponseBookNotFoundAuthor
         )
+    except BookVersionMismatchError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_412_PRECONDITION_FAILED,
+            response_model=ResponseBookVersionMismatch
+        )
     except BookServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -293,7 +682,8 @@ async def update_book(
     },
 )
 async def delete_book(
-    id: int, book_service: BookService = Depends(get_book_service)
+    id: int,
+    book_service: BookService = Depends(get_book_service)
 ):
     """
     Attempts to delete a book by its id.
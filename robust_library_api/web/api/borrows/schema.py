@@ -1,8 +1,12 @@
 from pydantic import BaseModel, Field
+from typing import List, Optional
 
 from robust_library_api.web.api.schema import (
+    BorrowSchema,
     StandardSuccessResponse,
-    StandardSuccessListResponse,
+    StandardSuccessPageResponse,
+    StandardSuccessBatchResponse,
+    StandardSuccessCountResponse,
     StandardFailResponse,
     StandardServiceRepositoryErrorResponse
 )
@@ -11,12 +15,18 @@ class RequestBorrowCreate(BaseModel):
     book_id: int = Field(...)
     reader_name: str = Field(..., max_length=200)
 
-class ResponseBorrow(StandardSuccessResponse): ...
+class ResponseBorrow(StandardSuccessResponse):
+    data: Optional[BorrowSchema] = None
 
-class ResponseBorrowList(StandardSuccessListResponse): ...
+class ResponseBorrowList(StandardSuccessPageResponse):
+    data: Optional[List[BorrowSchema]] = None
+class ResponseBorrowBatch(StandardSuccessBatchResponse):
+    data: Optional[List[BorrowSchema]] = None
+class ResponseBorrowCount(StandardSuccessCountResponse): ...
 
 class ResponseBorrowNotFoundBorrow(StandardFailResponse): ...
 class ResponseBorrowNotFoundBook(StandardFailResponse): ...
 class ResponseBorrowBookExhausted(StandardFailResponse): ...
 class ResponseBorrowAlreadyClosed(StandardFailResponse): ...
+class ResponseBorrowInvalidParameter(StandardFailResponse): ...
 class ResponseBorrowServiceRepositoryError(StandardServiceRepositoryErrorResponse): ...
\ No newline at end of file
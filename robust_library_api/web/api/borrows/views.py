@@ -1,7 +1,14 @@
-from fastapi import APIRouter, Depends, status
+from datetime import date
+from typing import List, Optional, Union
+
+from fastapi import APIRouter, Depends, Query, Request, status
 
 from robust_library_api.container.container import init_container
 
+from robust_library_api.services.exc import ServiceRequestParameterError
+
+from robust_library_api.settings import settings
+
 from robust_library_api.services.borrow.service import BorrowService
 
 from robust_library_api.services.borrow.exc import (
@@ -13,16 +20,27 @@ from robust_library_api.services.borrow.exc import (
 )
 
 
-from robust_library_api.web.api.utils import raise_http_exception_with_model_response
+from robust_library_api.web.api.schema import StreamFormat
+
+from robust_library_api.web.api.utils import (
+    etag_json_response,
+    json_response,
+    raise_http_exception_with_model_response,
+    streaming_list_response,
+    versioned_response
+)
 
 from robust_library_api.web.api.borrows.schema import (
     RequestBorrowCreate, 
     ResponseBorrow,
+    ResponseBorrowCount,
+    ResponseBorrowBatch,
     ResponseBorrowList,
     ResponseBorrowNotFoundBorrow,
     ResponseBorrowNotFoundBook,
     ResponseBorrowBookExhausted,
     ResponseBorrowAlreadyClosed,
+    ResponseBorrowInvalidParameter,
     ResponseBorrowServiceRepositoryError,
 )
 
@@ -95,7 +113,10 @@ async def create_borrow(
     Returns 400 if related book balance is exhausted(equals 0).
     """
     try:
-        return await borrow_service.borrow_creation(**dict(data))
+        return json_response(
+            await borrow_service.borrow_creation(**dict(data)),
+            status_code=status.HTTP_201_CREATED,
+        )
     except BorrowNotFoundBookError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -120,7 +141,7 @@ async def create_borrow(
 @router.get(
     "/borrows",
     status_code=status.HTTP_200_OK,
-    response_model=ResponseBorrowList,
+    response_model=Union[ResponseBorrowList, ResponseBorrowBatch],
     responses={
         200: {
             "description": "List of borrows fetched successfully.",
@@ -129,6 +150,7 @@ async def create_borrow(
                     "example": {
                         "status": "success",
                         "message": "Borrows fetched successfully.",
+                        "next_cursor": "eyJpZCI6MX0=",
                         "data": [
                     {
                         "date_of_issue": "2024-12-11",
@@ -151,12 +173,120 @@ async def create_borrow(
         },
     },
 )
-async def list_borrows(borrow_service: BorrowService = Depends(get_borrow_service)):
+async def list_borrows(
+    request: Request,
+    cursor: Optional[str] = Query(
+        default=None, description="Opaque cursor from previous page next_cursor."
+    ),
+    limit: int = Query(
+        default=settings.pagination_default_limit,
+        ge=1, le=settings.pagination_max_limit,
+    ),
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    stream: Optional[StreamFormat] = Query(
+        default=None,
+        description="Stream all borrows after cursor as JSON array or NDJSON, limit is ignored.",
+    ),
+    open: Optional[bool] = Query(
+        default=None, description="Only borrows not returned yet (true) or only returned ones (false)."
+    ),
+    reader_name: Optional[str] = Query(default=None, description="Only borrows of the reader."),
+    book_id: Optional[List[int]] = Query(
+        default=None, description="Only borrows of the book(s), may be repeated."
+    ),
+    issued_from: Optional[date] = Query(default=None, description="Only borrows issued on or after the date."),
+    issued_to: Optional[date] = Query(default=None, description="Only borrows issued on or before the date."),
+    sort: Optional[str] = Query(
+        default=None, description='Field to sort by: id, book_id or reader_name, prefixed with "-" for descending order.'
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into every borrow: "book".'
+    ),
+    ids: Optional[str] = Query(
+        default=None,
+        description=f'Comma separated ids of borrows to fetch at once (at most {settings.batch_max_ids}), e.g. "1,2,3". '
+        'Only fields and include apply to them.',
+    ),
+    borrow_service: BorrowService = Depends(get_borrow_service),
+):
+    """
+    Returns page of borrows ordered by id, or by sort field and then id.
+    Borrows may be filtered by open status, reader, books and issue dates.
+    Next page is requested with cursor from next_cursor field of the response,
+    next_cursor is null on the last page.
+    With stream set, returns all borrows after cursor written to the response
+    as they are read from the database (JSON array or NDJSON) instead of a page.
+    With include=book, book of every borrow is embedded, loaded
+    with one additional query for the whole page.
+    With ids set, returns borrows with these ids in the same order fetched
+    with single query, ids of missing borrows are listed in missing_ids.
+    Page has ETag of its body, if it matches If-None-Match returns 304.
+    If cursor is malformed or issued for another sort, or fields, sort
+    or include are unknown, or ids are malformed or too many, returns 400.
+    """
+    list_params = dict(
+        cursor=cursor, fields=fields, sort=sort, include=include, open=open,
+        reader_name=reader_name, book_ids=book_id, issued_from=issued_from,
+        issued_to=issued_to,
+    )
+    try:
+        if ids is not None:
+            return await etag_json_response(
+                request,
+                build_response=lambda: borrow_service.borrows_batch(
+                    ids=ids, fields=fields, include=include
+                ),
+            )
+        if stream is not None:
+            return streaming_list_response(
+                await borrow_service.all_borrows_stream(**list_params), stream
+            )
+        return await etag_json_response(
+            request,
+            build_response=lambda: borrow_service.all_borrows_list(
+                limit=limit, **list_params
+            ),
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseBorrowInvalidParameter
+        )
+    except BorrowServiceRepositoryError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            response_model=ResponseBorrowServiceRepositoryError
+        )
+
+@router.get(
+    "/borrows/count",
+    status_code=status.HTTP_200_OK,
+    response_model=ResponseBorrowCount,
+    responses={
+        200: {
+            "description": "Borrows counted successfully.",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "status": "success",
+                        "message": "42 borrow(s) found.",
+                        "data": 42
+                    }
+                }
+            },
+        },
+    },
+)
+async def count_borrows(borrow_service: BorrowService = Depends(get_borrow_service)):
     """
-    Returns all borrows in a list.
+    Returns total amount of borrows.
     """
     try:
-        return await borrow_service.all_borrows_list()
+        return json_response(await borrow_service.borrows_count())
     except BorrowServiceRepositoryError as e:
         raise_http_exception_with_model_response(
             exc_from=e,
@@ -203,14 +333,44 @@ async def list_borrows(borrow_service: BorrowService = Depends(get_borrow_servic
     },
 )
 async def get_borrow_info(
-    id: int, borrow_service: BorrowService = Depends(get_borrow_service)
+    id: int,
+    request: Request,
+    fields: Optional[str] = Query(
+        default=None, description='Comma separated fields to return, e.g. "id,title". id and version are always returned.'
+    ),
+    include: Optional[str] = Query(
+        default=None, description='Related entity to embed into the borrow: "book".'
+    ),
+    borrow_service: BorrowService = Depends(get_borrow_service)
 ):
     """
     Obtains borrow information by its id.
     If no borrow matches with provided id, returns 404.
+    Response has ETag of borrow version, if it matches If-None-Match
+    returns 304 without loading the borrow.
+    With include=book, book of the borrow is embedded and ETag
+    is of the response body, as borrow version does not change with its book.
+    If fields or include are unknown, returns 400.
     """
+    def build_response():
+        return borrow_service.obtain_borrow_information(
+            id, fields=fields, include=include
+        )
+
     try:
-        return await borrow_service.obtain_borrow_information(id)
+        if include:
+            return await etag_json_response(request, build_response)
+        return await versioned_response(
+            request,
+            get_version=lambda: borrow_service.borrow_version(borrow_id=id),
+            build_response=build_response,
+        )
+    except ServiceRequestParameterError as e:
+        raise_http_exception_with_model_response(
+            exc_from=e,
+            status=status.HTTP_400_BAD_REQUEST,
+            response_model=ResponseBorrowInvalidParameter
+        )
     except BorrowNotFoundBorrowError as e:
         raise raise_http_exception_with_model_response(
             exc_from=e,
@@ -1,5 +1,13 @@
+from typing import Any, Dict
+
 from fastapi import APIRouter
 
+from robust_library_api.container.container import init_container
+from robust_library_api.db.base import Base
+from robust_library_api.db.database import Database
+from robust_library_api.db.dao.cache import entity_cache_for
+from robust_library_api.web.api.utils import response_cache
+
 router = APIRouter()
 
 
@@ -10,3 +18,28 @@ def health_check() -> None:
 
     It returns 200 if the project is healthy.
     """
+
+
+@router.get("/cache")
+def cache_stats() -> Dict[str, Dict[str, int]]:
+    """
+    Returns size, hit, miss and eviction counters of entity caches
+    by model table (models with disabled cache are omitted)
+    and of the response cache.
+    """
+    caches = {
+        mapper.class_.__tablename__: entity_cache_for(mapper.class_)
+        for mapper in Base.registry.mappers
+    }
+    caches["responses"] = response_cache
+    return {name: cache.stats() for name, cache in caches.items() if cache is not None}
+
+
+@router.get("/pool")
+def pool_stats() -> Dict[str, Any]:
+    """
+    Returns occupancy (size, checked in and out, overflow connections)
+    and checkout counters (checkouts, timeouts, total and max seconds
+    spent waiting for a connection) of the database connection pool.
+    """
+    return init_container().resolve(Database).pool_stats()
@@ -1,5 +1,7 @@
+from fastapi import Depends
 from fastapi.routing import APIRouter
 
+from robust_library_api.db.dependencies import get_db_session
 from robust_library_api.web.api import (
     monitoring,
     authors,
@@ -9,6 +11,6 @@ from robust_library_api.web.api import (
 
 api_router = APIRouter()
 api_router.include_router(monitoring.router)
-api_router.include_router(authors.router)
-api_router.include_router(books.router)
-api_router.include_router(borrows.router)
+api_router.include_router(authors.router, dependencies=[Depends(get_db_session)])
+api_router.include_router(books.router, dependencies=[Depends(get_db_session)])
+api_router.include_router(borrows.router, dependencies=[Depends(get_db_session)])
@@ -1,6 +1,8 @@
 import enum
+from datetime import date
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from sqlalchemy import Row
 from typing import Optional, Any, List
 
 class ResponseStatus(str, enum.Enum):
@@ -8,6 +10,58 @@ class ResponseStatus(str, enum.Enum):
     fail = "fail"
     error = "error"
 
+class StreamFormat(str, enum.Enum):
+    json = "json"
+    ndjson = "ndjson"
+
+class EntitySchema(BaseModel):
+    """
+    Entity returned by the API, validated once from ORM entity, Core row
+    or row dict. Only loaded attributes of ORM entities are read, so relationships
+    which were not included never trigger lazy loads.
+    Fields the entity was built without stay unset and are not returned,
+    so sparse fieldsets stay sparse.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _loaded_attributes(cls, data: Any) -> Any:
+        if isinstance(data, Row):
+            return dict(zip(data._fields, data))
+        if hasattr(data, "_sa_instance_state"):
+            return data.__dict__
+        return data
+
+class AuthorSchema(EntitySchema):
+    id: Optional[int] = None
+    name: Optional[str] = None
+    surname: Optional[str] = None
+    birth_date: Optional[date] = None
+    version: Optional[int] = None
+    books: Optional[List["BookSchema"]] = None
+
+class BookSchema(EntitySchema):
+    id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    author_id: Optional[int] = None
+    remaining_amount: Optional[int] = None
+    isbn: Optional[str] = None
+    version: Optional[int] = None
+    author: Optional[AuthorSchema] = None
+
+class BorrowSchema(EntitySchema):
+    id: Optional[int] = None
+    book_id: Optional[int] = None
+    reader_name: Optional[str] = None
+    date_of_issue: Optional[date] = None
+    date_of_return: Optional[date] = None
+    version: Optional[int] = None
+    book: Optional[BookSchema] = None
+
+AuthorSchema.model_rebuild()
+
 class StandardResponse(BaseModel):
     status: ResponseStatus
     message: str
@@ -19,6 +73,19 @@ class StandardSuccessResponse(StandardResponse):
 class StandardSuccessListResponse(StandardSuccessResponse):
     data: Optional[List[dict]] = None
 
+class StandardSuccessPageResponse(StandardSuccessListResponse):
+    next_cursor: Optional[str] = None
+
+class StandardSuccessBatchResponse(StandardSuccessListResponse):
+    missing_ids: List[int] = Field(default_factory=list)
+
+class BulkItemError(BaseModel):
+    index: int
+    message: str
+
+class StandardSuccessBulkResponse(StandardSuccessListResponse):
+    errors: List[BulkItemError] = Field(default_factory=list)
+
 class StandardSuccessCountResponse(StandardSuccessResponse):
     data: Optional[int] = None
 
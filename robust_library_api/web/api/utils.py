@@ -1,6 +1,28 @@
-from robust_library_api.web.api.schema import StandardResponse
+import hashlib
+from typing import AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence
 
-from fastapi import HTTPException, status
+import orjson
+from pydantic import BaseModel
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.dao.cache import MISSING, LRUCache, table_versions
+from robust_library_api.db.database import Database
+from robust_library_api.settings import settings
+from robust_library_api.web.api.schema import StandardResponse, StreamFormat
+
+from fastapi import HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
+
+STREAM_MEDIA_TYPES = {
+    StreamFormat.json: "application/json",
+    StreamFormat.ndjson: "application/x-ndjson",
+}
+
+response_cache = LRUCache(
+    max_size=settings.response_cache_max_size,
+    ttl=settings.response_cache_ttl,
+    negative_ttl=0,
+)
 
 def raise_http_exception_with_model_response(exc_from: Exception, status: status, response_model: StandardResponse):
     raise HTTPException(
@@ -8,4 +30,166 @@ def raise_http_exception_with_model_response(exc_from: Exception, status: status
             detail=response_model(
                 message=exc_from.message,
             ).model_dump()
-        )
\ No newline at end of file
+        )
+
+def _encode_row(row: dict) -> bytes:
+    return orjson.dumps(row)
+
+def encode_response(response: BaseModel) -> bytes:
+    """
+    Encodes response model to JSON with orjson.
+    Entities in data are dumped only with fields they were built with.
+    """
+    content = response.model_dump(exclude={"data"})
+    content["data"] = response.model_dump(include={"data"}, exclude_unset=True).get("data")
+    return orjson.dumps(content)
+
+def json_response(
+    response: BaseModel, status_code: int = status.HTTP_200_OK,
+    headers: Optional[Dict[str, str]] = None,
+) -> Response:
+    """
+    Returns encoded response model. Services build response models from
+    trusted database rows, so unlike returned models this response is not
+    validated against response_model of the route again.
+    """
+    return Response(
+        content=encode_response(response), status_code=status_code,
+        headers=headers, media_type="application/json",
+    )
+
+async def _json_array_chunks(partitions: AsyncIterator[List[dict]]) -> AsyncIterator[bytes]:
+    yield b"["
+    separator = b""
+    async for partition in partitions:
+        if partition:
+            yield separator + b",".join(_encode_row(row) for row in partition)
+            separator = b","
+    yield b"]"
+
+async def _ndjson_chunks(partitions: AsyncIterator[List[dict]]) -> AsyncIterator[bytes]:
+    async for partition in partitions:
+        yield b"".join(_encode_row(row) + b"\n" for row in partition)
+
+def streaming_list_response(
+    partitions: AsyncIterator[List[dict]], stream_format: StreamFormat
+) -> StreamingResponse:
+    """
+    Writes rows to the response partition by partition as they are fetched,
+    either as single JSON array or as newline delimited JSON.
+    """
+    chunks = (
+        _json_array_chunks(partitions)
+        if stream_format == StreamFormat.json
+        else _ndjson_chunks(partitions)
+    )
+    return StreamingResponse(chunks, media_type=STREAM_MEDIA_TYPES[stream_format])
+
+def version_etag(version: int) -> str:
+    """
+    Strong ETag of entity version, every write of the entity bumps it.
+    It is strong, so it can be used in If-Match.
+    """
+    return f'"{version}"'
+
+def body_etag(body: bytes) -> str:
+    return f'"{hashlib.sha1(body, usedforsecurity=False).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Weakly compares ETag with If-None-Match header value.
+    """
+    if if_none_match is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(
+        candidate.strip().removeprefix("W/") == etag.removeprefix("W/")
+        for candidate in if_none_match.split(",")
+    )
+
+def if_match_version(if_match: Optional[str]) -> Optional[int]:
+    """
+    Extracts expected entity version from If-Match header with version ETag.
+    Returns None if header is absent or "*" (any version matches).
+    Raises 412 if header holds no version ETag, as nothing can match it.
+    If-Match uses strong comparison (RFC 9110), so weak ETags never match.
+    """
+    if if_match is None or if_match.strip() == "*":
+        return None
+    etag = if_match.strip()
+    if len(etag) > 2 and etag[0] == etag[-1] == '"' and etag[1:-1].isdigit():
+        return int(etag[1:-1])
+    raise HTTPException(
+        status.HTTP_412_PRECONDITION_FAILED,
+        detail=StandardResponse(
+            status="fail", message=f"If-Match {if_match!r} does not match any version.",
+        ).model_dump(),
+    )
+
+def not_modified_response(etag: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+async def versioned_response(
+    request: Request,
+    get_version: Callable[[], Awaitable[Optional[int]]],
+    build_response: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    Returns entity response with ETag of entity version.
+    If request has If-None-Match, only version is looked up first
+    and 304 is returned without loading the entity if it matches.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        version = await get_version()
+        if version is not None and etag_matches(if_none_match, version_etag(version)):
+            return not_modified_response(version_etag(version))
+    entity_response = await build_response()
+    return json_response(
+        entity_response, headers={"ETag": version_etag(entity_response.data.version)}
+    )
+
+def _conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return not_modified_response(etag)
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+async def etag_json_response(
+    request: Request, build_response: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    Returns encoded response with ETag of its body,
+    or 304 if it matches If-None-Match of the request.
+    """
+    body = encode_response(await build_response())
+    return _conditional_json_response(request, body, body_etag(body))
+
+async def cached_json_response(
+    request: Request, tables: Sequence[str],
+    build_response: Callable[[], Awaitable[BaseModel]],
+) -> Response:
+    """
+    Returns encoded response body cached by path, query string and versions
+    of tables the response is built from. Response is built and encoded
+    only on cache miss, any write to the tables makes cached bodies stale.
+    Response has ETag of its body, 304 is returned if it matches If-None-Match.
+    Response built from reads of a replica is not cached, as the replica
+    may lag behind writes already counted in versions of the tables.
+    """
+    if response_cache.max_size <= 0:
+        return await etag_json_response(request, build_response)
+    cache_key = (
+        request.url.path,
+        tuple(sorted(request.query_params.multi_items())),
+        table_versions.get(tables),
+    )
+    cached = response_cache.get(cache_key)
+    if cached is MISSING:
+        generation = response_cache.generation
+        from_replica = init_container().resolve(Database).reads_from_replica()
+        body = encode_response(await build_response())
+        cached = (body, body_etag(body))
+        if not from_replica:
+            response_cache.put(cache_key, cached, generation)
+    return _conditional_json_response(request, *cached)
@@ -1,10 +1,11 @@
 from importlib import metadata
 
 from fastapi import FastAPI
-from fastapi.responses import UJSONResponse
+from fastapi.responses import ORJSONResponse
 
 from robust_library_api.web.api.router import api_router
 from robust_library_api.web.lifespan import lifespan_setup
+from robust_library_api.web.middleware import ReadYourWritesMiddleware
 
 
 def get_app() -> FastAPI:
@@ -22,12 +23,13 @@ def get_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
-        default_response_class=UJSONResponse,
+        default_response_class=ORJSONResponse,
     )
 
     app.include_router(
         router=api_router, 
         # prefix="/api"
     )
+    app.add_middleware(ReadYourWritesMiddleware)
 
     return app
@@ -2,39 +2,36 @@ from contextlib import asynccontextmanager
 from typing import AsyncGenerator
 
 from fastapi import FastAPI
-from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
-from robust_library_api.db.meta import meta
-from robust_library_api.db.models import load_all_models
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+from robust_library_api.db.repositories.author import AuthorRepository
+from robust_library_api.db.repositories.book import BookRepository
+from robust_library_api.db.repositories.borrow import BorrowRepository
+from robust_library_api.services.author.service import AuthorService
 from robust_library_api.settings import settings
 
 
-def _setup_db(app: FastAPI) -> None:  # pragma: no cover
+async def _setup_db(app: FastAPI) -> None:  # pragma: no cover
     """
-    Creates connection to the database.
+    Sets up connection to the database.
 
-    This function creates SQLAlchemy engine instance,
-    session_factory for creating sessions
-    and stores them in the application's state property.
+    Database (with its engine and connection pool) is the one shared
+    by all repositories, it is stored in the application's state property.
+    With pool warm-up enabled, pool connections are opened and hot queries
+    of repositories are prepared on them before the application starts serving.
 
     :param app: fastAPI application.
     """
-    engine = create_async_engine(str(settings.db_url), echo=settings.db_echo)
-    session_factory = async_sessionmaker(
-        engine,
-        expire_on_commit=False,
-    )
-    app.state.db_engine = engine
-    app.state.db_session_factory = session_factory
-
-
-async def _create_tables() -> None:  # pragma: no cover
-    """Populates tables in the database."""
-    load_all_models()
-    engine = create_async_engine(str(settings.db_url))
-    async with engine.begin() as connection:
-        await connection.run_sync(meta.create_all)
-    await engine.dispose()
+    container = init_container()
+    database: Database = container.resolve(Database)
+    app.state.database = database
+    if settings.db_pool_warmup:
+        await database.warm_up([
+            statement
+            for repository in (AuthorRepository, BookRepository, BorrowRepository)
+            for statement in container.resolve(repository).hot_queries()
+        ])
 
 
 @asynccontextmanager
@@ -45,16 +42,16 @@ async def lifespan_setup(
     Actions to run on application startup.
 
     This function uses fastAPI app to store data
-    in the state, such as db_engine.
+    in the state, such as database.
 
     :param app: the fastAPI application.
     :return: function that actually performs actions.
     """
 
     app.middleware_stack = None
-    _setup_db(app)
-    await _create_tables()
+    await _setup_db(app)
+    await init_container().resolve(AuthorService).build_name_index()
     app.middleware_stack = app.build_middleware_stack()
 
     yield
-    await app.state.db_engine.dispose()
+    await app.state.database.dispose()
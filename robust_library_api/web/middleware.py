@@ -0,0 +1,55 @@
+import math
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+
+PRIMARY_READS_COOKIE = "primary_reads_until"
+
+
+def _primary_until(cookie: Optional[str]) -> float:
+    try:
+        primary_until = float(cookie) if cookie is not None else 0.0
+    except ValueError:
+        return 0.0
+    return primary_until if math.isfinite(primary_until) else 0.0
+
+
+class ReadYourWritesMiddleware:
+    """
+    Pins reads of a client to the primary database for a while after its writes.
+
+    Response to a request which wrote anything sets cookie with the time
+    reads of the client go to the primary until, following requests
+    carrying it are not routed to replicas which may lag behind.
+    """
+
+    def __init__(self, app: ASGIApp, database: Optional[Database] = None) -> None:
+        self.app = app
+        self.database = database
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        database = self.database or init_container().resolve(Database)
+        cookie = HTTPConnection(scope).cookies.get(PRIMARY_READS_COOKIE)
+        with database.client_consistency(_primary_until(cookie)) as consistency:
+
+            async def send_with_cookie(message: Message) -> None:
+                if message["type"] == "http.response.start" and consistency.wrote:
+                    max_age = math.ceil(database.read_your_writes_window)
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "set-cookie",
+                        f"{PRIMARY_READS_COOKIE}={consistency.primary_until:.3f}; "
+                        f"Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax",
+                    )
+                await send(message)
+
+            await self.app(scope, receive, send_with_cookie)
@@ -108,3 +108,16 @@ async def client(
     """
     async with AsyncClient(app=fastapi_app, base_url="http://test", timeout=2.0) as ac:
         yield ac
+
+
+@pytest.fixture
+async def uow_client(
+    fastapi_app: FastAPI, client: AsyncClient,
+) -> AsyncGenerator[AsyncClient, None]:
+    """
+    Client for the app with request-scoped unit of work enabled.
+
+    :yield: client for the app.
+    """
+    fastapi_app.dependency_overrides.pop(get_db_session, None)
+    yield client
@@ -81,7 +81,9 @@ async def test_update_author(client: AsyncClient, fastapi_app: FastAPI) -> None:
     }
     response = await client.put(update_url, json=update_payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["data"] == 1
+    assert response.json()["data"]["name"] == "Alice Updated"
+    assert response.json()["data"]["version"] == 2
+    assert response.headers["etag"] == '"2"'
 
 @pytest.mark.anyio
 async def test_partial_update_author(client: AsyncClient, fastapi_app: FastAPI) -> None:
@@ -103,7 +105,8 @@ async def test_partial_update_author(client: AsyncClient, fastapi_app: FastAPI)
     }
     response = await client.put(update_url, json=update_payload)
     assert response.status_code == status.HTTP_200_OK
-    assert response.json()["data"] == 1
+    assert response.json()["data"]["birth_date"] == "1975-10-15"
+    assert response.json()["data"]["name"] == "Violet"
     
     get_url = fastapi_app.url_path_for("get_author_info", id=author_id)
     get_response = await client.get(get_url)
@@ -182,3 +185,19 @@ async def test_delete_non_existent_author(client: AsyncClient, fastapi_app: Fast
     assert response.status_code == status.HTTP_404_NOT_FOUND
 
 
+
+@pytest.mark.anyio
+async def test_count_authors(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests counting authors reflects created authors.
+    """
+    url = fastapi_app.url_path_for("count_authors")
+    count = (await client.get(url)).json()["data"]
+
+    create_url = fastapi_app.url_path_for("create_author")
+    for _ in range(3):
+        await client.post(create_url, json={"name": "Counted", "surname": "Writer", "birth_date": "1970-01-01"})
+
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == count + 3
@@ -60,7 +60,8 @@ async def test_update_book(client: AsyncClient, fastapi_app: FastAPI) -> None:
     response = await client.put(url, json=payload)
     assert response.status_code == status.HTTP_200_OK
     response_data = response.json()["data"]
-    assert response_data == 1
+    for key in payload.keys():
+        assert response_data[key] == payload[key]
     
     url = fastapi_app.url_path_for("get_book_info", id=book_id)
     response = await client.get(url)
@@ -83,7 +84,8 @@ async def test_partial_update_book(client: AsyncClient, fastapi_app: FastAPI) ->
     response = await client.put(url, json=payload)
     assert response.status_code == status.HTTP_200_OK
     response_data = response.json()["data"]
-    assert response_data == 1
+    for key in payload.keys():
+        assert response_data[key] == payload[key]
     
     url = fastapi_app.url_path_for("get_book_info", id=book_id)
     response = await client.get(url)
@@ -92,6 +94,17 @@ async def test_partial_update_book(client: AsyncClient, fastapi_app: FastAPI) ->
     response_data = response.json()["data"]
     for key in payload.keys():
         assert response_data[key] == payload[key]
+
+@pytest.mark.anyio
+async def test_update_book_count_only(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests updating book with count_only responds with count of updated books.
+    """
+    url = fastapi_app.url_path_for("update_book", id=1)
+    response = await client.put(url, json={"remaining_amount": 10}, params={"count_only": True})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == 1
+    assert "etag" not in response.headers
     
 
 @pytest.mark.anyio
@@ -187,4 +200,23 @@ async def test_author_delete_with_book_integrity_violation(client: AsyncClient,
     
     url = fastapi_app.url_path_for("delete_author", id=1)
     response = await client.delete(url)
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
\ No newline at end of file
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.anyio
+async def test_count_books(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests counting books reflects created books.
+    """
+    url = fastapi_app.url_path_for("count_books")
+    count = (await client.get(url)).json()["data"]
+
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Counted", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    create_url = fastapi_app.url_path_for("create_book")
+    for _ in range(3):
+        await client.post(create_url, json={"title": "Counted", "description": "", "author_id": author_id, "remaining_amount": 1})
+
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == count + 3
@@ -0,0 +1,52 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_concurrent_borrows_never_oversell(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests concurrent borrows of the same book take at most its remaining amount.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Race", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Scarce", "description": "", "author_id": author_id, "remaining_amount": 3}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("create_borrow")
+    responses = await asyncio.gather(*(
+        client.post(url, json={"book_id": book_id, "reader_name": f"reader{i}"})
+        for i in range(8)
+    ))
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [status.HTTP_201_CREATED] * 3 + [status.HTTP_400_BAD_REQUEST] * 5
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    response = await client.get(get_url)
+    assert response.json()["data"]["remaining_amount"] == 0
+
+@pytest.mark.anyio
+async def test_concurrent_returns_close_borrow_once(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests concurrent returns of the same borrow put book copy back only once.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Return", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Returned", "description": "", "author_id": author_id, "remaining_amount": 1}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    borrow_id = (await client.post(borrow_url, json={"book_id": book_id, "reader_name": "once"})).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("return_borrow", id=borrow_id)
+    await asyncio.gather(*(client.patch(url) for _ in range(5)))
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    response = await client.get(get_url)
+    assert response.json()["data"]["remaining_amount"] == 1
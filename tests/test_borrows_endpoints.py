@@ -144,4 +144,26 @@ async def test_delete_with_borrow_integrity_violation(client: AsyncClient, fasta
     
     url = fastapi_app.url_path_for("delete_book", id=book_id)
     response = await client.delete(url)
-    assert response.status_code == status.HTTP_400_BAD_REQUEST
\ No newline at end of file
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.anyio
+async def test_count_borrows(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests counting borrows reflects created borrows.
+    """
+    url = fastapi_app.url_path_for("count_borrows")
+    count = (await client.get(url)).json()["data"]
+
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Counted", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Counted", "description": "", "author_id": author_id, "remaining_amount": 3}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+    create_url = fastapi_app.url_path_for("create_borrow")
+    for _ in range(3):
+        await client.post(create_url, json={"book_id": book_id, "reader_name": "counter"})
+
+    response = await client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == count + 3
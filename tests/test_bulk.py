@@ -0,0 +1,145 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_bulk_create_authors(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests creating many authors with single request.
+    """
+    url = fastapi_app.url_path_for("create_authors_bulk")
+    payload = [
+        {"name": f"Bulk{i}", "surname": "Author", "birth_date": "1980-01-01"}
+        for i in range(3)
+    ]
+    response = await client.post(url, json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert [author["name"] for author in response_data["data"]] == ["Bulk0", "Bulk1", "Bulk2"]
+    assert all(author["id"] for author in response_data["data"])
+    assert response_data["errors"] == []
+
+@pytest.mark.anyio
+async def test_bulk_create_books_reports_missing_authors(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests books with missing authors are reported by index and others are created.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Bulk", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("create_books_bulk")
+    payload = [
+        {"title": "First", "description": "", "author_id": author_id, "remaining_amount": 1},
+        {"title": "Orphan", "description": "", "author_id": 99999, "remaining_amount": 1},
+        {"title": "Second", "description": "", "author_id": author_id, "remaining_amount": 2},
+    ]
+    response = await client.post(url, json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert [book["title"] for book in response_data["data"]] == ["First", "Second"]
+    assert [error["index"] for error in response_data["errors"]] == [1]
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=response_data["data"][0]["id"])
+    get_response = await client.get(get_url)
+    assert get_response.status_code == status.HTTP_200_OK
+
+@pytest.mark.anyio
+async def test_bulk_create_books_reports_duplicate_isbns(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests books with ISBN already stored or repeated in the batch are reported
+    by index and others are created in order.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Isbn", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("create_books_bulk")
+    book = {"description": "", "author_id": author_id, "remaining_amount": 1}
+    await client.post(url, json=[{**book, "title": "Stored", "isbn": "bulk-isbn-1"}])
+    payload = [
+        {**book, "title": "Taken", "isbn": "bulk-isbn-1"},
+        {**book, "title": "First", "isbn": "bulk-isbn-2"},
+        {**book, "title": "Repeated", "isbn": "bulk-isbn-2"},
+        {**book, "title": "Second", "isbn": "bulk-isbn-3"},
+        {**book, "title": "Without"},
+    ]
+    response = await client.post(url, json=payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    response_data = response.json()
+    assert [created["title"] for created in response_data["data"]] == ["First", "Second", "Without"]
+    assert [created["isbn"] for created in response_data["data"]] == ["bulk-isbn-2", "bulk-isbn-3", None]
+    assert [error["index"] for error in response_data["errors"]] == [0, 2]
+
+@pytest.mark.anyio
+async def test_bulk_create_empty(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests bulk creation requires at least one item.
+    """
+    for name in ("create_authors_bulk", "create_books_bulk"):
+        url = fastapi_app.url_path_for(name)
+        response = await client.post(url, json=[])
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+@pytest.mark.anyio
+async def test_bulk_upsert_books_is_idempotent(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests books sync by ISBN creates, skips unchanged and updates changed books.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Sync", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("upsert_books_bulk")
+    payload = [
+        {"isbn": "sync-1", "title": "One", "description": "", "author_id": author_id, "remaining_amount": 1},
+        {"isbn": "sync-2", "title": "Two", "description": "", "author_id": author_id, "remaining_amount": 2},
+    ]
+    response = await client.put(url, json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    created = {book["isbn"]: book for book in response.json()["data"]}
+    assert set(created) == {"sync-1", "sync-2"}
+
+    response = await client.put(url, json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == []
+
+    payload[1]["title"] = "Two, revised"
+    response = await client.put(url, json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    updated = response.json()["data"]
+    assert len(updated) == 1
+    assert updated[0]["id"] == created["sync-2"]["id"]
+    assert updated[0]["title"] == "Two, revised"
+
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    await client.post(borrow_url, json={"book_id": created["sync-2"]["id"], "reader_name": "sync"})
+    payload[1]["title"] = "Two, lent"
+    response = await client.put(url, json=payload)
+    assert response.json()["data"][0]["remaining_amount"] == 1
+    payload[1]["remaining_amount"] = 5
+    response = await client.put(url, json=payload)
+    assert response.json()["data"] == []
+
+@pytest.mark.anyio
+async def test_bulk_upsert_books_reports_duplicates(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests earlier duplicates of the same ISBN and missing authors are reported.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Dup", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("upsert_books_bulk")
+    payload = [
+        {"isbn": "dup-1", "title": "Old", "description": "", "author_id": author_id, "remaining_amount": 1},
+        {"isbn": "dup-2", "title": "Orphan", "description": "", "author_id": 99999, "remaining_amount": 1},
+        {"isbn": "dup-1", "title": "New", "description": "", "author_id": author_id, "remaining_amount": 1},
+    ]
+    response = await client.put(url, json=payload)
+    assert response.status_code == status.HTTP_200_OK
+    response_data = response.json()
+    assert [book["title"] for book in response_data["data"]] == ["New"]
+    assert [error["index"] for error in response_data["errors"]] == [0, 1]
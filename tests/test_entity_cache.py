@@ -0,0 +1,111 @@
+import time
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette import status
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.dao.cache import MISSING, LRUCache, entity_cache_for
+from robust_library_api.db.database import Database
+from robust_library_api.db.models.author import AuthorModel
+from robust_library_api.db.models.book import BookModel
+from robust_library_api.db.repositories.author import AuthorRepository
+
+
+def test_entity_cache_lru_and_ttl() -> None:
+    """
+    Tests cache evicts least recently used entries and expires negative entries.
+    """
+    cache = LRUCache(max_size=2, ttl=60, negative_ttl=0.01)
+    cache.put(1, {"id": 1}, cache.generation)
+    cache.put(2, {"id": 2}, cache.generation)
+    assert cache.get(1) == {"id": 1}
+    cache.put(3, {"id": 3}, cache.generation)
+    assert cache.get(2) is MISSING
+    assert cache.get(3) == {"id": 3}
+
+    cache.put(4, None, cache.generation)
+    assert cache.get(4) is None
+    time.sleep(0.02)
+    assert cache.get(4) is MISSING
+    assert cache.stats() == {"size": 1, "max_size": 2, "hits": 3, "misses": 2, "evictions": 2}
+
+def test_entity_cache_skips_rows_read_before_invalidation() -> None:
+    """
+    Tests row read before invalidation is not cached.
+    """
+    cache = LRUCache(max_size=2, ttl=60, negative_ttl=60)
+    generation = cache.generation
+    cache.invalidate([1])
+    cache.put(1, {"id": 1}, generation)
+    assert cache.get(1) is MISSING
+
+@pytest.mark.anyio
+async def test_book_cache_invalidated_by_writes(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests cached book is served from cache and refreshed after update and borrow.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Cached", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Cached", "description": "", "author_id": author_id, "remaining_amount": 2}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    cache = entity_cache_for(BookModel)
+    url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    await client.get(url)
+    hits = cache.hits
+    response = await client.get(url)
+    assert cache.hits == hits + 1
+    assert response.json()["data"]["title"] == "Cached"
+
+    update_url = fastapi_app.url_path_for("update_book", id=book_id)
+    await client.put(update_url, json={"title": "Updated"})
+    assert (await client.get(url)).json()["data"]["title"] == "Updated"
+
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    await client.post(borrow_url, json={"book_id": book_id, "reader_name": "cached"})
+    assert (await client.get(url)).json()["data"]["remaining_amount"] == 1
+
+@pytest.mark.anyio
+async def test_missing_book_negative_cache(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests missing book id is cached and cache counters are reported.
+    """
+    url = fastapi_app.url_path_for("get_book_info", id=987654)
+    assert (await client.get(url)).status_code == status.HTTP_404_NOT_FOUND
+    hits = entity_cache_for(BookModel).hits
+    assert (await client.get(url)).status_code == status.HTTP_404_NOT_FOUND
+    assert entity_cache_for(BookModel).hits == hits + 1
+
+    stats_url = fastapi_app.url_path_for("cache_stats")
+    response = await client.get(stats_url)
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["book"]["hits"] == hits + 1
+
+
+@pytest.mark.anyio
+async def test_cache_bypassed_after_write_in_unit_of_work(_engine: AsyncEngine) -> None:
+    """
+    Tests reads of unit of work made after its write skip rows cached before it.
+    """
+    database = init_container().resolve(Database)
+    repository = init_container().resolve(AuthorRepository)
+    author = await repository.create_author(
+        name="Before", surname="Write", birth_date=date(1970, 1, 1),
+    )
+    cache = entity_cache_for(AuthorModel)
+    async with database.unit_of_work():
+        await repository.get_author_by_id(author.id)
+        cached_row = cache.get(author.id)
+        await repository.update_author_by_id(author.id, name="After")
+        # Row committed before the write, as if cached by a concurrent request.
+        cache.put(author.id, cached_row, cache.generation)
+
+        assert (await repository.get_author_by_id(author.id)).name == "After"
+        assert (await repository.get_authors_by_ids([author.id]))[0].name == "After"
+        assert await repository.get_author_version(author.id) == cached_row["version"] + 1
@@ -0,0 +1,67 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_book_etag_follows_version(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests book ETag is its version, matching If-None-Match returns 304
+    and every update or borrow bumps the version.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Etag", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Etag", "description": "", "author_id": author_id, "remaining_amount": 2}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    response = await client.get(url)
+    assert response.headers["etag"] == '"1"'
+    assert response.json()["data"]["version"] == 1
+
+    response = await client.get(url, headers={"If-None-Match": 'W/"1"'})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.headers["etag"] == '"1"'
+    assert response.content == b""
+
+    update_url = fastapi_app.url_path_for("update_book", id=book_id)
+    await client.put(update_url, json={"title": "Etag, revised"})
+    response = await client.get(url, headers={"If-None-Match": '"1"'})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["etag"] == '"2"'
+
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    borrow_id = (await client.post(borrow_url, json={"book_id": book_id, "reader_name": "etag"})).json()["data"]["id"]
+    response = await client.get(url, headers={"If-None-Match": '"2"'})
+    assert response.headers["etag"] == '"3"'
+
+    return_url = fastapi_app.url_path_for("return_borrow", id=borrow_id)
+    await client.patch(return_url)
+    borrow_url = fastapi_app.url_path_for("get_borrow_info", id=borrow_id)
+    assert (await client.get(borrow_url)).headers["etag"] == '"2"'
+    assert (await client.get(url)).headers["etag"] == '"4"'
+
+@pytest.mark.anyio
+async def test_missing_entity_with_if_none_match(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests conditional request for missing entity returns 404.
+    """
+    url = fastapi_app.url_path_for("get_author_info", id=99999)
+    response = await client.get(url, headers={"If-None-Match": "*"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.anyio
+async def test_list_etag(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests list pages have ETag of their body and matching If-None-Match returns 304.
+    """
+    for name in ("list_authors", "list_books", "list_borrows"):
+        url = fastapi_app.url_path_for(name)
+        response = await client.get(url)
+        etag = response.headers["etag"]
+        response = await client.get(url, headers={"If-None-Match": f'"other", {etag}'})
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.headers["etag"] == etag
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_list_books_fields(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests listing books returns only requested fields and id.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    response = await client.get(url, params={"fields": "title", "limit": 2})
+    assert response.status_code == status.HTTP_200_OK
+    page = response.json()
+    assert page["data"]
+    assert all(set(book) == {"id", "version", "title"} for book in page["data"])
+
+    next_page = await client.get(url, params={"fields": "title", "limit": 2, "cursor": page["next_cursor"]})
+    assert next_page.status_code == status.HTTP_200_OK
+    assert next_page.json()["data"][0]["id"] > page["data"][-1]["id"]
+
+@pytest.mark.anyio
+async def test_get_book_fields(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests getting book returns only requested fields, or 404 for missing book.
+    """
+    list_url = fastapi_app.url_path_for("list_books")
+    book = (await client.get(list_url, params={"limit": 1})).json()["data"][0]
+
+    url = fastapi_app.url_path_for("get_book_info", id=book["id"])
+    response = await client.get(url, params={"fields": "title, remaining_amount"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == {
+        "id": book["id"], "version": book["version"],
+        "title": book["title"], "remaining_amount": book["remaining_amount"],
+    }
+
+    url = fastapi_app.url_path_for("get_book_info", id=99999)
+    response = await client.get(url, params={"fields": "title"})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+@pytest.mark.anyio
+async def test_stream_borrows_fields(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests streamed borrows contain only requested fields.
+    """
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"stream": "ndjson", "fields": "book_id,date_of_return"})
+    assert response.status_code == status.HTTP_200_OK
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows
+    assert all(set(borrow) == {"id", "version", "book_id", "date_of_return"} for borrow in rows)
+
+@pytest.mark.anyio
+async def test_unknown_fields(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests unknown fields are rejected with 400.
+    """
+    for url in (
+        fastapi_app.url_path_for("list_authors"),
+        fastapi_app.url_path_for("list_borrows"),
+        fastapi_app.url_path_for("get_book_info", id=1),
+    ):
+        response = await client.get(url, params={"fields": "title,_sa_instance_state"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
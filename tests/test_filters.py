@@ -0,0 +1,137 @@
+import base64
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from robust_library_api.db.dao.filters import Filter, compile_filters
+from robust_library_api.db.models.book import BookModel
+
+
+async def _collect_pages(client: AsyncClient, url: str, params: dict) -> list:
+    """
+    Collects items of all pages of the listing.
+
+    :return: listed items.
+    """
+    items = []
+    while True:
+        response = await client.get(url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        items.extend(page["data"])
+        if page["next_cursor"] is None:
+            return items
+        params = {**params, "cursor": page["next_cursor"]}
+
+
+@pytest.mark.anyio
+async def test_books_filtered_by_author_and_sorted(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests paging through books of the author sorted by remaining amount descending.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Filtered", "surname": "Author", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_ids = []
+    for i, amount in enumerate([3, 1, 3, 1, 2]):
+        payload = {"title": f"Sorted{i}", "description": "", "author_id": author_id, "remaining_amount": amount}
+        book_ids.append((await client.post(book_url, json=payload)).json()["data"]["id"])
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    await client.post(borrow_url, json={"book_id": book_ids[3], "reader_name": "exhauster"})
+
+    url = fastapi_app.url_path_for("list_books")
+    params = {"author_id": author_id, "sort": "-remaining_amount", "limit": 2}
+    books = await _collect_pages(client, url, params)
+    assert [book["remaining_amount"] for book in books] == [3, 3, 2, 1, 0]
+    assert [book["title"] for book in books] == ["Sorted0", "Sorted2", "Sorted4", "Sorted1", "Sorted3"]
+
+    params = {**params, "fields": "title"}
+    books = await _collect_pages(client, url, params)
+    assert [book["title"] for book in books] == ["Sorted0", "Sorted2", "Sorted4", "Sorted1", "Sorted3"]
+
+    response = await client.get(url, params={"author_id": author_id, "available": False})
+    assert [book["title"] for book in response.json()["data"]] == ["Sorted3"]
+
+    response = await client.get(url, params={"author_id": author_id, "title_prefix": "Sorted4"})
+    assert [book["title"] for book in response.json()["data"]] == ["Sorted4"]
+
+@pytest.mark.anyio
+async def test_open_borrows_of_reader(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests listing open and returned borrows of the reader.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Open", "surname": "Borrows", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Lent", "description": "", "author_id": author_id, "remaining_amount": 3}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    borrow_ids = []
+    for reader_name in ("filter-reader", "filter-reader", "other-reader"):
+        response = await client.post(borrow_url, json={"book_id": book_id, "reader_name": reader_name})
+        borrow_ids.append(response.json()["data"]["id"])
+    await client.patch(fastapi_app.url_path_for("return_borrow", id=borrow_ids[0]))
+
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"open": True, "reader_name": "filter-reader"})
+    assert [borrow["id"] for borrow in response.json()["data"]] == [borrow_ids[1]]
+
+    response = await client.get(url, params={"open": False, "reader_name": "filter-reader"})
+    assert [borrow["id"] for borrow in response.json()["data"]] == [borrow_ids[0]]
+
+    response = await client.get(url, params={"book_id": book_id, "sort": "-reader_name"})
+    assert [borrow["id"] for borrow in response.json()["data"]] == [borrow_ids[2], *borrow_ids[:2]]
+
+@pytest.mark.anyio
+async def test_invalid_sort(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests sorting by unknown field and reusing cursor with another sort return 400.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    response = await client.get(url, params={"sort": "description"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    response = await client.get(url, params={"sort": "-remaining_amount", "limit": 1})
+    cursor = response.json()["next_cursor"]
+    response = await client.get(url, params={"cursor": cursor})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.anyio
+async def test_tampered_sort_cursor(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests cursor with value not matching type of the sort column returns 400.
+    """
+    cases = [
+        ("list_books", "remaining_amount", "abc"),
+        ("list_books", "title", 1),
+        ("list_books", "-remaining_amount", None),
+        ("list_borrows", "book_id", True),
+        ("search_books", "-rank", "abc"),
+    ]
+    for name, sort, after in cases:
+        payload = json.dumps({"id": 1, "sort": sort, "after": after})
+        cursor = base64.urlsafe_b64encode(payload.encode()).decode()
+        params = {"cursor": cursor, "q": "anything"} if name == "search_books" else {
+            "cursor": cursor, "sort": sort,
+        }
+        response = await client.get(fastapi_app.url_path_for(name), params=params)
+        assert response.status_code == status.HTTP_400_BAD_REQUEST, (name, sort, after)
+
+def test_filters_allowed_columns_only() -> None:
+    """
+    Tests filters are compiled only for allowed columns and known operators.
+    """
+    conditions = compile_filters(
+        BookModel, [Filter("remaining_amount", "range", (1, None))], {"remaining_amount"}
+    )
+    assert len(conditions) == 1
+    with pytest.raises(ValueError):
+        compile_filters(BookModel, [Filter("description", "eq", "")], {"remaining_amount"})
+    with pytest.raises(ValueError):
+        compile_filters(BookModel, [Filter("remaining_amount", "like", "")], {"remaining_amount"})
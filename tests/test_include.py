@@ -0,0 +1,76 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from tests.test_statement_count import recorded_statements
+
+
+@pytest.mark.anyio
+async def test_include_related_entities(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests related entities are embedded on detail and list endpoints.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Included", "surname": "Author", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_ids = []
+    for title in ("First", "Second"):
+        payload = {"title": title, "description": "", "author_id": author_id, "remaining_amount": 2}
+        book_ids.append((await client.post(book_url, json=payload)).json()["data"]["id"])
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    borrow = (await client.post(borrow_url, json={"book_id": book_ids[0], "reader_name": "includer"})).json()["data"]
+
+    url = fastapi_app.url_path_for("get_author_info", id=author_id)
+    response = await client.get(url, params={"include": "books", "fields": "name"})
+    assert response.status_code == status.HTTP_200_OK
+    author = response.json()["data"]
+    assert author["name"] == "Included" and "surname" not in author
+    assert [book["title"] for book in author["books"]] == ["First", "Second"]
+    assert response.headers["ETag"]
+
+    url = fastapi_app.url_path_for("get_book_info", id=book_ids[1])
+    response = await client.get(url, params={"include": "author"})
+    assert response.json()["data"]["author"]["id"] == author_id
+
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"reader_name": "includer", "include": "book"})
+    assert response.json()["data"][0]["book"]["id"] == borrow["book_id"]
+
+    url = fastapi_app.url_path_for("list_books")
+    response = await client.get(url, params={"author_id": author_id, "include": "author", "stream": "ndjson"})
+    assert response.text.count('"surname":"Author"') == 2
+
+@pytest.mark.anyio
+async def test_include_fixed_number_of_queries(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests page with included relationship is loaded with two queries regardless of its size.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    book_url = fastapi_app.url_path_for("create_book")
+    for i in range(5):
+        payload = {"name": "Counted", "surname": f"Include{i}", "birth_date": "1970-01-01"}
+        author_id = (await client.post(author_url, json=payload)).json()["data"]["id"]
+        for title in ("A", "B"):
+            payload = {"title": title, "description": "", "author_id": author_id, "remaining_amount": 1}
+            await client.post(book_url, json=payload)
+
+    url = fastapi_app.url_path_for("list_authors")
+    for limit in (1, 5):
+        with recorded_statements() as statements:
+            response = await client.get(url, params={"include": "books", "limit": limit})
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()["data"]) == limit
+        assert len(statements) == 2
+
+@pytest.mark.anyio
+async def test_include_unknown_relationship(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests including unknown relationship returns 400.
+    """
+    response = await client.get(fastapi_app.url_path_for("list_authors"), params={"include": "borrows"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    url = fastapi_app.url_path_for("get_borrow_info", id=1)
+    response = await client.get(url, params={"include": "author"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,114 @@
+from pathlib import Path
+from typing import AsyncGenerator
+
+import pytest
+from alembic import command
+from alembic.autogenerate import compare_metadata
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+from robust_library_api.db.meta import meta
+from robust_library_api.db.models import load_all_models
+from robust_library_api.settings import settings
+
+MIGRATIONS_DB = f"{settings.db_base}_migrations"
+
+
+def _alembic_config(connection: Connection) -> Config:
+    """
+    Alembic config of the project running migrations on provided connection.
+
+    :return: alembic config.
+    """
+    config = Config(str(Path(__file__).parents[1] / "alembic.ini"))
+    config.attributes["connection"] = connection
+    config.attributes["configure_logger"] = False
+    return config
+
+
+@pytest.fixture
+async def migrations_engine() -> AsyncGenerator[AsyncEngine, None]:
+    """
+    Engine connected to separate empty database.
+
+    :yield: engine.
+    """
+    server_engine = create_async_engine(
+        str(settings.db_url.with_path("/postgres")), isolation_level="AUTOCOMMIT"
+    )
+    async with server_engine.connect() as conn:
+        await conn.execute(text(f'DROP DATABASE IF EXISTS "{MIGRATIONS_DB}"'))
+        await conn.execute(text(f'CREATE DATABASE "{MIGRATIONS_DB}"'))
+    engine = create_async_engine(str(settings.db_url.with_path(f"/{MIGRATIONS_DB}")))
+    try:
+        yield engine
+    finally:
+        await engine.dispose()
+        async with server_engine.connect() as conn:
+            await conn.execute(text(f'DROP DATABASE "{MIGRATIONS_DB}"'))
+        await server_engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_migrations_match_models(migrations_engine: AsyncEngine) -> None:
+    """
+    Tests migrated schema matches models and every migration is reversible.
+    """
+    load_all_models()
+
+    def upgrade(connection: Connection) -> list:
+        command.upgrade(_alembic_config(connection), "head")
+        return compare_metadata(MigrationContext.configure(connection), meta)
+
+    def index_names(connection: Connection) -> set:
+        inspector = inspect(connection)
+        return {
+            index["name"]
+            for table in ("book", "borrow")
+            for index in inspector.get_indexes(table)
+        }
+
+    def downgrade(connection: Connection) -> list:
+        command.downgrade(_alembic_config(connection), "base")
+        return inspect(connection).get_table_names()
+
+    async with migrations_engine.connect() as conn:
+        assert await conn.run_sync(upgrade) == []
+        assert "ix_borrow_open_book_id" in await conn.run_sync(index_names)
+    async with migrations_engine.connect() as conn:
+        assert await conn.run_sync(downgrade) == ["alembic_version"]
+
+
+@pytest.mark.anyio
+async def test_migrations_upgrade_initial_schema_with_rows(migrations_engine: AsyncEngine) -> None:
+    """
+    Tests database with initial schema and rows in it (as created before
+    migrations were introduced) is upgraded, existing rows get version 1.
+    """
+    def upgrade_initial(connection: Connection) -> list:
+        command.upgrade(_alembic_config(connection), "5c1e0a7d3b92")
+        return [column["name"] for column in inspect(connection).get_columns("book")]
+
+    def upgrade_head(connection: Connection) -> None:
+        command.upgrade(_alembic_config(connection), "head")
+
+    async with migrations_engine.connect() as conn:
+        book_columns = await conn.run_sync(upgrade_initial)
+        assert book_columns == ["id", "title", "description", "author_id", "remaining_amount"]
+        await conn.execute(text(
+            "INSERT INTO author (name, surname, birth_date) VALUES ('Old', 'Author', '1970-01-01')"
+        ))
+        await conn.execute(text(
+            "INSERT INTO book (title, description, author_id, remaining_amount) "
+            "SELECT 'Old', '', id, 1 FROM author"
+        ))
+        await conn.commit()
+    async with migrations_engine.connect() as conn:
+        await conn.run_sync(upgrade_head)
+        versions = await conn.execute(text(
+            "SELECT author.version, book.version, book.isbn FROM book JOIN author ON author.id = book.author_id"
+        ))
+        assert versions.all() == [(1, 1, None)]
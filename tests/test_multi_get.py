@@ -0,0 +1,72 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from robust_library_api.settings import settings
+from tests.test_statement_count import recorded_statements
+
+
+@pytest.mark.anyio
+async def test_books_by_ids(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests books are fetched by ids in requested order with single query
+    and missing ids are reported.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Batch", "surname": "Author", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_ids = []
+    for title in ("One", "Two", "Three"):
+        payload = {"title": title, "description": "", "author_id": author_id, "remaining_amount": 1}
+        book_ids.append((await client.post(book_url, json=payload)).json()["data"]["id"])
+    missing_id = book_ids[-1] + 1000
+
+    url = fastapi_app.url_path_for("list_books")
+    ids = ",".join(map(str, [book_ids[2], missing_id, book_ids[0], book_ids[2]]))
+    with recorded_statements() as statements:
+        response = await client.get(url, params={"ids": ids, "fields": "title"})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) <= 1
+    body = response.json()
+    assert [book["title"] for book in body["data"]] == ["Three", "One"]
+    assert body["missing_ids"] == [missing_id]
+
+    response = await client.get(url, params={"ids": f"{book_ids[1]},{book_ids[0]}", "include": "author"})
+    assert [book["id"] for book in response.json()["data"]] == [book_ids[1], book_ids[0]]
+    assert response.json()["data"][0]["author"]["id"] == author_id
+
+@pytest.mark.anyio
+async def test_authors_and_borrows_by_ids(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests authors and borrows are fetched by ids.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Batched", "surname": "Borrower", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_payload = {"title": "Batched", "description": "", "author_id": author_id, "remaining_amount": 2}
+    book_id = (await client.post(fastapi_app.url_path_for("create_book"), json=book_payload)).json()["data"]["id"]
+    borrow_url = fastapi_app.url_path_for("create_borrow")
+    borrow_ids = [
+        (await client.post(borrow_url, json={"book_id": book_id, "reader_name": "batcher"})).json()["data"]["id"]
+        for _ in range(2)
+    ]
+
+    response = await client.get(fastapi_app.url_path_for("list_authors"), params={"ids": str(author_id)})
+    assert [author["surname"] for author in response.json()["data"]] == ["Borrower"]
+
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"ids": f"{borrow_ids[1]},{borrow_ids[0]}"})
+    assert [borrow["id"] for borrow in response.json()["data"]] == borrow_ids[::-1]
+    assert response.json()["missing_ids"] == []
+
+@pytest.mark.anyio
+async def test_invalid_ids(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests malformed ids and too many ids return 400.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    for ids in ("1,a", ",", ",".join(map(str, range(settings.batch_max_ids + 1)))):
+        response = await client.get(url, params={"ids": ids})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
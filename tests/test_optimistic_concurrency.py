@@ -0,0 +1,108 @@
+import asyncio
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_update_book_with_outdated_version(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests book update with outdated If-Match is rejected with 412
+    and update with current version succeeds.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Optimistic", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Draft", "description": "", "author_id": author_id, "remaining_amount": 1}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    etag = (await client.get(get_url)).headers["etag"]
+
+    url = fastapi_app.url_path_for("update_book", id=book_id)
+    response = await client.put(url, json={"title": "First edit"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+    response = await client.put(url, json={"title": "Second edit"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    assert (await client.get(get_url)).json()["data"]["title"] == "First edit"
+
+    etag = (await client.get(get_url)).headers["etag"]
+    response = await client.put(url, json={"title": "Second edit"}, headers={"If-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.anyio
+async def test_concurrent_author_updates_with_same_version(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests only one of concurrent updates based on the same version wins.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Contended", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("update_author", id=author_id)
+    responses = await asyncio.gather(*(
+        client.put(url, json={"name": f"Editor{i}"}, headers={"If-Match": '"1"'})
+        for i in range(5)
+    ))
+    status_codes = sorted(response.status_code for response in responses)
+    assert status_codes == [status.HTTP_200_OK] + [status.HTTP_412_PRECONDITION_FAILED] * 4
+
+@pytest.mark.anyio
+async def test_update_with_if_match_of_missing_or_malformed(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests If-Match update of missing author returns 404 and malformed If-Match returns 412.
+    """
+    url = fastapi_app.url_path_for("update_author", id=99999)
+    response = await client.put(url, json={"name": "Ghost"}, headers={"If-Match": '"1"'})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await client.put(url, json={"name": "Ghost"}, headers={"If-Match": "not-an-etag"})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+
+@pytest.mark.anyio
+async def test_update_with_weak_if_match(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests weak ETag never matches If-Match, even of the current version.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Weak", "surname": "Match", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    url = fastapi_app.url_path_for("update_author", id=author_id)
+    response = await client.put(url, json={"name": "Weaker"}, headers={"If-Match": 'W/"1"'})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+    response = await client.put(url, json={"name": "Strong"}, headers={"If-Match": '"1"'})
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.anyio
+async def test_update_with_empty_body(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests update with empty body leaves existing book intact
+    and still reports missing book with 404 and outdated If-Match with 412.
+    """
+    response = await client.put(fastapi_app.url_path_for("update_book", id=99999), json={})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    response = await client.put(fastapi_app.url_path_for("update_author", id=99999), json={})
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Idle", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Untouched", "description": "", "author_id": author_id, "remaining_amount": 1}
+    book_id = (await client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    etag = (await client.get(get_url)).headers["etag"]
+
+    url = fastapi_app.url_path_for("update_book", id=book_id)
+    response = await client.put(url, json={})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"]["title"] == "Untouched"
+    assert (await client.get(get_url)).headers["etag"] == etag
+
+    response = await client.put(url, json={}, headers={"If-Match": '"999"'})
+    assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
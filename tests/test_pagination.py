@@ -0,0 +1,65 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from robust_library_api.settings import settings
+
+
+@pytest.mark.anyio
+async def test_authors_keyset_pagination(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests paging through authors with cursor.
+    Verifies every author is returned exactly once and in id order.
+    """
+    create_url = fastapi_app.url_path_for("create_author")
+    created_ids = []
+    for i in range(5):
+        payload = {"name": f"Paged{i}", "surname": "Author", "birth_date": "1970-01-01"}
+        response = await client.post(create_url, json=payload)
+        created_ids.append(response.json()["data"]["id"])
+
+    list_url = fastapi_app.url_path_for("list_authors")
+    seen_ids = []
+    params = {"limit": 2}
+    while True:
+        response = await client.get(list_url, params=params)
+        assert response.status_code == status.HTTP_200_OK
+        page = response.json()
+        assert len(page["data"]) <= 2
+        seen_ids.extend(author["id"] for author in page["data"])
+        if page["next_cursor"] is None:
+            break
+        params = {"limit": 2, "cursor": page["next_cursor"]}
+
+    assert seen_ids == sorted(set(seen_ids))
+    assert set(created_ids) <= set(seen_ids)
+
+@pytest.mark.anyio
+async def test_last_page_has_no_cursor(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests single page listing returns null next_cursor.
+    """
+    url = fastapi_app.url_path_for("list_authors")
+    response = await client.get(url, params={"limit": settings.pagination_max_limit})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["next_cursor"] is None
+
+@pytest.mark.anyio
+async def test_malformed_cursor(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests listing with malformed cursor returns 400.
+    """
+    for name in ("list_authors", "list_books", "list_borrows"):
+        url = fastapi_app.url_path_for(name)
+        response = await client.get(url, params={"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+@pytest.mark.anyio
+async def test_page_size_limit(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests page size above server-side maximum is rejected.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    response = await client.get(url, params={"limit": settings.pagination_max_limit + 1})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,50 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette import status
+
+from robust_library_api.db.database import Database
+from robust_library_api.db.repositories.book import BookRepository
+from robust_library_api.settings import settings
+
+
+@pytest.mark.anyio
+async def test_warm_up_opens_pool_connections(_engine: AsyncEngine) -> None:
+    """
+    Tests warm-up opens pool size connections and runs hot queries on each of them.
+    """
+    database = Database(url=str(settings.db_url), pool_size=3)
+    try:
+        assert database.pool_stats()["checked_in"] == 0
+        statements = BookRepository(database).hot_queries()
+        executed = []
+
+        def on_execute(conn, cursor, statement, *args) -> None:
+            executed.append(statement)
+
+        event.listen(database._async_engine.sync_engine, "before_cursor_execute", on_execute)
+        await database.warm_up(statements)
+
+        stats = database.pool_stats()
+        assert stats["size"] == 3
+        assert stats["checked_in"] == 3 and stats["checked_out"] == 0
+        assert stats["checkouts"] == 3 and stats["checkout_timeouts"] == 0
+        assert len(executed) == 3 * len(statements)
+    finally:
+        await database.dispose()
+
+
+@pytest.mark.anyio
+async def test_pool_stats(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests pool occupancy and checkout counters are reported.
+    """
+    await client.get(fastapi_app.url_path_for("count_books"))
+    response = await client.get(fastapi_app.url_path_for("pool_stats"))
+    assert response.status_code == status.HTTP_200_OK
+    stats = response.json()
+    assert stats["checkouts"] > 0
+    assert stats["checked_out"] == 0
+    assert stats["checkout_wait_max_seconds"] >= 0
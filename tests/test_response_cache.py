@@ -0,0 +1,98 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+from starlette.requests import Request
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+from robust_library_api.web.api.schema import StandardSuccessResponse
+from robust_library_api.web.api.utils import cached_json_response, response_cache
+
+
+@pytest.mark.anyio
+async def test_list_books_served_from_cache(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests repeated listing is served from cache with the same body.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    first = await client.get(url, params={"limit": 3})
+    hits = response_cache.hits
+    second = await client.get(url, params={"limit": 3})
+    assert second.status_code == status.HTTP_200_OK
+    assert response_cache.hits == hits + 1
+    assert second.content == first.content
+    assert second.headers["content-type"] == "application/json"
+
+    other = await client.get(url, params={"limit": 2})
+    assert response_cache.hits == hits + 1
+    assert len(other.json()["data"]) == 2
+
+@pytest.mark.anyio
+async def test_list_authors_cache_invalidated_by_write(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests cached listing is rebuilt after authors table is written.
+    """
+    url = fastapi_app.url_path_for("list_authors")
+    params = {"limit": 500}
+    before = (await client.get(url, params=params)).json()["data"]
+
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Fresh", "surname": "Author", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    after = (await client.get(url, params=params)).json()["data"]
+    assert len(after) == len(before) + 1
+    assert after[-1]["id"] == author_id
+
+@pytest.mark.anyio
+async def test_list_errors_are_not_cached(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests failed listing is not cached.
+    """
+    url = fastapi_app.url_path_for("list_books")
+    stats_url = fastapi_app.url_path_for("cache_stats")
+    size = (await client.get(stats_url)).json()["responses"]["size"]
+    for _ in range(2):
+        response = await client.get(url, params={"cursor": "not-a-cursor"})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert (await client.get(stats_url)).json()["responses"]["size"] == size
+
+
+@pytest.mark.anyio
+async def test_list_read_from_replica_is_not_cached(
+    client: AsyncClient, fastapi_app: FastAPI, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests listing built from reads of a replica is served but not cached.
+    """
+    database = init_container().resolve(Database)
+    # The primary stands in for a replica.
+    monkeypatch.setattr(database, "_replica_sessions", [database._readonly_session])
+    url = fastapi_app.url_path_for("list_books")
+    hits = response_cache.hits
+    for _ in range(2):
+        response = await client.get(url, params={"limit": 4})
+        assert response.status_code == status.HTTP_200_OK
+    assert response_cache.hits == hits
+
+
+@pytest.mark.anyio
+async def test_response_invalidated_while_built_is_not_cached() -> None:
+    """
+    Tests response built while the cache was invalidated is not cached.
+    """
+    request = Request({
+        "type": "http", "method": "GET", "path": "/built-while-invalidated",
+        "query_string": b"", "headers": [],
+    })
+    builds = []
+
+    async def build_response() -> StandardSuccessResponse:
+        builds.append(True)
+        response_cache.clear()
+        return StandardSuccessResponse(message="Built.")
+
+    for _ in range(2):
+        await cached_json_response(request, ("book",), build_response)
+    assert len(builds) == 2
@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event
+from starlette import status
+
+from robust_library_api.db.models.book import BookModel
+
+
+@contextmanager
+def loaded_books() -> Iterator[List[BookModel]]:
+    """
+    Records book entities hydrated by ORM while the block runs.
+    """
+    loaded: List[BookModel] = []
+
+    def on_load(target: BookModel, context) -> None:
+        loaded.append(target)
+
+    event.listen(BookModel, "load", on_load)
+    try:
+        yield loaded
+    finally:
+        event.remove(BookModel, "load", on_load)
+
+
+@pytest.mark.anyio
+async def test_reads_return_rows_without_entities(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests list, stream and detail endpoints read plain rows,
+    entities are hydrated only to embed included relationships.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Row", "surname": "Reader", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    payload = {"title": "Rows", "description": "", "author_id": author_id, "remaining_amount": 1}
+    book = (await client.post(book_url, json=payload)).json()["data"]
+    book = {**book, "isbn": None}
+
+    list_url = fastapi_app.url_path_for("list_books")
+    detail_url = fastapi_app.url_path_for("get_book_info", id=book["id"])
+    with loaded_books() as loaded:
+        response = await client.get(list_url, params={"author_id": author_id})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["data"] == [book]
+        response = await client.get(list_url, params={"author_id": author_id, "stream": "ndjson"})
+        assert response.json() == book
+        response = await client.get(detail_url)
+        assert response.json()["data"] == book
+        assert response.headers["ETag"]
+    assert loaded == []
+
+    with loaded_books() as loaded:
+        response = await client.get(list_url, params={"author_id": author_id, "include": "author"})
+        assert response.json()["data"][0]["author"]["id"] == author_id
+    assert len(loaded) == 1
@@ -0,0 +1,56 @@
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+
+@pytest.mark.anyio
+async def test_search_books_ranked(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests books matching the query are found, title matches first.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Search", "surname": "Writer", "birth_date": "1970-01-01"}
+    author_id = (await client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    books = [
+        ("Cooking basics", "Recipes with marmalade for beginners."),
+        ("Marmalade wars", "A novel."),
+        ("Unrelated", "Nothing to see here."),
+    ]
+    book_ids = []
+    for title, description in books:
+        payload = {"title": title, "description": description, "author_id": author_id, "remaining_amount": 1}
+        response = await client.post(book_url, json=payload)
+        assert "search_vector" not in response.json()["data"]
+        book_ids.append(response.json()["data"]["id"])
+
+    url = fastapi_app.url_path_for("search_books")
+    response = await client.get(url, params={"q": "marmalades"})
+    assert response.status_code == status.HTTP_200_OK
+    assert [book["id"] for book in response.json()["data"]] == [book_ids[1], book_ids[0]]
+    assert set(response.json()["data"][0]) == {
+        "id", "title", "description", "author_id", "remaining_amount", "isbn", "version",
+    }
+
+    response = await client.get(url, params={"q": "marmalade", "limit": 1, "fields": "title"})
+    page = response.json()
+    assert page["data"] == [{"id": book_ids[1], "version": 1, "title": "Marmalade wars"}]
+    response = await client.get(url, params={"q": "marmalade", "limit": 1, "cursor": page["next_cursor"]})
+    page = response.json()
+    assert [book["id"] for book in page["data"]] == [book_ids[0]]
+    assert page["next_cursor"] is None
+
+    update_url = fastapi_app.url_path_for("update_book", id=book_ids[2])
+    await client.put(update_url, json={"description": "Marmalade, after all."})
+    response = await client.get(url, params={"q": "marmalade -wars"})
+    assert {book["id"] for book in response.json()["data"]} == {book_ids[0], book_ids[2]}
+
+@pytest.mark.anyio
+async def test_search_books_empty_query(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests search requires query.
+    """
+    url = fastapi_app.url_path_for("search_books")
+    response = await client.get(url, params={"q": ""})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,34 @@
+from datetime import date
+
+import orjson
+
+from robust_library_api.db.models import load_all_models
+from robust_library_api.db.models.book import BookModel
+from robust_library_api.web.api.books.schema import ResponseBook, ResponseBookList
+from robust_library_api.web.api.borrows.schema import ResponseBorrow
+from robust_library_api.web.api.utils import encode_response
+
+
+def test_entities_encoded_with_loaded_fields_only() -> None:
+    """
+    Tests entities are encoded only with loaded columns, without
+    relationships which were not loaded, and rows stay sparse.
+    """
+    load_all_models()
+    book = BookModel(
+        id=1, title="Typed", description="", author_id=2, remaining_amount=3, isbn=None, version=1
+    )
+    content = orjson.loads(encode_response(ResponseBook(message="", data=book)))
+    assert content["status"] == "success"
+    assert content["data"] == {
+        "id": 1, "title": "Typed", "description": "", "author_id": 2,
+        "remaining_amount": 3, "isbn": None, "version": 1,
+    }
+
+    content = orjson.loads(encode_response(ResponseBookList(message="", data=[{"id": 1, "version": 1}])))
+    assert content["data"] == [{"id": 1, "version": 1}]
+    assert content["next_cursor"] is None
+
+    borrow = {"id": 1, "book_id": 1, "reader_name": "typed", "date_of_issue": date(2024, 1, 2)}
+    content = orjson.loads(encode_response(ResponseBorrow(message="", data=borrow)))
+    assert content["data"] == {**borrow, "date_of_issue": "2024-01-02"}
@@ -0,0 +1,165 @@
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import asyncpg
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event
+from starlette import status
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+
+
+@contextmanager
+def recorded_statements() -> Iterator[List[str]]:
+    """
+    Records statements sent to the database within the block.
+
+    :yield: list of executed statements.
+    """
+    engine = init_container().resolve(Database)._async_engine.sync_engine
+    statements: List[str] = []
+
+    def on_execute(conn, cursor, statement, *args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", on_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", on_execute)
+
+
+@contextmanager
+def recorded_transaction_commands(monkeypatch: pytest.MonkeyPatch) -> Iterator[List[str]]:
+    """
+    Records BEGIN, COMMIT and ROLLBACK sent by the driver within the block,
+    they are not reported as cursor executions.
+
+    :yield: list of executed transaction commands.
+    """
+    commands: List[str] = []
+    execute = asyncpg.Connection.execute
+
+    async def recording_execute(connection, query: str, *args, **kwargs):
+        commands.append(query)
+        return await execute(connection, query, *args, **kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(asyncpg.Connection, "execute", recording_execute)
+        yield commands
+
+
+@pytest.mark.anyio
+async def test_reads_skip_transaction(
+    uow_client: AsyncClient, fastapi_app: FastAPI, monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Tests GET requests take a round trip per SELECT, without BEGIN and COMMIT,
+    while writes are still committed, also after reads of the same request.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Read", "surname": "Only", "birth_date": "1970-01-01"}
+    # First connection of the engine is initialized in its own transaction
+    await uow_client.post(author_url, json=author_payload)
+    with recorded_transaction_commands(monkeypatch) as commands:
+        response = await uow_client.post(author_url, json=author_payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [command.split()[0].rstrip(";") for command in commands] == ["BEGIN", "COMMIT"]
+    author_id = response.json()["data"]["id"]
+
+    # Authors are read without transaction, books are written within one
+    book_payload = {"title": "Read First", "description": "", "author_id": author_id, "remaining_amount": 1}
+    with recorded_transaction_commands(monkeypatch) as commands:
+        response = await uow_client.post(fastapi_app.url_path_for("create_books_bulk"), json=[book_payload])
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [command.split()[0].rstrip(";") for command in commands] == ["BEGIN", "COMMIT"]
+
+    for url in (
+        fastapi_app.url_path_for("count_authors"),
+        fastapi_app.url_path_for("list_borrows"),
+    ):
+        with recorded_statements() as statements, recorded_transaction_commands(monkeypatch) as commands:
+            response = await uow_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        assert len(statements) == 1
+        assert commands == []
+
+
+@pytest.mark.anyio
+async def test_writes_issue_single_statement(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests successful writes are sent to the database as one statement each.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Single", "surname": "Statement", "birth_date": "1970-01-01"}
+    author_id = (await uow_client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    book_payload = {"title": "Counted", "description": "", "author_id": author_id, "remaining_amount": 2}
+    with recorded_statements() as statements:
+        response = await uow_client.post(fastapi_app.url_path_for("create_book"), json=book_payload)
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(statements) == 1
+    book_id = response.json()["data"]["id"]
+
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("update_book", id=book_id)
+        response = await uow_client.put(url, json={"author_id": author_id, "remaining_amount": 3})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("update_author", id=author_id)
+        response = await uow_client.put(url, json={"surname": "Statements"})
+    assert response.status_code == status.HTTP_200_OK
+    assert len(statements) == 1
+
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("create_borrow")
+        response = await uow_client.post(url, json={"book_id": book_id, "reader_name": "counter"})
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(statements) == 1
+    borrow_id = response.json()["data"]["id"]
+
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("return_borrow", id=borrow_id)
+        response = await uow_client.patch(url)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert len(statements) == 1
+
+    other_book_payload = {**book_payload, "title": "Deleted"}
+    other_book_id = (
+        await uow_client.post(fastapi_app.url_path_for("create_book"), json=other_book_payload)
+    ).json()["data"]["id"]
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("delete_book", id=other_book_id)
+        response = await uow_client.delete(url)
+    assert response.status_code == status.HTTP_204_NO_CONTENT
+    assert len(statements) == 1
+
+@pytest.mark.anyio
+async def test_missing_author_is_reported_from_foreign_key(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests book writes referencing missing author are rejected after single statement.
+    """
+    book_payload = {"title": "Orphan", "description": "", "author_id": 99999, "remaining_amount": 1}
+    with recorded_statements() as statements:
+        response = await uow_client.post(fastapi_app.url_path_for("create_book"), json=book_payload)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+    assert len(statements) == 1
+
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Orphan", "surname": "Parent", "birth_date": "1970-01-01"}
+    author_id = (await uow_client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_payload["author_id"] = author_id
+    book_id = (
+        await uow_client.post(fastapi_app.url_path_for("create_book"), json=book_payload)
+    ).json()["data"]["id"]
+
+    with recorded_statements() as statements:
+        url = fastapi_app.url_path_for("update_book", id=book_id)
+        response = await uow_client.put(url, json={"author_id": 99999})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert len(statements) == 1
@@ -0,0 +1,68 @@
+import json
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from starlette import status
+
+from robust_library_api.settings import settings
+
+
+async def _all_pages(client: AsyncClient, url: str) -> list:
+    rows = []
+    params = {"limit": settings.pagination_max_limit}
+    while True:
+        page = (await client.get(url, params=params)).json()
+        rows.extend(page["data"])
+        if page["next_cursor"] is None:
+            return rows
+        params = {**params, "cursor": page["next_cursor"]}
+
+
+@pytest.mark.anyio
+async def test_stream_json_array(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests streamed JSON array contains the same rows as paginated listing.
+    """
+    for name in ("list_authors", "list_books", "list_borrows"):
+        url = fastapi_app.url_path_for(name)
+        response = await client.get(url, params={"stream": "json"})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("application/json")
+        assert response.json() == await _all_pages(client, url)
+
+@pytest.mark.anyio
+async def test_stream_ndjson(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests streamed NDJSON contains one row per line.
+    """
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"stream": "ndjson"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert rows
+    assert rows == await _all_pages(client, url)
+
+@pytest.mark.anyio
+async def test_stream_after_cursor(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests stream starts right after provided cursor.
+    """
+    url = fastapi_app.url_path_for("list_borrows")
+    page = (await client.get(url, params={"limit": 1})).json()
+    response = await client.get(url, params={"stream": "json", "cursor": page["next_cursor"]})
+    streamed_ids = [borrow["id"] for borrow in response.json()]
+    assert streamed_ids
+    assert min(streamed_ids) > page["data"][0]["id"]
+
+@pytest.mark.anyio
+async def test_stream_invalid_parameters(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests streaming with malformed cursor or unknown format is rejected.
+    """
+    url = fastapi_app.url_path_for("list_borrows")
+    response = await client.get(url, params={"stream": "json", "cursor": "not-a-cursor"})
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    response = await client.get(url, params={"stream": "csv"})
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -0,0 +1,88 @@
+from datetime import date
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine
+from starlette import status
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.database import Database
+from robust_library_api.services.author.service import AuthorService
+from robust_library_api.services.author.suggest import AuthorPrefixIndex
+
+
+def test_prefix_index() -> None:
+    """
+    Tests suggestions by name, surname and full name prefixes.
+    """
+    index = AuthorPrefixIndex()
+    index.rebuild([
+        {"id": 1, "name": "Émile", "surname": "Zola"},
+        {"id": 2, "name": "Leo", "surname": "Tolstoy"},
+    ])
+    index.add({"id": 3, "name": "Zadie", "surname": "Smith"})
+
+    assert [author["id"] for author in index.suggest("z", 10)] == [3, 1]
+    assert [author["id"] for author in index.suggest("ÉMILE Z", 10)] == [1]
+    assert index.suggest("z", 1) == [{"id": 3, "name": "Zadie", "surname": "Smith"}]
+    assert index.suggest(" ", 10) == []
+
+    index.add({"id": 3, "name": "Zadie", "surname": "Adams"})
+    assert [author["id"] for author in index.suggest("smi", 10)] == []
+    index.remove(1)
+    assert [author["id"] for author in index.suggest("z", 10)] == [3]
+    assert len(index) == 2
+
+@pytest.mark.anyio
+async def test_suggest_authors(client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests suggestions follow created, updated and deleted authors.
+    """
+    service = init_container().resolve(AuthorService)
+    create_url = fastapi_app.url_path_for("create_author")
+    payload = {"name": "Typeahead", "surname": "Quixotic", "birth_date": "1970-01-01"}
+    author_id = (await client.post(create_url, json=payload)).json()["data"]["id"]
+    await service.build_name_index()
+
+    url = fastapi_app.url_path_for("suggest_authors")
+    response = await client.get(url, params={"prefix": "quix"})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.json()["data"] == [{"id": author_id, "name": "Typeahead", "surname": "Quixotic"}]
+
+    payload = {"name": "Typeahead", "surname": "Quill", "birth_date": "1970-01-01"}
+    other_id = (await client.post(create_url, json=payload)).json()["data"]["id"]
+    response = await client.get(url, params={"prefix": "typeahead q"})
+    assert [author["id"] for author in response.json()["data"]] == [other_id, author_id]
+
+    update_url = fastapi_app.url_path_for("update_author", id=author_id)
+    await client.put(update_url, json={"surname": "Rational"})
+    response = await client.get(url, params={"prefix": "quix"})
+    assert response.json()["data"] == []
+
+    delete_url = fastapi_app.url_path_for("delete_author", id=other_id)
+    await client.delete(delete_url)
+    response = await client.get(url, params={"prefix": "typeahead"})
+    assert [author["id"] for author in response.json()["data"]] == [author_id]
+
+
+@pytest.mark.anyio
+async def test_name_index_follows_commits(_engine: AsyncEngine) -> None:
+    """
+    Tests authors are indexed once unit of work commits, not on rollback.
+    """
+    database = init_container().resolve(Database)
+    service = init_container().resolve(AuthorService)
+    payload = {"name": "Uncommitted", "surname": "Zyzzyva", "birth_date": date(1970, 1, 1)}
+
+    with pytest.raises(RuntimeError):
+        async with database.unit_of_work():
+            await service.author_creation(**payload)
+            raise RuntimeError
+    assert service.author_suggestions(prefix="zyzzyva", limit=10).data == []
+
+    async with database.unit_of_work():
+        author_id = (await service.author_creation(**payload)).data.id
+        assert service.author_suggestions(prefix="zyzzyva", limit=10).data == []
+    suggestions = service.author_suggestions(prefix="zyzzyva", limit=10).data
+    assert [author.id for author in suggestions] == [author_id]
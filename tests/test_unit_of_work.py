@@ -0,0 +1,124 @@
+from collections import Counter
+
+import pytest
+from fastapi import FastAPI
+from httpx import AsyncClient
+from sqlalchemy import event
+from starlette import status
+
+from robust_library_api.container.container import init_container
+from robust_library_api.db.dao.cache import MISSING, entity_cache_for
+from robust_library_api.db.database import Database
+from robust_library_api.db.models.book import BookModel
+
+
+@pytest.mark.anyio
+async def test_borrow_creation_commits_once(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests borrow creation request checks out one connection and commits once.
+    """
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Unit", "surname": "OfWork", "birth_date": "1970-01-01"}
+    author_id = (await uow_client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "UoW", "description": "", "author_id": author_id, "remaining_amount": 2}
+    book_id = (await uow_client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    engine = init_container().resolve(Database)._async_engine.sync_engine
+    calls: Counter = Counter()
+
+    def on_checkout(*args) -> None:
+        calls["checkout"] += 1
+
+    def on_commit(*args) -> None:
+        calls["commit"] += 1
+
+    event.listen(engine, "checkout", on_checkout)
+    event.listen(engine, "commit", on_commit)
+    try:
+        url = fastapi_app.url_path_for("create_borrow")
+        response = await uow_client.post(url, json={"book_id": book_id, "reader_name": "uow"})
+    finally:
+        event.remove(engine, "checkout", on_checkout)
+        event.remove(engine, "commit", on_commit)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert calls == {"checkout": 1, "commit": 1}
+
+@pytest.mark.anyio
+async def test_nested_unit_of_work_rolls_back(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests request joins outer unit of work and its changes are rolled back with it.
+    """
+    database = init_container().resolve(Database)
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Rolled", "surname": "Back", "birth_date": "1970-01-01"}
+
+    with pytest.raises(RuntimeError):
+        async with database.unit_of_work():
+            response = await uow_client.post(author_url, json=author_payload)
+            author_id = response.json()["data"]["id"]
+            raise RuntimeError
+
+    get_url = fastapi_app.url_path_for("get_author_info", id=author_id)
+    response = await uow_client.get(get_url)
+    assert response.status_code == status.HTTP_404_NOT_FOUND
+
+
+@pytest.mark.anyio
+async def test_read_before_write_checks_out_once(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests request reading before its first write checks out one connection,
+    its reads run on the connection of the unit of work.
+    """
+    database = init_container().resolve(Database)
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Read", "surname": "ThenWrite", "birth_date": "1970-01-01"}
+    author_id = (await uow_client.post(author_url, json=author_payload)).json()["data"]["id"]
+
+    checkouts = database.pool_stats()["checkouts"]
+    url = fastapi_app.url_path_for("create_books_bulk")
+    books = [
+        {"title": "Read", "description": "", "author_id": author_id, "remaining_amount": 1},
+        {"title": "Missing", "description": "", "author_id": 0, "remaining_amount": 1},
+    ]
+    response = await uow_client.post(url, json=books)
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert len(response.json()["errors"]) == 1
+    assert database.pool_stats()["checkouts"] == checkouts + 1
+
+@pytest.mark.anyio
+async def test_reads_after_write_see_uncommitted_state(uow_client: AsyncClient, fastapi_app: FastAPI) -> None:
+    """
+    Tests requests of unit of work reading after its write get uncommitted
+    rows instead of cached ones, and uncommitted rows are never cached.
+    """
+    database = init_container().resolve(Database)
+    cache = entity_cache_for(BookModel)
+    author_url = fastapi_app.url_path_for("create_author")
+    author_payload = {"name": "Uncommitted", "surname": "Reader", "birth_date": "1970-01-01"}
+    author_id = (await uow_client.post(author_url, json=author_payload)).json()["data"]["id"]
+    book_url = fastapi_app.url_path_for("create_book")
+    book_payload = {"title": "Committed", "description": "", "author_id": author_id, "remaining_amount": 1}
+    book_id = (await uow_client.post(book_url, json=book_payload)).json()["data"]["id"]
+
+    get_url = fastapi_app.url_path_for("get_book_info", id=book_id)
+    update_url = fastapi_app.url_path_for("update_book", id=book_id)
+    await uow_client.get(get_url)
+    with pytest.raises(RuntimeError):
+        async with database.unit_of_work():
+            hits = cache.hits
+            assert (await uow_client.get(get_url)).json()["data"]["title"] == "Committed"
+            assert cache.hits == hits + 1
+
+            response = await uow_client.put(update_url, json={"title": "Uncommitted"})
+            assert response.status_code == status.HTTP_200_OK
+            hits = cache.hits
+            assert (await uow_client.get(get_url)).json()["data"]["title"] == "Uncommitted"
+            assert cache.hits == hits
+            assert cache.get(book_id) is MISSING
+            raise RuntimeError
+
+    assert cache.get(book_id) is MISSING
+    assert (await uow_client.get(get_url)).json()["data"]["title"] == "Committed"